@@ -0,0 +1,59 @@
+"""
+Static index of the lazily loaded 'config' subcommands.
+
+Generated by 'python -m utilities_common.cli_index config' from MODULES:
+edit MODULES and regenerate rather than editing COMMANDS and PLUGINS.
+"""
+
+ROOT = 'config.main:config'
+
+# Submodules whose top-level commands, or 'submodule:attribute' commands,
+# are added to ROOT
+MODULES = [
+    'aaa',
+    'chassis_modules',
+    'console',
+    'feature',
+    'flow_counters',
+    'kdump',
+    'kube',
+    'mclag',
+    'mclag:mclag_member',
+    'mclag:mclag_unique_ip',
+    'muxcable',
+    'nat',
+    'syslog',
+    'vlan',
+    'vxlan',
+]
+
+# Command name -> 'module:attribute'
+COMMANDS = {
+    'aaa': 'config.aaa:aaa',
+    'chassis': 'config.chassis_modules:chassis',
+    'console': 'config.console:console',
+    'feature': 'config.feature:feature',
+    'flowcnt-route': 'config.flow_counters:flowcnt_route',
+    'kdump': 'config.kdump:kdump',
+    'kubernetes': 'config.kube:kubernetes',
+    'mclag': 'config.mclag:mclag',
+    'member': 'config.mclag:mclag_member',
+    'muxcable': 'config.muxcable:muxcable',
+    'nat': 'config.nat:nat',
+    'radius': 'config.aaa:radius',
+    'syslog': 'config.syslog:syslog',
+    'tacacs': 'config.aaa:tacacs',
+    'unique-ip': 'config.mclag:mclag_unique_ip',
+    'vlan': 'config.vlan:vlan',
+    'vxlan': 'config.vxlan:vxlan',
+}
+
+# Plugin module -> names of the top-level commands it provides or extends
+PLUGINS = {
+    'config.plugins.auto_techsupport': ['auto-techsupport', 'auto-techsupport-feature'],
+    'config.plugins.barefoot': ['platform'],
+    'config.plugins.mlnx': ['platform'],
+    'config.plugins.nvgre_tunnel': ['nvgre-tunnel', 'nvgre-tunnel-map'],
+    'config.plugins.pbh': ['pbh'],
+    'config.plugins.sonic-passwh_yang': ['passw-hardening'],
+}
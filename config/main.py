@@ -4,6 +4,7 @@ import click
 import ipaddress
 import json
 import jsonpatch
+import lazy_object_proxy
 import netaddr
 import netifaces
 import os
@@ -38,21 +39,9 @@ import utilities_common.multi_asic as multi_asic_util
 
 from .utils import log
 
-from . import aaa
-from . import chassis_modules
-from . import console
-from . import feature
-from . import flow_counters
-from . import kdump
-from . import kube
-from . import muxcable
-from . import nat
-from . import vlan
-from . import vxlan
+from . import commands_index
 from . import plugins
 from .config_mgmt import ConfigMgmtDPB, ConfigMgmt
-from . import mclag
-from . import syslog
 
 # mock masic APIs for unit test
 try:
@@ -110,7 +99,8 @@ GRE_TYPE_RANGE = click.IntRange(min=0, max=65535)
 ADHOC_VALIDATION = True
 
 # Load sonic-cfggen from source since /usr/local/bin/sonic-cfggen does not have .py extension.
-sonic_cfggen = load_module_from_source('sonic_cfggen', '/usr/local/bin/sonic-cfggen')
+# It is loaded on first use, most commands do not need it.
+sonic_cfggen = lazy_object_proxy.Proxy(lambda: load_module_from_source('sonic_cfggen', '/usr/local/bin/sonic-cfggen'))
 
 #
 # Helper functions
@@ -1143,7 +1133,7 @@ def validate_gre_type(ctx, _, value):
         raise click.UsageError("{} is not a valid GRE type".format(value))
 
 # This is our main entrypoint - the main 'config' command
-@click.group(cls=clicommon.AbbreviationGroup, context_settings=CONTEXT_SETTINGS)
+@click.group(cls=clicommon.LazyAbbreviationGroup, context_settings=CONTEXT_SETTINGS)
 @click.pass_context
 def config(ctx):
     """SONiC command line - 'config' command"""
@@ -1175,28 +1165,8 @@ def config(ctx):
     ctx.obj = Db()
 
 
-# Add groups from other modules
-config.add_command(aaa.aaa)
-config.add_command(aaa.tacacs)
-config.add_command(aaa.radius)
-config.add_command(chassis_modules.chassis)
-config.add_command(console.console)
-config.add_command(feature.feature)
-config.add_command(flow_counters.flowcnt_route)
-config.add_command(kdump.kdump)
-config.add_command(kube.kubernetes)
-config.add_command(muxcable.muxcable)
-config.add_command(nat.nat)
-config.add_command(vlan.vlan)
-config.add_command(vxlan.vxlan)
-
-#add mclag commands
-config.add_command(mclag.mclag)
-config.add_command(mclag.mclag_member)
-config.add_command(mclag.mclag_unique_ip)
-
-# syslog module
-config.add_command(syslog.syslog)
+# Add groups from other modules, their module is imported on first use
+config.add_lazy_commands(commands_index.COMMANDS)
 
 @config.command()
 @click.option('-y', '--yes', is_flag=True, callback=_abort_if_false,
@@ -6913,7 +6883,7 @@ def smoothing_interval(interval, rates_type):
 
 # Load plugins and register them
 helper = util_base.UtilHelper()
-helper.load_and_register_plugins(plugins, config)
+helper.load_and_register_plugins_lazily(plugins, config, commands_index.PLUGINS)
 
 #
 # 'subinterface' group ('config subinterface ...')
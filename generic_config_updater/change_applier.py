@@ -3,10 +3,9 @@ import json
 import jsondiff
 import importlib
 import os
-import tempfile
 from collections import defaultdict
 from swsscommon.swsscommon import ConfigDBConnector
-from .gu_common import genericUpdaterLogging
+from .gu_common import genericUpdaterLogging, ConfigDbSnapshot
 
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 UPDATER_CONF_FILE = f"{SCRIPT_DIR}/gcu_services_validator.conf.json"
@@ -73,8 +72,9 @@ class ChangeApplier:
 
     updater_conf = None
 
-    def __init__(self):
+    def __init__(self, config_db_snapshot=None):
         self.config_db = get_config_db()
+        self.config_db_snapshot = config_db_snapshot if config_db_snapshot is not None else ConfigDbSnapshot()
         self.backend_tables = [
             "BUFFER_PG",
             "BUFFER_PROFILE",
@@ -130,6 +130,7 @@ class ChangeApplier:
 
             if run_data != upd_data:
                 set_config(self.config_db, tbl, key, upd_data)
+                self.config_db_snapshot.invalidate()
                 upd_keys[tbl][key] = {}
                 log_debug("Patch affected tbl={} key={}".format(tbl, key))
 
@@ -167,11 +168,5 @@ class ChangeApplier:
 
 
     def _get_running_config(self):
-        (_, fname) = tempfile.mkstemp(suffix="_changeApplier")
-        os.system("sonic-cfggen -d --print-data > {}".format(fname))
-        run_data = {}
-        with open(fname, "r") as s:
-            run_data = json.load(s)
-        if os.path.isfile(fname):
-            os.remove(fname)
-        return run_data
+        # Reuses the snapshot read before this change, unless ConfigDB was written since
+        return self.config_db_snapshot.get_config_db_as_json()
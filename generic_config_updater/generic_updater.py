@@ -2,7 +2,7 @@ import json
 import os
 from enum import Enum
 from .gu_common import GenericConfigUpdaterError, EmptyTableError, ConfigWrapper, \
-                       DryRunConfigWrapper, PatchWrapper, genericUpdaterLogging
+                       DryRunConfigWrapper, PatchWrapper, ConfigDbSnapshot, genericUpdaterLogging
 from .patch_sorter import StrictPatchSorter, NonStrictPatchSorter, ConfigSplitter, \
                           TablesWithoutYangConfigSplitter, IgnorePathsFromYangConfigSplitter
 from .change_applier import ChangeApplier, DryRunChangeApplier
@@ -32,9 +32,9 @@ class PatchApplier:
                  patch_wrapper=None):
         self.logger = genericUpdaterLogging.get_logger(title="Patch Applier", print_all_to_console=True)
         self.config_wrapper = config_wrapper if config_wrapper is not None else ConfigWrapper()
-        self.patch_wrapper = patch_wrapper if patch_wrapper is not None else PatchWrapper()
+        self.patch_wrapper = patch_wrapper if patch_wrapper is not None else PatchWrapper(self.config_wrapper)
         self.patchsorter = patchsorter if patchsorter is not None else StrictPatchSorter(self.config_wrapper, self.patch_wrapper)
-        self.changeapplier = changeapplier if changeapplier is not None else ChangeApplier()
+        self.changeapplier = changeapplier if changeapplier is not None else ChangeApplier(self.config_wrapper.config_db_snapshot)
 
     def apply(self, patch, sort=True):
         self.logger.log_notice("Patch application starting.")
@@ -97,9 +97,9 @@ class PatchApplier:
 class ConfigReplacer:
     def __init__(self, patch_applier=None, config_wrapper=None, patch_wrapper=None):
         self.logger = genericUpdaterLogging.get_logger(title="Config Replacer", print_all_to_console=True)
-        self.patch_applier = patch_applier if patch_applier is not None else PatchApplier()
         self.config_wrapper = config_wrapper if config_wrapper is not None else ConfigWrapper()
-        self.patch_wrapper = patch_wrapper if patch_wrapper is not None else PatchWrapper()
+        self.patch_applier = patch_applier if patch_applier is not None else PatchApplier(config_wrapper=self.config_wrapper)
+        self.patch_wrapper = patch_wrapper if patch_wrapper is not None else PatchWrapper(self.config_wrapper)
 
     def replace(self, target_config):
         self.logger.log_notice("Config replacement starting.")
@@ -129,8 +129,8 @@ class FileSystemConfigRollbacker:
                  config_wrapper=None):
         self.logger = genericUpdaterLogging.get_logger(title="Config Rollbacker", print_all_to_console=True)
         self.checkpoints_dir = checkpoints_dir
-        self.config_replacer = config_replacer if config_replacer is not None else ConfigReplacer()
         self.config_wrapper = config_wrapper if config_wrapper is not None else ConfigWrapper()
+        self.config_replacer = config_replacer if config_replacer is not None else ConfigReplacer(config_wrapper=self.config_wrapper)
 
     def rollback(self, checkpoint_name):
         self.logger.log_notice("Config rollbacking starting.")
@@ -385,13 +385,14 @@ class GenericUpdateFactory:
         if dry_run:
             return DryRunConfigWrapper()
         else:
-            return ConfigWrapper()
+            # One snapshot per operation, shared with its ChangeApplier
+            return ConfigWrapper(config_db_snapshot=ConfigDbSnapshot())
 
     def get_change_applier(self, dry_run, config_wrapper):
         if dry_run:
             return DryRunChangeApplier(config_wrapper)
         else:
-            return ChangeApplier()
+            return ChangeApplier(config_wrapper.config_db_snapshot)
 
     def get_patch_sorter(self, ignore_non_yang_tables, ignore_paths, config_wrapper, patch_wrapper):
         if not ignore_non_yang_tables and not ignore_paths:
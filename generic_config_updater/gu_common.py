@@ -4,12 +4,13 @@ import importlib
 from jsonpointer import JsonPointer
 import sonic_yang
 import sonic_yang_ext
-import subprocess
 import yang as ly
 import copy
 import re
 import os
+from collections import OrderedDict
 from sonic_py_common import logger
+from swsscommon.swsscommon import ConfigDBPipeConnector
 from enum import Enum
 
 YANG_DIR = "/usr/local/yang-models"
@@ -51,26 +52,64 @@ class JsonChange:
             return self.patch == other.patch
         return False
 
+class ConfigDbSnapshot:
+    """
+    Reads the whole ConfigDB in-process with a pipelined dump, in the same format as
+    'sonic-cfggen -d --print-data'.
+    The last read is kept until invalidate() is called, so the many reads done while
+    applying a single patch only hit redis again after ConfigDB was written.
+    """
+    def __init__(self):
+        self.config_db = None
+        self.config = None
+
+    def get_config_db_as_json(self):
+        if self.config is None:
+            self.config = self._read_config_db()
+        return copy.deepcopy(self.config)
+
+    def invalidate(self):
+        self.config = None
+
+    def _read_config_db(self):
+        try:
+            if self.config_db is None:
+                self.config_db = ConfigDBPipeConnector()
+                self.config_db.connect()
+            config = self.config_db.get_config()
+        except Exception as ex:
+            self.config_db = None
+            raise GenericConfigUpdaterError(f"Failed to get running config, Error: {ex}")
+
+        config_db_json = {}
+        for table, entries in config.items():
+            config_db_json[table] = {self.config_db.serialize_key(key): data for key, data in entries.items()}
+        return config_db_json
+
+# Loaded models per (yang_dir, print_log_enabled), shared by every ConfigWrapper in the process
+_sonic_yang_with_loaded_models_cache = {}
+
+def get_sonic_yang_with_loaded_models(yang_dir, print_log_enabled=False):
+    """
+    Return the SonicYang instance with the models of yang_dir loaded, parsing them only
+    the first time. Callers must use a copy.copy of it, which shares the loaded models
+    but gets its own data tree on loadData.
+    """
+    key = (yang_dir, print_log_enabled)
+    if key not in _sonic_yang_with_loaded_models_cache:
+        loaded_models_sy = sonic_yang.SonicYang(yang_dir, print_log_enabled=print_log_enabled)
+        loaded_models_sy.loadYangModel() # This call takes a long time (100s of ms) because it reads files from disk
+        _sonic_yang_with_loaded_models_cache[key] = loaded_models_sy
+    return _sonic_yang_with_loaded_models_cache[key]
+
 class ConfigWrapper:
-    def __init__(self, yang_dir = YANG_DIR):
+    def __init__(self, yang_dir = YANG_DIR, config_db_snapshot = None):
         self.yang_dir = YANG_DIR
         self.sonic_yang_with_loaded_models = None
+        self.config_db_snapshot = config_db_snapshot if config_db_snapshot is not None else ConfigDbSnapshot()
 
     def get_config_db_as_json(self):
-        text = self._get_config_db_as_text()
-        config_db_json = json.loads(text)
-        config_db_json.pop("bgpraw", None)
-        return config_db_json
-
-    def _get_config_db_as_text(self):
-        # TODO: Getting configs from CLI is very slow, need to get it from sonic-cffgen directly
-        cmd = "show runningconfiguration all"
-        result = subprocess.Popen(cmd, shell=True, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        text, err = result.communicate()
-        return_code = result.returncode
-        if return_code: # non-zero means failure
-            raise GenericConfigUpdaterError(f"Failed to get running config, Return code: {return_code}, Error: {err}")
-        return text
+        return self.config_db_snapshot.get_config_db_as_json()
 
     def get_sonic_yang_as_json(self):
         config_db_json = self.get_config_db_as_json()
@@ -288,9 +327,8 @@ class ConfigWrapper:
         # sonic_yang_with_loaded_models will only be initialized once the first time this method is called
         if self.sonic_yang_with_loaded_models is None:
             sonic_yang_print_log_enabled = genericUpdaterLogging.get_verbose()
-            loaded_models_sy = sonic_yang.SonicYang(self.yang_dir, print_log_enabled=sonic_yang_print_log_enabled)
-            loaded_models_sy.loadYangModel() # This call takes a long time (100s of ms) because it reads files from disk
-            self.sonic_yang_with_loaded_models = loaded_models_sy
+            self.sonic_yang_with_loaded_models = \
+                get_sonic_yang_with_loaded_models(self.yang_dir, sonic_yang_print_log_enabled)
 
         return copy.copy(self.sonic_yang_with_loaded_models)
 
@@ -389,6 +427,17 @@ class OperationWrapper:
 
         return operation
 
+class ConfigRefs:
+    """
+    The references within a single config: the config loaded into sonic_yang, and a reverse-reference
+    index from each leaf xpath, or each path, to the referencing xpaths, or paths, found so far.
+    """
+    def __init__(self, config, sy):
+        self.config = config
+        self.sy = sy
+        self.ref_xpaths = {}
+        self.ref_paths = {}
+
 class PathAddressing:
     """
     Path refers to the 'path' in JsonPatch operations: https://tools.ietf.org/html/rfc6902
@@ -399,9 +448,12 @@ class PathAddressing:
     """
     PATH_SEPARATOR = "/"
     XPATH_SEPARATOR = "/"
+    # Number of configs for which find_ref_paths keeps the loaded data tree and the references found
+    REF_CACHE_SIZE = 4
 
     def __init__(self, config_wrapper=None):
         self.config_wrapper = config_wrapper
+        self.config_refs_cache = OrderedDict()
 
     def get_path_tokens(self, path):
         return JsonPointer(path).parts
@@ -547,19 +599,50 @@ class PathAddressing:
         return self._find_leafref_paths(path, config)
 
     def _find_leafref_paths(self, path, config):
+        config_refs = self._get_config_refs(config)
+        if path not in config_refs.ref_paths:
+            config_refs.ref_paths[path] = self._find_leafref_paths_in_loaded_config(path, config, config_refs)
+
+        return list(config_refs.ref_paths[path])
+
+    def _get_config_refs(self, config):
+        """
+        Returns the ConfigRefs of config, loading config into sonic_yang only if it is not cached.
+        Configs are cached by identity, so a config must not be modified after being passed to find_ref_paths.
+        The patch sorter never modifies a config in place, every move creates a new config.
+        """
+        config_id = id(config)
+        config_refs = self.config_refs_cache.get(config_id)
+        if config_refs is not None and config_refs.config is config:
+            self.config_refs_cache.move_to_end(config_id)
+            return config_refs
+
         sy = self._create_sonic_yang_with_loaded_models()
 
         tmp_config = copy.deepcopy(config)
 
         sy.loadData(tmp_config)
 
+        config_refs = ConfigRefs(config, sy)
+        self.config_refs_cache[config_id] = config_refs
+        self.config_refs_cache.move_to_end(config_id)
+        while len(self.config_refs_cache) > self.REF_CACHE_SIZE:
+            self.config_refs_cache.popitem(last=False)
+
+        return config_refs
+
+    def _find_leafref_paths_in_loaded_config(self, path, config, config_refs):
+        sy = config_refs.sy
+
         xpath = self.convert_path_to_xpath(path, config, sy)
 
         leaf_xpaths = self._get_inner_leaf_xpaths(xpath, sy)
 
         ref_xpaths = []
         for xpath in leaf_xpaths:
-            ref_xpaths.extend(sy.find_data_dependencies(xpath))
+            if xpath not in config_refs.ref_xpaths:
+                config_refs.ref_xpaths[xpath] = sy.find_data_dependencies(xpath)
+            ref_xpaths.extend(config_refs.ref_xpaths[xpath])
 
         ref_paths = []
         ref_paths_set = set()
@@ -2,22 +2,104 @@ import copy
 import json
 import jsonpatch
 from collections import deque, OrderedDict
+from jsonpointer import JsonPointer
 from enum import Enum
 from .gu_common import OperationWrapper, OperationType, GenericConfigUpdaterError, \
                        JsonChange, PathAddressing, genericUpdaterLogging
 
+# Mask keeping the incremental config hashes to 64 bits
+HASH_MASK = (1 << 64) - 1
+
+class ConfigHash:
+    """
+    An order independent hash of a config, kept per table and per table key.
+    Updating it after a change only re-hashes the changed table key, so its cost depends on the size of the
+    change rather than on the size of the config.
+    """
+    def __init__(self, tables, value):
+        # tables: table -> (table hash, key -> key hash), key hashes are None if the table is not a dict
+        self.tables = tables
+        self.value = value
+
+    @staticmethod
+    def create(config):
+        if not isinstance(config, dict):
+            return ConfigHash(None, ConfigHash._hash_json(config))
+
+        tables = {}
+        value = 0
+        for table in config:
+            tables[table] = ConfigHash._create_table(config[table])
+            value += hash((table, tables[table][0]))
+        return ConfigHash(tables, value & HASH_MASK)
+
+    def update(self, config, tokens):
+        """
+        Returns the hash of config, which is the config of this hash after a change under the path tokens.
+        """
+        if not tokens or self.tables is None or not isinstance(config, dict):
+            return ConfigHash.create(config)
+
+        tables = dict(self.tables)
+        value = self.value
+        table = tokens[0]
+        old_table_hash = tables.pop(table, None)
+        if old_table_hash is not None:
+            value -= hash((table, old_table_hash[0]))
+
+        if table in config:
+            table_config = config[table]
+            if len(tokens) > 1 and old_table_hash is not None and old_table_hash[1] is not None \
+                    and isinstance(table_config, dict):
+                tables[table] = ConfigHash._update_table(old_table_hash, table_config, tokens[1])
+            else:
+                tables[table] = ConfigHash._create_table(table_config)
+            value += hash((table, tables[table][0]))
+
+        return ConfigHash(tables, value & HASH_MASK)
+
+    @staticmethod
+    def _create_table(table_config):
+        if not isinstance(table_config, dict):
+            return (ConfigHash._hash_json(table_config), None)
+
+        key_hashes = {}
+        table_hash = 0
+        for key in table_config:
+            key_hashes[key] = ConfigHash._hash_json(table_config[key])
+            table_hash += hash((key, key_hashes[key]))
+        return (table_hash & HASH_MASK, key_hashes)
+
+    @staticmethod
+    def _update_table(old_table_hash, table_config, key):
+        table_hash, key_hashes = old_table_hash
+        key_hashes = dict(key_hashes)
+        if key in key_hashes:
+            table_hash -= hash((key, key_hashes.pop(key)))
+        if key in table_config:
+            key_hashes[key] = ConfigHash._hash_json(table_config[key])
+            table_hash += hash((key, key_hashes[key]))
+        return (table_hash & HASH_MASK, key_hashes)
+
+    @staticmethod
+    def _hash_json(value):
+        return hash(json.dumps(value, sort_keys=True))
+
 class Diff:
     """
     A class that contains the diff info between current and target configs.
+
+    Diffs are immutable, a diff created by apply_move shares all the config parts not touched by the move
+    with the original diff, and the hash of its current config is updated incrementally.
     """
-    def __init__(self, current_config, target_config):
+    def __init__(self, current_config, target_config, current_config_hash=None, target_config_hash=None):
         self.current_config = current_config
         self.target_config = target_config
+        self.current_config_hash = current_config_hash
+        self.target_config_hash = target_config_hash
 
     def __hash__(self):
-        cc = json.dumps(self.current_config, sort_keys=True)
-        tc = json.dumps(self.target_config, sort_keys=True)
-        return hash((cc,tc))
+        return hash((self.get_current_config_hash().value, self.get_target_config_hash().value))
 
     def __eq__(self, other):
         """Overrides the default implementation"""
@@ -26,14 +108,27 @@ class Diff:
 
         return False
 
-    # TODO: Can be optimized to apply the move in place. JsonPatch supports that using the option 'in_place=True'
-    # Check: https://python-json-patch.readthedocs.io/en/latest/tutorial.html#applying-a-patch
-    # NOTE: in case move is applied in place, we will need to support `undo_move` as well.
+    def get_current_config_hash(self):
+        if self.current_config_hash is None:
+            self.current_config_hash = ConfigHash.create(self.current_config)
+        return self.current_config_hash
+
+    def get_target_config_hash(self):
+        if self.target_config_hash is None:
+            self.target_config_hash = ConfigHash.create(self.target_config)
+        return self.target_config_hash
+
     def apply_move(self, move):
         new_current_config = move.apply(self.current_config)
-        return Diff(new_current_config, self.target_config)
+        new_current_config_hash = None
+        if self.current_config_hash is not None:
+            new_current_config_hash = self.current_config_hash.update(new_current_config, move.path_tokens)
+        return Diff(new_current_config, self.target_config, new_current_config_hash, self.target_config_hash)
 
     def has_no_diff(self):
+        # Different hashes means different configs, only compare the configs if the hashes match
+        if self.get_current_config_hash().value != self.get_target_config_hash().value:
+            return False
         return self.current_config == self.target_config
 
     def __str__(self):
@@ -62,7 +157,10 @@ class JsonMove:
         self.patch = jsonpatch.JsonPatch([operation])
         self.op_type = operation[OperationWrapper.OP_KEYWORD]
         self.path = operation[OperationWrapper.PATH_KEYWORD]
+        self.path_tokens = JsonPointer(self.path).parts
         self.value = operation.get(OperationWrapper.VALUE_KEYWORD, None)
+        self.applied_config = None
+        self.applied_result = None
 
         self.op_type = op_type
         self.current_config_tokens = current_config_tokens
@@ -272,7 +370,37 @@ class JsonMove:
         return JsonMove(diff, op_type, current_config_tokens, target_config_tokens)
 
     def apply(self, config):
-        return self.patch.apply(config)
+        """
+        Returns a new config with the move applied, config is not modified.
+        Applying the move again to the same config returns the same new config, so the validators and the
+        sorter simulating a move share a single simulated config, and the references found in it.
+        """
+        if self.applied_result is None or self.applied_config is not config:
+            self.applied_result = self._apply(config)
+            self.applied_config = config
+        return self.applied_result
+
+    def _apply(self, config):
+        """
+        Only the containers on the path of the move are copied, the rest is shared with config.
+        """
+        if not self.path_tokens:
+            return self.patch.apply(config)
+
+        new_config = copy.copy(config)
+        config_ptr = new_config
+        for token in self.path_tokens[:-1]:
+            if isinstance(config_ptr, dict) and token in config_ptr:
+                key = token
+            elif isinstance(config_ptr, list) and token.isdigit() and int(token) < len(config_ptr):
+                key = int(token)
+            else:
+                # Path does not exist, JsonPatch below reports it
+                break
+            config_ptr[key] = copy.copy(config_ptr[key])
+            config_ptr = config_ptr[key]
+
+        return self.patch.apply(new_config, in_place=True)
 
     def __str__(self):
         return str(self.patch)
@@ -343,6 +471,14 @@ class MoveWrapper:
                 return False
         return True
 
+    def generate_valid_moves(self, diff):
+        """
+        Generates the moves of 'generate' that pass validation, in the same order.
+        """
+        for move in self.generate(diff):
+            if self.validate(move, diff):
+                yield move
+
     def simulate(self, move, diff):
         return diff.apply_move(move)
 
@@ -1547,14 +1683,13 @@ class DfsSorter:
             return None
         self.visited[diff_hash] = True
 
-        moves = self.move_wrapper.generate(diff)
+        moves = self.move_wrapper.generate_valid_moves(diff)
 
         for move in moves:
-            if self.move_wrapper.validate(move, diff):
-                new_diff = self.move_wrapper.simulate(move, diff)
-                new_moves = self.sort(new_diff)
-                if new_moves is not None:
-                    return [move] + new_moves
+            new_diff = self.move_wrapper.simulate(move, diff)
+            new_moves = self.sort(new_diff)
+            if new_moves is not None:
+                return [move] + new_moves
 
         return None
 
@@ -1582,14 +1717,13 @@ class BfsSorter:
             if diff.has_no_diff():
                 return prv_moves
 
-            moves = self.move_wrapper.generate(diff)
+            moves = self.move_wrapper.generate_valid_moves(diff)
             for move in moves:
-                if self.move_wrapper.validate(move, diff):
-                    new_diff = self.move_wrapper.simulate(move, diff)
-                    new_prv_moves = prv_moves + [move]
+                new_diff = self.move_wrapper.simulate(move, diff)
+                new_prv_moves = prv_moves + [move]
 
-                    diff_queue.append(new_diff)
-                    prv_moves_queue.append(new_prv_moves)
+                diff_queue.append(new_diff)
+                prv_moves_queue.append(new_prv_moves)
 
         return None
 
@@ -1610,15 +1744,14 @@ class MemoizationSorter:
             return None
         self.visited[diff_hash] = True
 
-        moves = self.move_wrapper.generate(diff)
+        moves = self.move_wrapper.generate_valid_moves(diff)
 
         bst_moves = None
         for move in moves:
-            if self.move_wrapper.validate(move, diff):
-                new_diff = self.move_wrapper.simulate(move, diff)
-                new_moves = self.sort(new_diff)
-                if new_moves != None and (bst_moves is None or len(bst_moves) > len(new_moves)+1):
-                    bst_moves = [move] + new_moves
+            new_diff = self.move_wrapper.simulate(move, diff)
+            new_moves = self.sort(new_diff)
+            if new_moves != None and (bst_moves is None or len(bst_moves) > len(new_moves)+1):
+                bst_moves = [move] + new_moves
 
         self.mem[diff_hash] = bst_moves
         return bst_moves
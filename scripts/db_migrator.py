@@ -6,10 +6,12 @@ import json
 import sys
 import traceback
 import re
+import time
 
 from sonic_py_common import device_info, logger
 from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector, SonicDBConfig
 from db_migrator_constants import RESTAPI, TELEMETRY, CONSOLE_SWITCH
+from utilities_common.bulk_db import BulkHashWriter
 
 INIT_CFG_FILE = '/etc/sonic/init_cfg.json'
 
@@ -33,7 +35,7 @@ log = logger.Logger(SYSLOG_IDENTIFIER)
 
 
 class DBMigrator():
-    def __init__(self, namespace, socket=None):
+    def __init__(self, namespace, socket=None, profile=False):
         """
         Version string format:
            version_<major>_<minor>_<build>
@@ -51,6 +53,10 @@ class DBMigrator():
         self.TABLE_KEY       = 'DATABASE'
         self.TABLE_FIELD     = 'VERSION'
 
+        # Time spent in each migration step, reported when profile is set
+        self.profile = profile
+        self.step_times = []
+
         db_kwargs = {}
         if socket:
             db_kwargs['unix_socket_path'] = socket
@@ -444,29 +450,30 @@ class DBMigrator():
         for pair in table_list:
             table_name, fields_list = pair
             qos_table = db.get_table(table_name)
-            for key, value in qos_table.items():
-                if type(key) is tuple:
-                    db_key = table_name + db_delimeter + db_delimeter.join(key)
-                else:
-                    db_key = table_name + db_delimeter + key
-
-                for field in fields_list:
-                    if field in value:
-                        fieldVal = value.get(field)
-                        if not fieldVal or fieldVal == "NULL":
-                            continue
-                        newFiledVal = ""
-                        # Check for ABNF format presence and convert ABNF to string
-                        if "[" in fieldVal and db_delimeter in fieldVal and "]" in fieldVal:
-                            log.log_info("Found ABNF format field value in table {} key {} field {} val {}".format(table_name, db_key, field, fieldVal))
-                            value_list = fieldVal.split(",")
-                            for item in value_list:
-                                if "[" != item[0] or db_delimeter not in item or "]" != item[-1]:
-                                    continue
-                                newFiledVal = newFiledVal + item[1:-1].split(db_delimeter)[1] + ','
-                            newFiledVal = newFiledVal[:-1]
-                            db.set(db_num, db_key, field, newFiledVal)
-                            log.log_info("Modified ABNF format field value to string in table {} key {} field {} val {}".format(table_name, db_key, field, newFiledVal))
+            with BulkHashWriter(db, db_num) as writer:
+                for key, value in qos_table.items():
+                    if type(key) is tuple:
+                        db_key = table_name + db_delimeter + db_delimeter.join(key)
+                    else:
+                        db_key = table_name + db_delimeter + key
+
+                    for field in fields_list:
+                        if field in value:
+                            fieldVal = value.get(field)
+                            if not fieldVal or fieldVal == "NULL":
+                                continue
+                            newFiledVal = ""
+                            # Check for ABNF format presence and convert ABNF to string
+                            if "[" in fieldVal and db_delimeter in fieldVal and "]" in fieldVal:
+                                log.log_info("Found ABNF format field value in table {} key {} field {} val {}".format(table_name, db_key, field, fieldVal))
+                                value_list = fieldVal.split(",")
+                                for item in value_list:
+                                    if "[" != item[0] or db_delimeter not in item or "]" != item[-1]:
+                                        continue
+                                    newFiledVal = newFiledVal + item[1:-1].split(db_delimeter)[1] + ','
+                                newFiledVal = newFiledVal[:-1]
+                                writer.hset(db_key, field, newFiledVal)
+                                log.log_info("Modified ABNF format field value to string in table {} key {} field {} val {}".format(table_name, db_key, field, newFiledVal))
         return True
 
     def migrate_qos_fieldval_reference_format(self):
@@ -593,15 +600,16 @@ class DBMigrator():
             Upgrade from older branch to 202205 will require this 'weight' attr to be added explicitly
         """
         route_table = self.appDB.get_table("ROUTE_TABLE")
-        for route_prefix, route_attr in route_table.items():
-            if 'weight' not in route_attr:
-                if type(route_prefix) == tuple:
-                    # IPv6 route_prefix is returned from db as tuple
-                    route_key = "ROUTE_TABLE:" + ":".join(route_prefix)
-                else:
-                    # IPv4 route_prefix is returned from db as str
-                    route_key = "ROUTE_TABLE:{}".format(route_prefix)
-                self.appDB.set(self.appDB.APPL_DB, route_key, 'weight','')
+        with BulkHashWriter(self.appDB, self.appDB.APPL_DB) as writer:
+            for route_prefix, route_attr in route_table.items():
+                if 'weight' not in route_attr:
+                    if type(route_prefix) == tuple:
+                        # IPv6 route_prefix is returned from db as tuple
+                        route_key = "ROUTE_TABLE:" + ":".join(route_prefix)
+                    else:
+                        # IPv4 route_prefix is returned from db as str
+                        route_key = "ROUTE_TABLE:{}".format(route_prefix)
+                    writer.hset(route_key, 'weight', '')
 
     def update_edgezone_aggregator_config(self):
         """
@@ -999,16 +1007,33 @@ class DBMigrator():
         # Updating edgezone aggregator cable length config for T0 devices
         self.update_edgezone_aggregator_config()
 
+    def run_step(self, step):
+        start = time.monotonic()
+        result = getattr(self, step)()
+        self.step_times.append((step, time.monotonic() - start))
+        return result
+
+    def report_step_times(self):
+        lines = ['{:<24} {:>10}'.format('Step', 'Time (s)')]
+        for step, seconds in self.step_times:
+            lines.append('{:<24} {:>10.3f}'.format(step, seconds))
+        lines.append('{:<24} {:>10.3f}'.format('total', sum(seconds for _, seconds in self.step_times)))
+        for line in lines:
+            log.log_notice(line)
+        return '\n'.join(lines)
+
     def migrate(self):
         version = self.get_version()
         log.log_info('Upgrading from version ' + version)
         while version:
-            next_version = getattr(self, version)()
+            next_version = self.run_step(version)
             if next_version == version:
                 raise Exception('Version migrate from %s stuck in same version' % version)
             version = next_version
         # Perform common migration ops
-        self.common_migration_ops()
+        self.run_step('common_migration_ops')
+        if self.profile:
+            return self.report_step_times()
 
 def main():
     try:
@@ -1036,10 +1061,16 @@ def main():
                         required = False,
                         help = 'The asic namespace whose DB instance we need to connect',
                         default = None )
+        parser.add_argument('-p', '--profile',
+                        dest='profile',
+                        action='store_true',
+                        help = 'report the time spent in each migration step',
+                        default = False )
         args = parser.parse_args()
         operation = args.operation
         socket_path = args.socket
         namespace = args.namespace
+        profile = args.profile
 
         if args.namespace is not None:
             SonicDBConfig.load_sonic_global_db_config(namespace=args.namespace)
@@ -1047,9 +1078,9 @@ def main():
             SonicDBConfig.initialize()
 
         if socket_path:
-            dbmgtr = DBMigrator(namespace, socket=socket_path)
+            dbmgtr = DBMigrator(namespace, socket=socket_path, profile=profile)
         else:
-            dbmgtr = DBMigrator(namespace)
+            dbmgtr = DBMigrator(namespace, profile=profile)
 
         result = getattr(dbmgtr, operation)()
         if result:
@@ -12,12 +12,25 @@ import argparse
 import syslog
 import traceback
 import ipaddress
+import time
+from contextlib import contextmanager
 from builtins import str #for unicode conversion in python2
+from utilities_common.bulk_db import hgetall_bulk
+from utilities_common.fdb import FdbSnapshot
 
 
 ARP_CHUNK = binascii.unhexlify('08060001080006040001') # defines a part of the packet for ARP Request
 ARP_PAD = binascii.unhexlify('00' * 18)
 
+@contextmanager
+def timed_stage(name):
+    """ Logs the elapsed time of a dump stage, the dump runs within the reboot downtime budget """
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        syslog.syslog(syslog.LOG_INFO, "Stage '%s' took %.3f seconds" % (name, time.monotonic() - start))
+
 def generate_neighbor_entries(filename, all_available_macs):
     db = SonicV2Connector(use_unix_socket_path=False)
     db.connect(db.APPL_DB, False)   # Make one attempt only
@@ -61,21 +74,9 @@ def get_vlan_ifaces():
 
     return vlans
 
-def get_bridge_port_id_2_port_id(db):
-    bridge_port_id_2_port_id = {}
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = db.get_all(db.ASIC_DB, key)
-        port_type = value['SAI_BRIDGE_PORT_ATTR_TYPE']
-        if port_type != 'SAI_BRIDGE_PORT_TYPE_PORT':
-            continue
-        port_id = value['SAI_BRIDGE_PORT_ATTR_PORT_ID']
-        # ignore admin status
-        bridge_id = key.replace('ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:', '')
-        bridge_port_id_2_port_id[bridge_id] = port_id
-
-    return bridge_port_id_2_port_id
+def get_bridge_port_id_2_port_id(fdb_snapshot):
+    # ignore admin status
+    return fdb_snapshot.get_bridge_port_map('SAI_BRIDGE_PORT_TYPE_PORT')
 
 def get_lag_by_member(member_name, app_db):
     keys = app_db.keys(app_db.APPL_DB, 'LAG_MEMBER_TABLE:*')
@@ -126,8 +127,8 @@ def get_map_port_id_2_iface_name(asic_db, app_db):
 
     return port_id_2_iface
 
-def get_map_bridge_port_id_2_iface_name(asic_db, app_db):
-    bridge_port_id_2_port_id = get_bridge_port_id_2_port_id(asic_db)
+def get_map_bridge_port_id_2_iface_name(asic_db, app_db, fdb_snapshot):
+    bridge_port_id_2_port_id = get_bridge_port_id_2_port_id(fdb_snapshot)
     port_id_2_iface = get_map_port_id_2_iface_name(asic_db, app_db)
 
     bridge_port_id_2_iface_name = {}
@@ -140,37 +141,34 @@ def get_map_bridge_port_id_2_iface_name(asic_db, app_db):
 
     return bridge_port_id_2_iface_name
 
-def get_vlan_oid_by_vlan_id(db, vlan_id):
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = db.get_all(db.ASIC_DB, key)
-        if 'SAI_VLAN_ATTR_VLAN_ID' in value and int(value['SAI_VLAN_ATTR_VLAN_ID']) == vlan_id:
-            return key.replace('ASIC_STATE:SAI_OBJECT_TYPE_VLAN:', '')
+def get_map_bvid_2_fdb_keys(fdb_snapshot, vlan_ids):
+    """ Buckets the unicast FDB entry keys of vlan_ids by bvid with a single pass over the FDB table """
+    bvid_2_fdb_keys = {}
+    for key, key_obj in fdb_snapshot.get_fdb_keys(vlan_ids):
+        if 'bvid' not in key_obj:
+            continue
+        mac = str(key_obj['mac'])
+        if not is_mac_unicast(mac):
+            continue
+        bvid_2_fdb_keys.setdefault(key_obj['bvid'], []).append((key, mac))
 
-    raise Exception('Not found bvi oid for vlan_id: %d' % vlan_id)
+    return bvid_2_fdb_keys
 
-def get_fdb(db, vlan_name, vlan_id, bridge_id_2_iface):
+def get_fdb(db, vlan_name, vlan_id, fdb_keys, bridge_id_2_iface):
     fdb_types = {
       'SAI_FDB_ENTRY_TYPE_DYNAMIC': 'dynamic',
       'SAI_FDB_ENTRY_TYPE_STATIC' : 'static'
     }
 
-    bvid = get_vlan_oid_by_vlan_id(db, vlan_id)
     available_macs = set()
     map_mac_ip = {}
     fdb_entries = []
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:{*\"bvid\":\"%s\"*}' % bvid)
-    keys = [] if keys is None else keys
-    for key in keys:
-        key_obj = json.loads(key.replace('ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:', ''))
-        mac = str(key_obj['mac'])
-        if not is_mac_unicast(mac):
-            continue
+    # get attributes
+    values = hgetall_bulk(db, db.ASIC_DB, [key for key, _ in fdb_keys])
+    for key, mac in fdb_keys:
         available_macs.add((vlan_name, mac.lower()))
         fdb_mac = mac.replace(':', '-')
-        # get attributes
-        value = db.get_all(db.ASIC_DB, key)
+        value = values[key]
         fdb_type = fdb_types[value['SAI_FDB_ENTRY_ATTR_TYPE']]
         if value['SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID'] not in bridge_id_2_iface:
             continue
@@ -212,13 +210,26 @@ def generate_fdb_entries_logic(asic_db, app_db, vlan_ifaces):
     all_available_macs = set()
     map_mac_ip_per_vlan = {}
 
-    bridge_id_2_iface = get_map_bridge_port_id_2_iface_name(asic_db, app_db)
+    fdb_snapshot = FdbSnapshot(asic_db)
+    vlan_ids = [int(vlan.replace('Vlan', '')) for vlan in vlan_ifaces]
+
+    with timed_stage('bridge port map'):
+        bridge_id_2_iface = get_map_bridge_port_id_2_iface_name(asic_db, app_db, fdb_snapshot)
+
+    with timed_stage('vlan oid map'):
+        vlan_id_2_vlan_oid = fdb_snapshot.get_vlan_id_2_bvid()
+
+    with timed_stage('fdb scan'):
+        bvid_2_fdb_keys = get_map_bvid_2_fdb_keys(fdb_snapshot, vlan_ids)
 
-    for vlan in vlan_ifaces:
-        vlan_id = int(vlan.replace('Vlan', ''))
-        fdb_entry, available_macs, map_mac_ip_per_vlan[vlan] = get_fdb(asic_db, vlan, vlan_id, bridge_id_2_iface)
-        all_available_macs |= available_macs
-        fdb_entries.extend(fdb_entry)
+    with timed_stage('fdb entries'):
+        for vlan, vlan_id in zip(vlan_ifaces, vlan_ids):
+            if vlan_id not in vlan_id_2_vlan_oid:
+                raise Exception('Not found bvi oid for vlan_id: %d' % vlan_id)
+            fdb_keys = bvid_2_fdb_keys.get(vlan_id_2_vlan_oid[vlan_id], [])
+            fdb_entry, available_macs, map_mac_ip_per_vlan[vlan] = get_fdb(asic_db, vlan, vlan_id, fdb_keys, bridge_id_2_iface)
+            all_available_macs |= available_macs
+            fdb_entries.extend(fdb_entry)
 
     return fdb_entries, all_available_macs, map_mac_ip_per_vlan
 
@@ -353,11 +364,16 @@ def main():
     if not os.path.isdir(root_dir):
         print("Target directory '%s' not found" % root_dir)
         return 3
-    all_available_macs, map_mac_ip_per_vlan = generate_fdb_entries(root_dir + '/fdb.json')
-    neighbor_entries = generate_neighbor_entries(root_dir + '/arp.json', all_available_macs)
-    generate_default_route_entries(root_dir + '/default_routes.json')
-    generate_media_config(root_dir + '/media_config.json')
-    send_garp_nd(neighbor_entries, map_mac_ip_per_vlan)
+    with timed_stage('fdb'):
+        all_available_macs, map_mac_ip_per_vlan = generate_fdb_entries(root_dir + '/fdb.json')
+    with timed_stage('arp'):
+        neighbor_entries = generate_neighbor_entries(root_dir + '/arp.json', all_available_macs)
+    with timed_stage('default routes'):
+        generate_default_route_entries(root_dir + '/default_routes.json')
+    with timed_stage('media config'):
+        generate_media_config(root_dir + '/media_config.json')
+    with timed_stage('garp/nd'):
+        send_garp_nd(neighbor_entries, map_mac_ip_per_vlan)
     return 0
 
 if __name__ == '__main__':
@@ -69,6 +69,8 @@ IPV6_SEPARATOR = ':'
 MIN_SCAN_INTERVAL = 10      # Every 10 seconds
 MAX_SCAN_INTERVAL = 3600    # An hour
 
+DEFAULT_RESYNC_INTERVAL = 3600  # Full resync of incremental mode every hour
+
 PRINT_MSG_LEN_MAX = 1000
 
 class Level(Enum):
@@ -234,6 +236,16 @@ def checkout_rt_entry(k):
     return False, None
 
 
+def checkout_rt_entry_ip(k):
+    """
+    helper to strip out the IP of an ASIC-DB route entry key.
+    :param k: key to check as string
+    :return ip or None
+    """
+    _, e = checkout_rt_entry(k)
+    return e
+
+
 def get_subscribe_updates(selector, subs):
     """
     helper to collect subscribe messages for a period
@@ -269,23 +281,97 @@ def is_vrf(k):
     return k.startswith("Vrf")
 
 
-def get_routes():
+def checkout_appl_route(k):
+    """
+    helper to strip the VRF out of an APPL-DB:ROUTE_TABLE key and
+    filter out link local routes.
+    :param k: ROUTE_TABLE key to check as string
+    :return route with prefix ensured, or None for local routes
+    """
+    if (is_vrf(k)):
+        k = k.split(":", 1)[1]
+
+    if is_local(k):
+        return None
+    return add_prefix_ifnot(k.lower())
+
+
+def checkout_intf_entry(k):
+    """
+    helper to strip the IP out of an APPL-DB:INTF_TABLE key.
+    :param k: INTF_TABLE key to check as string
+    :return IP with added host prefix, or None if key has no IP or is local
+    """
+    lst = re.split(':', k.lower(), maxsplit=1)
+    if len(lst) == 1:
+        # No IP address in key; ignore
+        return None
+
+    ip = add_prefix(lst[1].split("/", -1)[0])
+    if is_local(ip):
+        return None
+    return ip
+
+
+class RouteCheckDbs(object):
+    """
+    Holds a single connection per DB, along with the tables and the
+    lookups shared by the route filters. Cached entries are dropped by
+    clear() so that a long lived instance can be reused across checks.
+    """
+    def __init__(self):
+        self.appl_db = None
+        self.config_db = None
+        self.appl_tables = {}
+        self.clear()
+
+    def clear(self):
+        self.route_entries = {}
+        self.config_tables = {}
+
+    def get_appl_db(self):
+        if self.appl_db is None:
+            self.appl_db = swsscommon.DBConnector(APPL_DB_NAME, 0)
+            print_message(syslog.LOG_DEBUG, "APPL DB connected")
+        return self.appl_db
+
+    def get_appl_table(self, name):
+        if name not in self.appl_tables:
+            self.appl_tables[name] = swsscommon.Table(self.get_appl_db(), name)
+        return self.appl_tables[name]
+
+    def get_config_table(self, name):
+        if self.config_db is None:
+            self.config_db = swsscommon.ConfigDBConnector()
+            self.config_db.connect()
+        if name not in self.config_tables:
+            self.config_tables[name] = self.config_db.get_table(name)
+        return self.config_tables[name]
+
+    def get_route_entry(self, key):
+        """
+        Read an APPL-DB:ROUTE_TABLE entry, at most once per key.
+        :return the entry as dict, empty if not present
+        """
+        if key not in self.route_entries:
+            self.route_entries[key] = dict(self.get_appl_table('ROUTE_TABLE').get(key)[1])
+        return self.route_entries[key]
+
+
+def get_routes(dbs=None):
     """
     helper to read route table from APPL-DB.
     :return list of sorted routes with prefix ensured
     """
-    db = swsscommon.DBConnector(APPL_DB_NAME, 0)
-    print_message(syslog.LOG_DEBUG, "APPL DB connected for routes")
-    tbl = swsscommon.Table(db, 'ROUTE_TABLE')
+    dbs = dbs or RouteCheckDbs()
+    tbl = dbs.get_appl_table('ROUTE_TABLE')
     keys = tbl.getKeys()
 
     valid_rt = []
     for k in keys:
-        if (is_vrf(k)):
-            k = k.split(":", 1)[1]
-
-        if not is_local(k):
-            valid_rt.append(add_prefix_ifnot(k.lower()))
+        rt = checkout_appl_route(k)
+        if rt is not None:
+            valid_rt.append(rt)
 
     print_message(syslog.LOG_DEBUG, json.dumps({"ROUTE_TABLE": sorted(valid_rt)}, indent=4))
     return sorted(valid_rt)
@@ -317,55 +403,50 @@ def get_route_entries():
     return (selector, subs, sorted(rt))
 
 
-def get_interfaces():
+def get_interfaces(dbs=None):
     """
     helper to read interface table from APPL-DB.
     :return sorted list of IP addresses with added prefix
     """
-    db = swsscommon.DBConnector(APPL_DB_NAME, 0)
-    print_message(syslog.LOG_DEBUG, "APPL DB connected for interfaces")
-    tbl = swsscommon.Table(db, 'INTF_TABLE')
+    dbs = dbs or RouteCheckDbs()
+    tbl = dbs.get_appl_table('INTF_TABLE')
     keys = tbl.getKeys()
 
     intf = []
     for k in keys:
-        lst = re.split(':', k.lower(), maxsplit=1)
-        if len(lst) == 1:
-            # No IP address in key; ignore
-            continue
-
-        ip = add_prefix(lst[1].split("/", -1)[0])
-        if not is_local(ip):
+        ip = checkout_intf_entry(k)
+        if ip is not None:
             intf.append(ip)
 
     print_message(syslog.LOG_DEBUG, json.dumps({"APPL_DB_INTF": sorted(intf)}, indent=4))
     return sorted(intf)
 
 
-def filter_out_local_interfaces(keys):
+LOCAL_IF_LO_RE = re.compile(r'tun0|lo|Loopback\d+')
+VOQ_NEIGH_IF_RE = re.compile(r'Ethernet-IB\d+')
+
+
+def filter_out_local_interfaces(keys, dbs=None):
     """
     helper to filter out local interfaces
     :param keys: APPL-DB:ROUTE_TABLE Routes to check.
     :return keys filtered out of local
     """
+    dbs = dbs or RouteCheckDbs()
     rt = []
     local_if_lst = {'eth0', 'docker0'}
-    local_if_lo = [r'tun0', r'lo', r'Loopback\d+']
 
     chassis_local_intfs = chassis.get_chassis_local_interfaces()
     local_if_lst.update(set(chassis_local_intfs))
-    
-    db = swsscommon.DBConnector(APPL_DB_NAME, 0)
-    tbl = swsscommon.Table(db, 'ROUTE_TABLE')
 
     for k in keys:
-        e = dict(tbl.get(k)[1])
+        e = dbs.get_route_entry(k)
 
         ifname = e.get('ifname', '')
         if ifname in local_if_lst:
             continue
 
-        if any([re.match(x, ifname) for x in local_if_lo]):
+        if LOCAL_IF_LO_RE.match(ifname):
             nh = e.get('nexthop')
             if not nh or ipaddress.ip_address(nh).is_unspecified:
                 continue
@@ -375,7 +456,7 @@ def filter_out_local_interfaces(keys):
     return rt
 
 
-def filter_out_voq_neigh_routes(keys):
+def filter_out_voq_neigh_routes(keys, dbs=None):
     """
     helper to filter out voq neigh routes. These are the
     routes statically added for the voq neighbors. We skip
@@ -385,21 +466,18 @@ def filter_out_voq_neigh_routes(keys):
     :param keys: APPL-DB:ROUTE_TABLE Routes to check.
     :return keys filtered out for voq neigh routes
     """
+    dbs = dbs or RouteCheckDbs()
     rt = []
-    local_if_re = [r'Ethernet-IB\d+']
-
-    db = swsscommon.DBConnector(APPL_DB_NAME, 0)
-    tbl = swsscommon.Table(db, 'ROUTE_TABLE')
 
     for k in keys:
         prefix = k.split("/")
-        e = dict(tbl.get(k)[1])
+        e = dbs.get_route_entry(k)
         if not e:
             # Prefix might have been added. So try w/o it.
-            e = dict(tbl.get(prefix[0])[1])
-        if not e or all([not (re.match(x, e['ifname']) and
+            e = dbs.get_route_entry(prefix[0])
+        if not e or not (VOQ_NEIGH_IF_RE.match(e['ifname']) and
             ((prefix[1] == "32" and e['nexthop'] == "0.0.0.0") or
-                (prefix[1] == "128" and e['nexthop'] == "::"))) for x in local_if_re]):
+                (prefix[1] == "128" and e['nexthop'] == "::"))):
             rt.append(k)
 
     return rt
@@ -420,53 +498,44 @@ def filter_out_default_routes(lst):
     return upd
 
 
-def filter_out_vnet_routes(routes):
+def filter_out_vnet_routes(routes, dbs=None):
     """
     Helper to filter out VNET routes
     :param routes: list of routes to filter
     :return filtered list of routes.
     """
-    db = swsscommon.DBConnector('APPL_DB', 0)
+    dbs = dbs or RouteCheckDbs()
 
-    vnet_route_table = swsscommon.Table(db, 'VNET_ROUTE_TABLE')
-    vnet_route_tunnel_table = swsscommon.Table(db, 'VNET_ROUTE_TUNNEL_TABLE')
+    vnet_route_table = dbs.get_appl_table('VNET_ROUTE_TABLE')
+    vnet_route_tunnel_table = dbs.get_appl_table('VNET_ROUTE_TUNNEL_TABLE')
 
     vnet_routes_db_keys = vnet_route_table.getKeys() + vnet_route_tunnel_table.getKeys()
 
-    vnet_routes = []
+    vnet_routes = set()
 
     for vnet_route_db_key in vnet_routes_db_keys:
         vnet_route_attrs = vnet_route_db_key.split(':', 1)
-        vnet_name = vnet_route_attrs[0]
         vnet_route = vnet_route_attrs[1]
-        vnet_routes.append(vnet_route)
+        vnet_routes.add(vnet_route)
 
-    updated_routes = []
-
-    for route in routes:
-        if not (route in vnet_routes):
-            updated_routes.append(route)
-
-    return updated_routes
+    return [route for route in routes if route not in vnet_routes]
 
 
-def is_dualtor(config_db):
-    device_metadata = config_db.get_table('DEVICE_METADATA')
+def is_dualtor(dbs):
+    device_metadata = dbs.get_config_table('DEVICE_METADATA')
     subtype = device_metadata['localhost'].get('subtype', '')
     return subtype.lower() == 'dualtor'
 
 
-def filter_out_standalone_tunnel_routes(routes):
-    config_db = swsscommon.ConfigDBConnector()
-    config_db.connect()
+def filter_out_standalone_tunnel_routes(routes, dbs=None):
+    dbs = dbs or RouteCheckDbs()
 
-    if not is_dualtor(config_db):
+    if not is_dualtor(dbs):
         return routes
 
-    app_db = swsscommon.DBConnector('APPL_DB', 0)
-    neigh_table = swsscommon.Table(app_db, 'NEIGH_TABLE')
+    neigh_table = dbs.get_appl_table('NEIGH_TABLE')
     neigh_keys = neigh_table.getKeys()
-    standalone_tunnel_route_ips = []
+    standalone_tunnel_route_ips = set()
     updated_routes = []
 
     for neigh in neigh_keys:
@@ -474,7 +543,7 @@ def filter_out_standalone_tunnel_routes(routes):
         if mac == '00:00:00:00:00:00':
             # remove preceding 'VlanXXXX' to get just the neighbor IP
             neigh_ip = ':'.join(neigh.split(':')[1:])
-            standalone_tunnel_route_ips.append(neigh_ip)
+            standalone_tunnel_route_ips.add(neigh_ip)
 
     if not standalone_tunnel_route_ips:
         return routes
@@ -493,17 +562,17 @@ def filter_out_standalone_tunnel_routes(routes):
     return updated_routes
 
 
-def get_soc_ips(config_db):
-    mux_table = config_db.get_table('MUX_CABLE')
-    soc_ips = []
+def get_soc_ips(dbs):
+    mux_table = dbs.get_config_table('MUX_CABLE')
+    soc_ips = set()
     for _, mux_entry in mux_table.items():
         if mux_entry.get("cable_type", "") == "active-active" and "soc_ipv4" in mux_entry:
-            soc_ips.append(mux_entry["soc_ipv4"])
+            soc_ips.add(mux_entry["soc_ipv4"])
 
     return soc_ips
 
 
-def filter_out_soc_ip_routes(routes):
+def filter_out_soc_ip_routes(routes, dbs=None):
     """
     Ignore ASIC only routes for SOC IPs
 
@@ -513,23 +582,67 @@ def filter_out_soc_ip_routes(routes):
     will use the kernel routing table), but still provide connectivity to any external
     traffic in case of a link issue (since this traffic will be forwarded by the ASIC).
     """
-    config_db = swsscommon.ConfigDBConnector()
-    config_db.connect()
+    dbs = dbs or RouteCheckDbs()
 
-    if not is_dualtor(config_db):
+    if not is_dualtor(dbs):
         return routes
 
-    soc_ips = get_soc_ips(config_db)
+    soc_ips = get_soc_ips(dbs)
 
     if not soc_ips:
         return routes
-    
-    updated_routes = []
-    for route in routes:
-        if route not in soc_ips:
-            updated_routes.append(route)
 
-    return updated_routes
+    return [route for route in routes if route not in soc_ips]
+
+
+def filter_out_expected_misses(rt_appl_miss, rt_asic_miss, dbs):
+    """
+    Rule out the APPL-DB / ASIC-DB route mismatches which are expected.
+    :param rt_appl_miss: sorted APPL-DB routes missing in ASIC-DB
+    :param rt_asic_miss: sorted ASIC-DB routes missing in APPL-DB and INTF_TABLE
+    :param dbs: RouteCheckDbs shared by the filters
+    :return (rt_appl_miss, rt_asic_miss) with expected entries removed
+    """
+    rt_asic_miss = filter_out_default_routes(rt_asic_miss)
+    rt_asic_miss = filter_out_vnet_routes(rt_asic_miss, dbs)
+    rt_asic_miss = filter_out_standalone_tunnel_routes(rt_asic_miss, dbs)
+    rt_asic_miss = filter_out_soc_ip_routes(rt_asic_miss, dbs)
+
+    if rt_appl_miss:
+        rt_appl_miss = filter_out_local_interfaces(rt_appl_miss, dbs)
+
+    if rt_appl_miss:
+        rt_appl_miss = filter_out_voq_neigh_routes(rt_appl_miss, dbs)
+
+    return rt_appl_miss, rt_asic_miss
+
+
+def report_results(rt_appl_miss, intf_appl_miss, rt_asic_miss, adds, deletes):
+    """
+    Report the unjustifiable entries, if any.
+    :return (0, None) on sucess, else (-1, results) where results holds
+    the unjustifiable entries.
+    """
+    results = {}
+
+    if rt_appl_miss:
+        results["missed_ROUTE_TABLE_routes"] = rt_appl_miss
+
+    if intf_appl_miss:
+        results["missed_INTF_TABLE_entries"] = intf_appl_miss
+
+    if rt_asic_miss:
+        results["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss
+
+    if results:
+        print_message(syslog.LOG_WARNING, "Failure results: {",  json.dumps(results, indent=4), "}")
+        print_message(syslog.LOG_WARNING, "Failed. Look at reported mismatches above")
+        print_message(syslog.LOG_WARNING, "add: ", json.dumps(adds, indent=4))
+        print_message(syslog.LOG_WARNING, "del: ", json.dumps(deletes, indent=4))
+        return -1, results
+    else:
+        print_message(syslog.LOG_INFO, "All good!")
+        return 0, None
 
 
 def check_routes():
@@ -552,33 +665,25 @@ def check_routes():
     rt_appl_miss = []
     rt_asic_miss = []
 
-    results = {}
     adds = []
     deletes = []
 
+    dbs = RouteCheckDbs()
     selector, subs, rt_asic = get_route_entries()
 
-    rt_appl = get_routes()
-    intf_appl = get_interfaces()
+    rt_appl = get_routes(dbs)
+    intf_appl = get_interfaces(dbs)
 
     # Diff APPL-DB routes & ASIC-DB routes
     rt_appl_miss, rt_asic_miss = diff_sorted_lists(rt_appl, rt_asic)
 
     # Check missed ASIC routes against APPL-DB INTF_TABLE
     _, rt_asic_miss = diff_sorted_lists(intf_appl, rt_asic_miss)
-    rt_asic_miss = filter_out_default_routes(rt_asic_miss)
-    rt_asic_miss = filter_out_vnet_routes(rt_asic_miss)
-    rt_asic_miss = filter_out_standalone_tunnel_routes(rt_asic_miss)
-    rt_asic_miss = filter_out_soc_ip_routes(rt_asic_miss)
 
     # Check APPL-DB INTF_TABLE with ASIC table route entries
     intf_appl_miss, _ = diff_sorted_lists(intf_appl, rt_asic)
 
-    if rt_appl_miss:
-        rt_appl_miss = filter_out_local_interfaces(rt_appl_miss)
-
-    if rt_appl_miss:
-        rt_appl_miss = filter_out_voq_neigh_routes(rt_appl_miss)
+    rt_appl_miss, rt_asic_miss = filter_out_expected_misses(rt_appl_miss, rt_asic_miss, dbs)
 
     if rt_appl_miss or rt_asic_miss:
         # Look for subscribe updates for a second
@@ -590,31 +695,169 @@ def check_routes():
         # Drop all those for which DEL received
         rt_asic_miss, _ = diff_sorted_lists(rt_asic_miss, deletes)
 
-    if rt_appl_miss:
-        results["missed_ROUTE_TABLE_routes"] = rt_appl_miss
+    return report_results(rt_appl_miss, intf_appl_miss, rt_asic_miss, adds, deletes)
+
+
+class IncrementalRouteChecker(object):
+    """
+    Keeps the APPL-DB routes, APPL-DB interfaces and ASIC-DB route entries
+    up to date from SubscriberStateTable notifications, so that a check
+    only looks at the prefixes which are currently mismatched instead of
+    reloading and diffing the full tables every interval.
+
+    The subscribers are re-created every resync_interval seconds to take a
+    fresh full snapshot and guard against lost notifications.
+    """
+    # Tracked table -> helper to get the route out of its DB key
+    CHECKOUT = {
+        'asic': checkout_rt_entry_ip,
+        'appl': checkout_appl_route,
+        'intf': checkout_intf_entry
+    }
+
+    def __init__(self, resync_interval):
+        self.resync_interval = resync_interval
+        self.dbs = RouteCheckDbs()
+        self.appl_db = self.dbs.get_appl_db()
+        self.asic_db = swsscommon.DBConnector(ASIC_DB_NAME, 0)
+        self.resync()
+
+    def resync(self):
+        """
+        Take a full snapshot of the tables. A new SubscriberStateTable
+        pops all the present entries of its table as SET.
+        """
+        print_message(syslog.LOG_INFO, "Full resync of route tables")
+        self.subscribers = {
+            'asic': swsscommon.SubscriberStateTable(self.asic_db, ASIC_TABLE_NAME),
+            'appl': swsscommon.SubscriberStateTable(self.appl_db, 'ROUTE_TABLE'),
+            'intf': swsscommon.SubscriberStateTable(self.appl_db, 'INTF_TABLE')
+        }
+        self.selector = swsscommon.Select()
+        for subs in self.subscribers.values():
+            self.selector.addSelectable(subs)
+
+        # Tracked table -> {DB key: route}
+        self.keys = {tbl: {} for tbl in self.CHECKOUT}
+        # Tracked table -> {route: number of DB keys mapping to it}
+        self.counts = {tbl: {} for tbl in self.CHECKOUT}
+        self.rt_appl_miss = set()
+        self.rt_asic_miss = set()
+        self.intf_appl_miss = set()
+
+        self.drain()
+        self.last_resync = time.time()
+
+    def update_mismatch(self, rt):
+        """
+        Re-evaluate the mismatch state of one route.
+        """
+        in_asic = rt in self.counts['asic']
+        in_appl = rt in self.counts['appl']
+        in_intf = rt in self.counts['intf']
+
+        for miss, missed in ((self.rt_appl_miss, in_appl and not in_asic),
+                             (self.rt_asic_miss, in_asic and not in_appl and not in_intf),
+                             (self.intf_appl_miss, in_intf and not in_asic)):
+            if missed:
+                miss.add(rt)
+            else:
+                miss.discard(rt)
+
+    def apply_update(self, tbl, key, op):
+        """
+        Apply one SET/DEL notification of a tracked table.
+        :return the route updated or None
+        """
+        keys = self.keys[tbl]
+        counts = self.counts[tbl]
+        rt = None
+        if op == "SET" and key not in keys:
+            rt = self.CHECKOUT[tbl](key)
+            if rt is None:
+                return None
+            keys[key] = rt
+            counts[rt] = counts.get(rt, 0) + 1
+        elif op == "DEL" and key in keys:
+            rt = keys.pop(key)
+            counts[rt] -= 1
+            if not counts[rt]:
+                del counts[rt]
+        if rt is not None:
+            self.update_mismatch(rt)
+        return rt
+
+    def drain(self):
+        """
+        Apply all the pending notifications.
+        :return (adds, deletes) of ASIC-DB route entries applied
+        """
+        adds = []
+        deletes = []
+        for tbl, subs in self.subscribers.items():
+            while True:
+                key, op, _ = subs.pop()
+                if not key:
+                    break
+                rt = self.apply_update(tbl, key, op)
+                if rt is not None and tbl == 'asic':
+                    if op == "SET":
+                        adds.append(rt)
+                    else:
+                        deletes.append(rt)
+        return adds, deletes
+
+    def wait(self, secs):
+        """
+        Apply notifications as they come for secs seconds.
+        :return (adds, deletes) of ASIC-DB route entries applied
+        """
+        adds = []
+        deletes = []
+        t_end = time.time() + secs
+        t_wait = secs
+        while t_wait > 0:
+            self.selector.select(int(t_wait * 1000))
+            a, d = self.drain()
+            adds += a
+            deletes += d
+            t_wait = t_end - time.time()
+        return adds, deletes
+
+    def check_routes(self):
+        """
+        Same checks as check_routes(), run against the tracked state.
+        :return (0, None) on sucess, else (-1, results) where results holds
+        the unjustifiable entries.
+        """
+        adds = []
+        deletes = []
+
+        if time.time() - self.last_resync >= self.resync_interval:
+            self.resync()
+        else:
+            self.drain()
 
-    if intf_appl_miss:
-        results["missed_INTF_TABLE_entries"] = intf_appl_miss
+        self.dbs.clear()
+        rt_appl_miss, rt_asic_miss = filter_out_expected_misses(
+                sorted(self.rt_appl_miss), sorted(self.rt_asic_miss), self.dbs)
 
-    if rt_asic_miss:
-        results["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss
+        if rt_appl_miss or rt_asic_miss:
+            # Give the pending updates a second to settle
+            adds, deletes = self.wait(SUBSCRIBE_WAIT_SECS)
+            rt_appl_miss = [rt for rt in rt_appl_miss if rt in self.rt_appl_miss]
+            rt_asic_miss = [rt for rt in rt_asic_miss if rt in self.rt_asic_miss]
 
-    if results:
-        print_message(syslog.LOG_WARNING, "Failure results: {",  json.dumps(results, indent=4), "}")
-        print_message(syslog.LOG_WARNING, "Failed. Look at reported mismatches above")
-        print_message(syslog.LOG_WARNING, "add: ", json.dumps(adds, indent=4))
-        print_message(syslog.LOG_WARNING, "del: ", json.dumps(deletes, indent=4))
-        return -1, results
-    else:
-        print_message(syslog.LOG_INFO, "All good!")
-        return 0, None
+        return report_results(rt_appl_miss, sorted(self.intf_appl_miss),
+                              rt_asic_miss, sorted(adds), sorted(deletes))
 
 
 def main():
     """
     main entry point, which mainly parses the args and call check_routes
     In case of single run, it returns on one call or stays in forever loop
-    with given interval in-between calls to check_route
+    with given interval in-between calls to check_route. With incremental
+    mode the tables are loaded once and tracked through DB notifications.
     :return Same return value as returned by check_route.
     """
     interval = 0
@@ -622,6 +865,10 @@ def main():
     parser.add_argument('-m', "--mode", type=Level, choices=list(Level), default='ERR')
     parser.add_argument("-i", "--interval", type=int, default=0, help="Scan interval in seconds")
     parser.add_argument("-s", "--log_to_syslog", action="store_true", default=True, help="Write message to syslog")
+    parser.add_argument("-I", "--incremental", action="store_true", default=False,
+            help="With interval, track DB changes between scans instead of reloading all tables on every scan")
+    parser.add_argument("-r", "--resync_interval", type=int, default=DEFAULT_RESYNC_INTERVAL,
+            help="Full resync interval in seconds for incremental mode")
     args = parser.parse_args()
 
     set_level(args.mode, args.log_to_syslog)
@@ -638,13 +885,26 @@ def main():
 
     signal.signal(signal.SIGALRM, handler)
 
+    checker = None
+    if interval and args.incremental:
+        signal.alarm(TIMEOUT_SECONDS)
+        checker = IncrementalRouteChecker(args.resync_interval)
+        signal.alarm(0)
+
     while True:
         signal.alarm(TIMEOUT_SECONDS)
-        ret, res= check_routes()
+        if checker:
+            ret, res = checker.check_routes()
+        else:
+            ret, res= check_routes()
         signal.alarm(0)
 
         if interval:
-            time.sleep(interval)
+            if checker:
+                # Keep applying DB changes while waiting for the next scan
+                checker.wait(interval)
+            else:
+                time.sleep(interval)
             if UNIT_TESTING:
                 return ret, res
         else:
@@ -238,6 +238,7 @@ setup(
         'semantic-version>=2.8.5',
         'prettyprinter>=0.18.0',
         'pyroute2>=0.5.14, <0.6.1',
+        'redis>=3.5.3',
         'requests>=2.25.0',
         'tabulate==0.8.2',
         'toposort==1.6',
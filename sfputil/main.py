@@ -7,8 +7,10 @@
 
 import os
 import sys
+import concurrent.futures
 import natsort
 import ast
+import threading
 import time
 import datetime
 
@@ -46,6 +48,9 @@ CDB_DEFAULT_HOST_PASSWORD = 0x00001011
 
 MAX_LPL_FIRMWARE_BLOCK_SIZE = 116 #Bytes
 
+MAX_EEPROM_READ_WORKERS = 32
+MAX_FIRMWARE_DOWNLOAD_WORKERS = 32
+
 PAGE_SIZE = 128
 PAGE_OFFSET = 128
 
@@ -597,15 +602,87 @@ def show():
     pass
 
 
+class EepromReadError(Exception):
+    def __init__(self, message, exit_code=ERROR_NOT_IMPLEMENTED):
+        super(EepromReadError, self).__init__(message)
+        self.exit_code = exit_code
+
+
+def get_sfp_eeprom_output(logical_port_name, physical_port_list, dump_dom):
+    """
+        Read the EEPROM (and optionally DOM) data of a logical port and return it formatted.
+        Raises EepromReadError if the platform can't read it. It runs in the worker threads
+        of 'show eeprom -w', so it must not print anything nor exit.
+    """
+    output = ""
+    ganged = False
+    i = 1
+
+    if len(physical_port_list) > 1:
+        ganged = True
+
+    for physical_port in physical_port_list:
+        port_name = get_physical_port_name(logical_port_name, i, ganged)
+
+        if is_port_type_rj45(port_name):
+            output += "{}: SFP EEPROM is not applicable for RJ45 port\n".format(port_name)
+            output += '\n'
+            continue
+
+        try:
+            presence = platform_chassis.get_sfp(physical_port).get_presence()
+        except NotImplementedError:
+            raise EepromReadError("Sfp.get_presence() is currently not implemented for this platform")
+
+        if not presence:
+            output += "{}: SFP EEPROM not detected\n".format(port_name)
+        else:
+            output += "{}: SFP EEPROM detected\n".format(port_name)
+
+            try:
+                xcvr_info = platform_chassis.get_sfp(physical_port).get_transceiver_info()
+            except NotImplementedError:
+                raise EepromReadError("Sfp.get_transceiver_info() is currently not implemented for this platform")
+
+            output += convert_sfp_info_to_output_string(xcvr_info)
+
+            if dump_dom:
+                try:
+                    xcvr_dom_info = platform_chassis.get_sfp(physical_port).get_transceiver_bulk_status()
+                except NotImplementedError:
+                    raise EepromReadError("Sfp.get_transceiver_bulk_status() is currently not implemented for this platform")
+
+                try:
+                    xcvr_dom_threshold_info = platform_chassis.get_sfp(physical_port).get_transceiver_threshold_info()
+                    if xcvr_dom_threshold_info:
+                        xcvr_dom_info.update(xcvr_dom_threshold_info)
+                except NotImplementedError:
+                    raise EepromReadError("Sfp.get_transceiver_threshold_info() is currently not implemented for this platform")
+
+                output += convert_dom_to_output_string(xcvr_info['type'], xcvr_dom_info)
+
+        output += '\n'
+
+    return output
+
+
 # 'eeprom' subcommand
 @show.command()
 @click.option('-p', '--port', metavar='<port_name>', help="Display SFP EEPROM data for port <port_name> only")
 @click.option('-d', '--dom', 'dump_dom', is_flag=True, help="Also display Digital Optical Monitoring (DOM) data")
 @click.option('-n', '--namespace', default=None, help="Display interfaces for specific namespace")
-def eeprom(port, dump_dom, namespace):
-    """Display EEPROM data of SFP transceiver(s)"""
+@click.option('-w', '--workers', metavar='<num_workers>', type=click.IntRange(1, MAX_EEPROM_READ_WORKERS), default=1,
+              show_default=True,
+              help="Number of ports to read concurrently. More than 1 requires a thread-safe platform Sfp API")
+@click.option('-s', '--stream', is_flag=True, help="Display each port as soon as it has been read, rather than in port order")
+def eeprom(port, dump_dom, namespace, workers, stream):
+    """Display EEPROM data of SFP transceiver(s)
+
+    With -w greater than 1 the ports are read from concurrent threads, which
+    assumes the platform Sfp API can be called from several threads at once.
+    """
     logical_port_list = []
-    output = ""
+    port_list = []
 
     # Create a list containing the logical port names of all ports we're interested in
     if port is None:
@@ -619,64 +696,46 @@ def eeprom(port, dump_dom, namespace):
         logical_port_list = [port]
 
     for logical_port_name in logical_port_list:
-        ganged = False
-        i = 1
-
         physical_port_list = logical_port_name_to_physical_port_list(logical_port_name)
         if physical_port_list is None:
             click.echo("Error: No physical ports found for logical port '{}'".format(logical_port_name))
             return
 
-        if len(physical_port_list) > 1:
-            ganged = True
+        port_list.append((logical_port_name, physical_port_list))
 
-        for physical_port in physical_port_list:
-            port_name = get_physical_port_name(logical_port_name, i, ganged)
+    try:
+        if workers == 1:
+            output = ""
+            for logical_port_name, physical_port_list in port_list:
+                port_output = get_sfp_eeprom_output(logical_port_name, physical_port_list, dump_dom)
+                if stream:
+                    click.echo(port_output, nl=False)
+                else:
+                    output += port_output
+            click.echo(output)
+            return
 
-            if is_port_type_rj45(port_name):
-                output += "{}: SFP EEPROM is not applicable for RJ45 port\n".format(port_name)
-                output += '\n'
-                continue
+        # Each transceiver read is a slow I2C transaction, so read several ports at once.
+        # The sub-ports of a ganged port are still read one after the other by one worker.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(get_sfp_eeprom_output, logical_port_name, physical_port_list, dump_dom)
+                       for logical_port_name, physical_port_list in port_list]
 
             try:
-                presence = platform_chassis.get_sfp(physical_port).get_presence()
-            except NotImplementedError:
-                click.echo("Sfp.get_presence() is currently not implemented for this platform")
-                sys.exit(ERROR_NOT_IMPLEMENTED)
-
-            if not presence:
-                output += "{}: SFP EEPROM not detected\n".format(port_name)
-            else:
-                output += "{}: SFP EEPROM detected\n".format(port_name)
-
-                try:
-                    xcvr_info = platform_chassis.get_sfp(physical_port).get_transceiver_info()
-                except NotImplementedError:
-                    click.echo("Sfp.get_transceiver_info() is currently not implemented for this platform")
-                    sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                output += convert_sfp_info_to_output_string(xcvr_info)
-
-                if dump_dom:
-                    try:
-                        xcvr_dom_info = platform_chassis.get_sfp(physical_port).get_transceiver_bulk_status()
-                    except NotImplementedError:
-                        click.echo("Sfp.get_transceiver_bulk_status() is currently not implemented for this platform")
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                    try:
-                        xcvr_dom_threshold_info = platform_chassis.get_sfp(physical_port).get_transceiver_threshold_info()
-                        if xcvr_dom_threshold_info:
-                            xcvr_dom_info.update(xcvr_dom_threshold_info)
-                    except NotImplementedError:
-                        click.echo("Sfp.get_transceiver_threshold_info() is currently not implemented for this platform")
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                    output += convert_dom_to_output_string(xcvr_info['type'], xcvr_dom_info)
-
-            output += '\n'
-
-    click.echo(output)
+                if stream:
+                    for future in concurrent.futures.as_completed(futures):
+                        click.echo(future.result(), nl=False)
+                    click.echo()
+                else:
+                    click.echo(''.join(future.result() for future in futures))
+            except EepromReadError:
+                # Don't read the remaining ports once the command failed
+                for future in futures:
+                    future.cancel()
+                raise
+    except EepromReadError as e:
+        click.echo(str(e))
+        sys.exit(e.exit_code)
 
 # 'eeprom-hexdump' subcommand
 @show.command()
@@ -1207,12 +1266,18 @@ def firmware():
     """Download/Upgrade firmware on the transceiver"""
     pass
 
+class FirmwareError(Exception):
+    def __init__(self, message, exit_code=EXIT_FAIL):
+        super(FirmwareError, self).__init__(message)
+        self.exit_code = exit_code
+
 def run_firmware(port_name, mode):
     """
         Make the inactive firmware as the current running firmware
         @port_name:
         @mode: 0, 1, 2, 3 different modes to run the firmware
         Returns 1 on success, and exit_code = -1 on failure
+        Raises FirmwareError if the firmware can't be run on this transceiver
     """
     status = 0
     physical_port = logical_port_to_physical_port_index(port_name)
@@ -1221,8 +1286,7 @@ def run_firmware(port_name, mode):
     try:
         api = sfp.get_xcvr_api()
     except NotImplementedError:
-        click.echo("This functionality is currently not implemented for this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareError("This functionality is currently not implemented for this platform", ERROR_NOT_IMPLEMENTED)
 
     if mode == 0:
         click.echo("Running firmware: Non-hitless Reset to Inactive Image")
@@ -1233,14 +1297,12 @@ def run_firmware(port_name, mode):
     elif mode == 3:
         click.echo("Running firmware: Attempt Hitless Reset to Running Image")
     else:
-        click.echo("Running firmware: Unknown mode {}".format(mode))
-        sys.exit(EXIT_FAIL)
+        raise FirmwareError("Running firmware: Unknown mode {}".format(mode))
 
     try:
         status = api.cdb_run_firmware(mode)
     except NotImplementedError:
-        click.echo("This functionality is not applicable for this transceiver")
-        sys.exit(EXIT_FAIL)
+        raise FirmwareError("This functionality is not applicable for this transceiver")
 
     return status
 
@@ -1249,6 +1311,7 @@ def is_fw_switch_done(port_name):
         Make sure the run_firmware cmd is done
         @port_name:
         Returns 1 on success, and exit_code = -1 on failure
+        Raises FirmwareError if the platform doesn't implement the transceiver API
     """
     status = 0
     physical_port = logical_port_to_physical_port_index(port_name)
@@ -1257,8 +1320,7 @@ def is_fw_switch_done(port_name):
     try:
         api = sfp.get_xcvr_api()
     except NotImplementedError:
-        click.echo("This functionality is currently not implemented for this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareError("This functionality is currently not implemented for this platform", ERROR_NOT_IMPLEMENTED)
 
     try:
         MAX_WAIT = 60 # 60s timeout.
@@ -1298,6 +1360,12 @@ def is_fw_switch_done(port_name):
     return status
 
 def commit_firmware(port_name):
+    """
+        Commit the running firmware
+        @port_name:
+        Returns 1 on success
+        Raises FirmwareError if the platform doesn't implement the transceiver API
+    """
     status = 0
     physical_port = logical_port_to_physical_port_index(port_name)
     sfp = platform_chassis.get_sfp(physical_port)
@@ -1305,8 +1373,7 @@ def commit_firmware(port_name):
     try:
         api = sfp.get_xcvr_api()
     except NotImplementedError:
-        click.echo("This functionality is currently not implemented for this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareError("This functionality is currently not implemented for this platform", ERROR_NOT_IMPLEMENTED)
 
     try:
         status = api.cdb_commit_firmware()
@@ -1315,76 +1382,99 @@ def commit_firmware(port_name):
 
     return status
 
-def download_firmware(port_name, filepath):
-    """Download firmware on the transceiver"""
-    try:
-        fd = open(filepath, 'rb')
-        fd.seek(0, 2)
-        file_size = fd.tell()
-        fd.seek(0, 0)
-    except FileNotFoundError:
-        click.echo("Firmware file {} NOT found".format(filepath))
-        sys.exit(EXIT_FAIL)
+class FirmwareDownloadError(FirmwareError):
+    pass
+
 
+def download_firmware_image(port_name, image, progress=None):
+    """
+        Download a firmware image, already read into memory, on the transceiver
+        @port_name:
+        @image: the content of the firmware file
+        @progress: called with the number of bytes written after each block. If
+                   None, the start of the download and a progress bar are displayed
+        Returns the status of the download complete CDB command, 1 on success.
+        Raises FirmwareDownloadError if the download could not be completed
+    """
+    file_size = len(image)
     physical_port = logical_port_to_physical_port_index(port_name)
     sfp = platform_chassis.get_sfp(physical_port)
     try:
         api = sfp.get_xcvr_api()
     except NotImplementedError:
-        click.echo("This functionality is NOT applicable to this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareDownloadError("This functionality is NOT applicable to this platform", ERROR_NOT_IMPLEMENTED)
 
     try:
         fwinfo = api.get_module_fw_mgmt_feature()
         if fwinfo['status'] == True:
             startLPLsize, maxblocksize, lplonly_flag, autopaging_flag, writelength = fwinfo['feature']
         else:
-            click.echo("Failed to fetch CDB Firmware management features")
-            sys.exit(EXIT_FAIL)
+            raise FirmwareDownloadError("Failed to fetch CDB Firmware management features")
     except NotImplementedError:
-        click.echo("This functionality is NOT applicable for this transceiver")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+        raise FirmwareDownloadError("This functionality is NOT applicable for this transceiver", ERROR_NOT_IMPLEMENTED)
 
-    click.echo('CDB: Starting firmware download')
-    startdata = fd.read(startLPLsize)
+    if progress is None:
+        click.echo('CDB: Starting firmware download')
+    startdata = image[:startLPLsize]
     status = api.cdb_start_firmware_download(startLPLsize, startdata, file_size)
     if status != 1:
-        click.echo('CDB: Start firmware download failed - status {}'.format(status))
-        sys.exit(EXIT_FAIL)
+        raise FirmwareDownloadError('CDB: Start firmware download failed - status {}'.format(status))
 
     # Increase the optoe driver's write max to speed up firmware download
     sfp.set_optoe_write_max(SMBUS_BLOCK_WRITE_SIZE)
 
-    with click.progressbar(length=file_size, label="Downloading ...") as bar:
+    def write_blocks(update):
         address = 0
+        offset = startLPLsize
         BLOCK_SIZE = MAX_LPL_FIRMWARE_BLOCK_SIZE if lplonly_flag else maxblocksize
-        remaining = file_size - startLPLsize
-        while remaining > 0:
-            count = BLOCK_SIZE if remaining >= BLOCK_SIZE else remaining
-            data = fd.read(count)
-            if len(data) != count:
-                click.echo("Firmware file read failed!")
-                sys.exit(EXIT_FAIL)
+        while offset < file_size:
+            data = image[offset:offset + BLOCK_SIZE]
+            count = len(data)
 
             if lplonly_flag:
                 status = api.cdb_lpl_block_write(address, data)
             else:
                 status = api.cdb_epl_block_write(address, data, autopaging_flag, writelength)
             if (status != 1):
-                click.echo("CDB: firmware download failed! - status {}".format(status))
-                sys.exit(EXIT_FAIL)
+                raise FirmwareDownloadError("CDB: firmware download failed! - status {}".format(status))
 
-            bar.update(count)
+            update(count)
             address += count
-            remaining -= count
+            offset += count
 
-    # Restore the optoe driver's write max to '1' (default value)
-    sfp.set_optoe_write_max(1)
+    try:
+        if progress is None:
+            with click.progressbar(length=file_size, label="Downloading ...") as bar:
+                write_blocks(bar.update)
+        else:
+            write_blocks(progress)
+    finally:
+        # Restore the optoe driver's write max to '1' (default value)
+        sfp.set_optoe_write_max(1)
 
     status = api.cdb_firmware_download_complete()
-    click.echo('CDB: firmware download complete')
+    if progress is None:
+        click.echo('CDB: firmware download complete')
     return status
 
+def read_firmware_image(filepath):
+    try:
+        with open(filepath, 'rb') as fd:
+            return fd.read()
+    except FileNotFoundError:
+        click.echo("Firmware file {} NOT found".format(filepath))
+        sys.exit(EXIT_FAIL)
+
+def download_firmware(port_name, filepath):
+    """Download firmware on the transceiver"""
+    image = read_firmware_image(filepath)
+
+    try:
+        return download_firmware_image(port_name, image)
+    except FirmwareDownloadError as e:
+        click.echo(str(e))
+        sys.exit(e.exit_code)
+
 # 'run' subcommand
 @firmware.command()
 @click.argument('port_name', required=True, default=None)
@@ -1404,7 +1494,11 @@ def run(port_name, mode):
         click.echo("{}: SFP EEPROM not detected\n".format(port_name))
         sys.exit(EXIT_FAIL)
 
-    status = run_firmware(port_name, int(mode))
+    try:
+        status = run_firmware(port_name, int(mode))
+    except FirmwareError as e:
+        click.echo(str(e))
+        sys.exit(e.exit_code)
     if status != 1:
         click.echo('Failed to run firmware in mode={}! CDB status: {}'.format(mode, status))
         sys.exit(EXIT_FAIL)
@@ -1425,7 +1519,11 @@ def commit(port_name):
         click.echo("{}: SFP EEPROM not detected\n".format(port_name))
         sys.exit(EXIT_FAIL)
 
-    status = commit_firmware(port_name)
+    try:
+        status = commit_firmware(port_name)
+    except FirmwareError as e:
+        click.echo(str(e))
+        sys.exit(e.exit_code)
     if status != 1:
         click.echo('Failed to commit firmware! CDB status: {}'.format(status))
         sys.exit(EXIT_FAIL)
@@ -1459,24 +1557,149 @@ def upgrade(port_name, filepath):
         sys.exit(EXIT_FAIL)
 
     default_mode = 0
-    status = run_firmware(port_name, default_mode)
-    if status != 1:
-        click.echo('Failed to run firmware in mode={} ! CDB status: {}'.format(default_mode, status))
-        sys.exit(EXIT_FAIL)
+    try:
+        status = run_firmware(port_name, default_mode)
+        if status != 1:
+            click.echo('Failed to run firmware in mode={} ! CDB status: {}'.format(default_mode, status))
+            sys.exit(EXIT_FAIL)
 
-    click.echo("Firmware run in mode {} successful".format(default_mode))
+        click.echo("Firmware run in mode {} successful".format(default_mode))
 
-    if is_fw_switch_done(port_name) != 1:
-        click.echo('Failed to switch firmware images!')
-        sys.exit(EXIT_FAIL)
+        if is_fw_switch_done(port_name) != 1:
+            click.echo('Failed to switch firmware images!')
+            sys.exit(EXIT_FAIL)
 
-    status = commit_firmware(port_name)
-    if status != 1:
-        click.echo('Failed to commit firmware! CDB status: {}'.format(status))
-        sys.exit(EXIT_FAIL)
+        status = commit_firmware(port_name)
+        if status != 1:
+            click.echo('Failed to commit firmware! CDB status: {}'.format(status))
+            sys.exit(EXIT_FAIL)
+    except FirmwareError as e:
+        click.echo(str(e))
+        sys.exit(e.exit_code)
 
     click.echo("Firmware commit successful")
 
+def get_firmware_upgrade_ports(port_list):
+    """
+        Filter the logical ports whose transceiver firmware can be upgraded,
+        keeping one logical port per physical port
+    """
+    upgrade_ports = []
+    physical_ports = set()
+    for port_name in port_list:
+        physical_port = logical_port_to_physical_port_index(port_name)
+        if physical_port in physical_ports:
+            continue
+        physical_ports.add(physical_port)
+
+        if is_port_type_rj45(port_name):
+            click.echo("{}: skipped, not applicable for RJ45 port".format(port_name))
+            continue
+
+        if not is_sfp_present(port_name):
+            click.echo("{}: skipped, SFP EEPROM not detected".format(port_name))
+            continue
+
+        upgrade_ports.append(port_name)
+
+    return upgrade_ports
+
+def download_firmware_timed(port_name, image, progress):
+    """Returns (status, error message, seconds taken) of the download"""
+    start = time.time()
+    try:
+        status = download_firmware_image(port_name, image, progress)
+        error = None if status == 1 else "download complete failed, CDB status {}".format(status)
+    except FirmwareDownloadError as e:
+        status = EXIT_FAIL
+        error = str(e)
+    except Exception as e:
+        status = EXIT_FAIL
+        error = repr(e)
+    return status, error, time.time() - start
+
+def activate_firmware(port_name, mode):
+    """
+        Run, check the switch to and commit the firmware downloaded to the transceiver
+        Returns None on success, else the error message
+    """
+    try:
+        if run_firmware(port_name, mode) != 1:
+            return "failed to run firmware in mode={}".format(mode)
+        if is_fw_switch_done(port_name) != 1:
+            return "failed to switch firmware images"
+        if commit_firmware(port_name) != 1:
+            return "failed to commit firmware"
+    except FirmwareError as e:
+        return str(e)
+    except Exception as e:
+        return repr(e)
+    return None
+
+# 'upgrade-all' subcommand
+@firmware.command('upgrade-all')
+@click.argument('filepath', required=True, default=None)
+@click.option('-p', '--ports', metavar='<port_list>', help="Comma separated list of ports to upgrade, all ports if not given")
+@click.option('-w', '--workers', metavar='<num_workers>', type=click.IntRange(1, MAX_FIRMWARE_DOWNLOAD_WORKERS),
+              default=4, show_default=True, help="Number of transceivers to download the firmware to concurrently")
+def upgrade_all(filepath, ports, workers):
+    """Upgrade firmware on many transceivers, downloading to several of them at once"""
+
+    image = read_firmware_image(filepath)
+
+    if ports is None:
+        port_list = platform_sfputil.logical
+    else:
+        port_list = [port.strip() for port in ports.split(',')]
+        for port_name in port_list:
+            if not platform_sfputil.is_logical_port(port_name):
+                click.echo("Error: invalid port '{}'\n".format(port_name))
+                print_all_valid_port_values()
+                sys.exit(ERROR_INVALID_PORT)
+
+    upgrade_ports = get_firmware_upgrade_ports(port_list)
+    if not upgrade_ports:
+        click.echo("No transceiver to upgrade")
+        sys.exit(EXIT_FAIL)
+
+    # The image is read once and shared by all the downloads, which only differ
+    # by the transceiver they write to
+    results = {}
+    bar_lock = threading.Lock()
+    label = "Downloading to {} transceivers ...".format(len(upgrade_ports))
+    with click.progressbar(length=len(image) * len(upgrade_ports), label=label) as bar:
+        def progress(count):
+            with bar_lock:
+                bar.update(count)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(download_firmware_timed, port_name, image, progress): port_name
+                       for port_name in upgrade_ports}
+            for future in concurrent.futures.as_completed(futures):
+                results[futures[future]] = future.result()
+
+    # Switching and committing the image resets the module, so only do it for
+    # the transceivers the new image was fully downloaded to, one at a time
+    body = []
+    rc = EXIT_SUCCESS
+    default_mode = 0
+    for port_name in upgrade_ports:
+        status, error, download_time = results[port_name]
+        start = time.time()
+        if error is None:
+            click.echo("{}: firmware download complete success".format(port_name))
+            error = activate_firmware(port_name, default_mode)
+
+        if error is not None:
+            rc = EXIT_FAIL
+        body.append([port_name,
+                     "OK" if error is None else "Failed: {}".format(error),
+                     "{:.1f}".format(download_time),
+                     "{:.1f}".format(download_time + time.time() - start)])
+
+    click.echo(tabulate(body, headers=['Port', 'Status', 'Download Time (s)', 'Total Time (s)']))
+    sys.exit(rc)
+
 # 'download' subcommand
 @firmware.command()
 @click.argument('port_name', required=True, default=None)
@@ -0,0 +1,75 @@
+"""
+Static index of the lazily loaded 'show' subcommands.
+
+Generated by 'python -m utilities_common.cli_index show' from MODULES:
+edit MODULES and regenerate rather than editing COMMANDS and PLUGINS.
+"""
+
+ROOT = 'show.main:cli'
+
+# Submodules whose top-level commands, or 'submodule:attribute' commands,
+# are added to ROOT
+MODULES = [
+    'acl',
+    'chassis_modules',
+    'dropcounters',
+    'fabric',
+    'feature',
+    'fgnhg',
+    'flow_counters',
+    'gearbox',
+    'interfaces',
+    'kdump',
+    'kube',
+    'muxcable',
+    'nat',
+    'platform',
+    'processes',
+    'reboot_cause',
+    'sflow',
+    'syslog',
+    'system_health',
+    'vlan',
+    'vnet',
+    'vxlan',
+    'warm_restart',
+]
+
+# Command name -> 'module:attribute'
+COMMANDS = {
+    'acl': 'show.acl:acl',
+    'chassis': 'show.chassis_modules:chassis',
+    'dropcounters': 'show.dropcounters:dropcounters',
+    'fabric': 'show.fabric:fabric',
+    'feature': 'show.feature:feature',
+    'fgnhg': 'show.fgnhg:fgnhg',
+    'flowcnt-route': 'show.flow_counters:flowcnt_route',
+    'flowcnt-trap': 'show.flow_counters:flowcnt_trap',
+    'gearbox': 'show.gearbox:gearbox',
+    'interfaces': 'show.interfaces:interfaces',
+    'kdump': 'show.kdump:kdump',
+    'kubernetes': 'show.kube:kubernetes',
+    'muxcable': 'show.muxcable:muxcable',
+    'nat': 'show.nat:nat',
+    'platform': 'show.platform:platform',
+    'processes': 'show.processes:processes',
+    'reboot-cause': 'show.reboot_cause:reboot_cause',
+    'sflow': 'show.sflow:sflow',
+    'syslog': 'show.syslog:syslog',
+    'system-health': 'show.system_health:system_health',
+    'vlan': 'show.vlan:vlan',
+    'vnet': 'show.vnet:vnet',
+    'vxlan': 'show.vxlan:vxlan',
+    'warm_restart': 'show.warm_restart:warm_restart',
+}
+
+# Plugin module -> names of the top-level commands it provides or extends
+PLUGINS = {
+    'show.plugins.auto_techsupport': ['auto-techsupport', 'auto-techsupport-feature', 'history'],
+    'show.plugins.barefoot': ['platform'],
+    'show.plugins.cisco-8000': ['platform'],
+    'show.plugins.mlnx': ['platform'],
+    'show.plugins.nvgre_tunnel': ['nvgre-tunnel', 'nvgre-tunnel-map'],
+    'show.plugins.pbh': ['pbh'],
+    'show.plugins.sonic-passwh_yang': ['passw-hardening'],
+}
@@ -38,31 +38,8 @@ try:
 except KeyError:
     pass
 
-from . import acl
-from . import bgp_common
-from . import chassis_modules
-from . import dropcounters
-from . import fabric
-from . import feature
-from . import fgnhg
-from . import flow_counters
-from . import gearbox
-from . import interfaces
-from . import kdump
-from . import kube
-from . import muxcable
-from . import nat
-from . import platform
-from . import processes
-from . import reboot_cause
-from . import sflow
-from . import vlan
-from . import vnet
-from . import vxlan
-from . import system_health
-from . import warm_restart
+from . import commands_index
 from . import plugins
-from . import syslog
 
 # Global Variables
 PLATFORM_JSON = 'platform.json'
@@ -75,10 +52,12 @@ GEARBOX_TABLE_PHY_PATTERN = r"_GEARBOX_TABLE:phy:*"
 
 COMMAND_TIMEOUT = 300
 
+ROUTING_STACK_CACHE_FILENAME = 'routing_stack'
+
 # To be enhanced. Routing-stack information should be collected from a global
 # location (configdb?), so that we prevent the continous execution of this
 # bash oneliner. To be revisited once routing-stack info is tracked somewhere.
-def get_routing_stack():
+def probe_routing_stack():
     result = None
     command = "sudo docker ps | grep bgp | awk '{print$2}' | cut -d'-' -f3 | cut -d':' -f1 | head -n 1"
 
@@ -91,8 +70,56 @@ def get_routing_stack():
     return result
 
 
-# Global Routing-Stack variable
-routing_stack = get_routing_stack()
+def get_bgp_container_id():
+    """
+    Returns the id and the update time of the bgp container as recorded in
+    STATE_DB, they change each time the container is started.
+    Returns None if they are not recorded.
+    """
+    state_db = SonicV2Connector()
+    state_db.connect(state_db.STATE_DB)
+    entry = state_db.get_all(state_db.STATE_DB, 'FEATURE|bgp')
+    if not entry or not entry.get('container_id'):
+        return None
+    return '{}|{}'.format(entry['container_id'], entry.get('update_time', ''))
+
+
+def get_routing_stack():
+    """
+    Returns the routing stack of the bgp container. It is cached on disk
+    until the container is restarted, so that the docker CLI does not run
+    on every invocation.
+    """
+    try:
+        container_id = get_bgp_container_id()
+    except Exception:
+        container_id = None
+
+    cache_file = None
+    if container_id is not None:
+        try:
+            cache_file = os.path.join(clicommon.UserCache('show').get_directory(), ROUTING_STACK_CACHE_FILENAME)
+            with open(cache_file) as f:
+                cache = json.load(f)
+            if cache.get('container_id') == container_id:
+                return cache['routing_stack']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    result = probe_routing_stack()
+
+    if cache_file is not None and result:
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump({'container_id': container_id, 'routing_stack': result}, f)
+        except OSError:
+            pass
+
+    return result
+
+
+# Global Routing-Stack variable, evaluated by the commands which need it
+routing_stack = lazy_object_proxy.Proxy(get_routing_stack)
 
 # Read given JSON file
 def readJsonFile(fileName):
@@ -255,7 +282,7 @@ CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help', '-?'])
 
 # This is our entrypoint - the main "show" command
 # TODO: Consider changing function name to 'show' for better understandability
-@click.group(cls=clicommon.AliasedGroup, context_settings=CONTEXT_SETTINGS)
+@click.group(cls=clicommon.LazyAliasedGroup, context_settings=CONTEXT_SETTINGS)
 @click.pass_context
 def cli(ctx):
     """SONiC command line - 'show' command"""
@@ -265,37 +292,9 @@ def cli(ctx):
     ctx.obj = Db()
 
 
-# Add groups from other modules
-cli.add_command(acl.acl)
-cli.add_command(chassis_modules.chassis)
-cli.add_command(dropcounters.dropcounters)
-cli.add_command(fabric.fabric)
-cli.add_command(feature.feature)
-cli.add_command(fgnhg.fgnhg)
-cli.add_command(flow_counters.flowcnt_route)
-cli.add_command(flow_counters.flowcnt_trap)
-cli.add_command(kdump.kdump)
-cli.add_command(interfaces.interfaces)
-cli.add_command(kdump.kdump)
-cli.add_command(kube.kubernetes)
-cli.add_command(muxcable.muxcable)
-cli.add_command(nat.nat)
-cli.add_command(platform.platform)
-cli.add_command(processes.processes)
-cli.add_command(reboot_cause.reboot_cause)
-cli.add_command(sflow.sflow)
-cli.add_command(vlan.vlan)
-cli.add_command(vnet.vnet)
-cli.add_command(vxlan.vxlan)
-cli.add_command(system_health.system_health)
-cli.add_command(warm_restart.warm_restart)
-
-# syslog module
-cli.add_command(syslog.syslog)
-
+# Add groups from other modules, their module is imported on first use.
 # Add greabox commands only if GEARBOX is configured
-if is_gearbox_configured():
-    cli.add_command(gearbox.gearbox)
+cli.add_lazy_commands(commands_index.COMMANDS, conditions={'gearbox': is_gearbox_configured})
 
 
 #
@@ -962,7 +961,7 @@ def route_map(route_map_name, verbose):
 #
 
 # This group houses IP (i.e., IPv4) commands and subgroups
-@cli.group(cls=clicommon.AliasedGroup)
+@cli.group(cls=clicommon.LazyAliasedGroup)
 def ip():
     """Show IP (IPv4) commands"""
     pass
@@ -1031,6 +1030,7 @@ def loopback_action():
 def route(args, namespace, display, verbose):
     """Show IP (IPv4) routing table"""
     # Call common handler to handle the show ip route cmd
+    from . import bgp_common
     bgp_common.show_routes(args, namespace, display, verbose, "ip")
 
 #
@@ -1076,7 +1076,7 @@ def fib(ipaddress, verbose):
 #
 
 # This group houses IPv6-related commands and subgroups
-@cli.group(cls=clicommon.AliasedGroup)
+@cli.group(cls=clicommon.LazyAliasedGroup)
 def ipv6():
     """Show IPv6 commands"""
     pass
@@ -1130,6 +1130,7 @@ def interfaces(namespace, display):
 def route(args, namespace, display, verbose):
     """Show IPv6 routing table"""
     # Call common handler to handle the show ipv6 route cmd
+    from . import bgp_common
     bgp_common.show_routes(args, namespace, display, verbose, "ipv6")
 
 
@@ -1143,18 +1144,33 @@ def protocol(verbose):
 
 #
 # Inserting BGP functionality into cli's show parse-chain.
-# BGP commands are determined by the routing-stack being elected.
+# BGP commands are determined by the routing-stack being elected, which is
+# only looked up once they are used.
+# A bgp command which was added explicitly, e.g. by the unit tests, is kept
+# and the routing-stack is not looked up for it.
 #
-if routing_stack == "quagga":
-    from .bgp_quagga_v4 import bgp
-    ip.add_command(bgp)
-    from .bgp_quagga_v6 import bgp
-    ipv6.add_command(bgp)
-elif routing_stack == "frr":
-    from .bgp_frr_v4 import bgp
-    ip.add_command(bgp)
-    from .bgp_frr_v6 import bgp
-    ipv6.add_command(bgp)
+def add_ip_bgp_commands():
+    if ip.commands.is_loaded('bgp'):
+        return
+    if routing_stack == "quagga":
+        from .bgp_quagga_v4 import bgp
+        ip.add_command(bgp)
+    elif routing_stack == "frr":
+        from .bgp_frr_v4 import bgp
+        ip.add_command(bgp)
+
+def add_ipv6_bgp_commands():
+    if ipv6.commands.is_loaded('bgp'):
+        return
+    if routing_stack == "quagga":
+        from .bgp_quagga_v6 import bgp
+        ipv6.add_command(bgp)
+    elif routing_stack == "frr":
+        from .bgp_frr_v6 import bgp
+        ipv6.add_command(bgp)
+
+ip.add_lazy_plugin(['bgp'], add_ip_bgp_commands)
+ipv6.add_lazy_plugin(['bgp'], add_ipv6_bgp_commands)
 
 #
 # 'link-local-mode' subcommand ("show ipv6 link-local-mode")
@@ -1289,6 +1305,7 @@ def version(verbose):
     """Show version information"""
     version_info = device_info.get_sonic_version_info()
     platform_info = device_info.get_platform_info()
+    from . import platform
     chassis_info = platform.get_chassis_info()
 
     sys_uptime_cmd = "uptime"
@@ -2107,7 +2124,7 @@ def suppress_pending_fib(db):
 
 # Load plugins and register them
 helper = util_base.UtilHelper()
-helper.load_and_register_plugins(plugins, cli)
+helper.load_and_register_plugins_lazily(plugins, cli, commands_index.PLUGINS)
 
 if __name__ == '__main__':
     cli()
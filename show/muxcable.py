@@ -9,7 +9,7 @@ import utilities_common.cli as clicommon
 from natsort import natsorted
 from collections import OrderedDict
 from operator import itemgetter
-from sonic_py_common import multi_asic
+from sonic_py_common import logger, multi_asic
 from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
 from swsscommon import swsscommon
 from tabulate import tabulate
@@ -18,9 +18,14 @@ from utilities_common.general import get_optional_value_for_key_in_config_tbl
 
 platform_sfputil = None
 
+SYSLOG_IDENTIFIER = "show_muxcable"
+
+log = logger.Logger(SYSLOG_IDENTIFIER)
+
 REDIS_TIMEOUT_MSECS = 0
 SELECT_TIMEOUT = 1000
 HWMODE_MUXDIRECTION_TIMEOUT = 0.5
+HWMODE_SWITCHMODE_TIMEOUT = 1
 
 # The empty namespace refers to linux host namespace.
 EMPTY_NAMESPACE = ''
@@ -248,8 +253,26 @@ def get_event_logs(port, res_dict, mux_info_dict):
     return mux_info_dict
 
 def get_result(port, res_dict, cmd ,result, table_name):
+
+    logical_port_list = platform_sfputil_helper.get_logical_list()
+    if port not in logical_port_list:
+        click.echo("ERR: This is not a valid port, valid ports ({})".format(", ".join(logical_port_list)))
+        rc = EXIT_FAIL
+        res_dict[1] = rc
+        return result
+
+    port_result = get_result_multi_port([port], table_name)
+    if port not in port_result:
+        rc = CONFIG_FAIL
+        res_dict[1] = rc
+        return result
+
+    return port_result[port]
+
+def get_result_multi_port(ports, table_name):
     state_db = {}
     xcvrd_show_fw_res_tbl = {}
+    result = {}
 
     namespaces = multi_asic.get_front_end_namespaces()
     for namespace in namespaces:
@@ -257,44 +280,66 @@ def get_result(port, res_dict, cmd ,result, table_name):
         state_db[asic_id] = db_connect("STATE_DB", namespace)
         xcvrd_show_fw_res_tbl[asic_id] = swsscommon.Table(state_db[asic_id], table_name)
 
+    for port in ports:
+        asic_index = None
+        if platform_sfputil is not None:
+            asic_index = platform_sfputil_helper.get_asic_id_for_logical_port(port)
+        if asic_index is None:
+            # TODO this import is only for unit test purposes, and should be removed once sonic_platform_base
+            # is fully mocked
+            import sonic_platform_base.sonic_sfp.sfputilhelper
+            asic_index = sonic_platform_base.sonic_sfp.sfputilhelper.SfpUtilHelper().get_asic_id_for_logical_port(port)
+            if asic_index is None:
+                click.echo("Got invalid asic index for port {}, cant retreive mux status".format(port))
+                continue
+
+        (status, fvp) = xcvrd_show_fw_res_tbl[asic_index].get(port)
+        result[port] = dict(fvp)
+
+    delete_all_keys_in_db_table("STATE_DB", table_name)
+
+    return result
+
+def update_and_get_response_for_xcvr_cmd(cmd_name, rsp_name, exp_rsp, cmd_table_name, cmd_arg_table_name, rsp_table_name , res_table_name, port, cmd_timeout_secs, param_dict= None, arg=None):
+
     logical_port_list = platform_sfputil_helper.get_logical_list()
     if port not in logical_port_list:
         click.echo("ERR: This is not a valid port, valid ports ({})".format(", ".join(logical_port_list)))
-        rc = EXIT_FAIL
-        res_dict[1] = rc
-        return result
+        return {0: CONFIG_FAIL, 1: 'unknown'}
 
-    asic_index = None
-    if platform_sfputil is not None:
-        asic_index = platform_sfputil_helper.get_asic_id_for_logical_port(port)
-    if asic_index is None:
-        # TODO this import is only for unit test purposes, and should be removed once sonic_platform_base
-        # is fully mocked
-        import sonic_platform_base.sonic_sfp.sfputilhelper
-        asic_index = sonic_platform_base.sonic_sfp.sfputilhelper.SfpUtilHelper().get_asic_id_for_logical_port(port)
-        if asic_index is None:
-            click.echo("Got invalid asic index for port {}, cant retreive mux status".format(port))
-            rc = CONFIG_FAIL
-            res_dict[1] = rc
-            return result
+    # A single port used to be given at least one full select period to answer,
+    # however short cmd_timeout_secs is, so keep that wait for single-port callers
+    cmd_timeout_secs = max(cmd_timeout_secs, SELECT_TIMEOUT / 1000.0)
 
-    (status, fvp) = xcvrd_show_fw_res_tbl[asic_index].get(port)
-    res_dir = dict(fvp)
+    port_res_dict, _ = update_and_get_response_for_xcvr_cmd_multi_port(
+        cmd_name, rsp_name, cmd_table_name, cmd_arg_table_name, rsp_table_name, res_table_name, [port],
+        cmd_timeout_secs, param_dict, arg)
 
-    delete_all_keys_in_db_table("STATE_DB", table_name)
+    return port_res_dict[port]
 
-    return res_dir
 
-def update_and_get_response_for_xcvr_cmd(cmd_name, rsp_name, exp_rsp, cmd_table_name, cmd_arg_table_name, rsp_table_name , res_table_name, port, cmd_timeout_secs, param_dict= None, arg=None):
+def update_and_get_response_for_xcvr_cmd_multi_port(cmd_name, rsp_name, cmd_table_name, cmd_arg_table_name, rsp_table_name, res_table_name, ports, cmd_timeout_secs, param_dict=None, arg=None):
+    """
+    Post cmd_name to xcvrd for all the given ports at once, then collect the responses
+    as they arrive on the response table until every port answered or cmd_timeout_secs,
+    the deadline for the whole batch, expired.
 
-    res_dict = {}
+    Returns a dict of port -> res_dict, where res_dict[0] is the rc and res_dict[1] the
+    rsp_name field of the response, or 'unknown', and a dict of port -> the seconds
+    xcvrd took to answer that port, or None if it did not answer in time.
+    """
+
+    port_res_dict = {}
+    port_latency_dict = {}
     state_db, appl_db = {}, {}
     firmware_rsp_tbl, firmware_rsp_tbl_keys = {}, {}
     firmware_rsp_sub_tbl = {}
     firmware_cmd_tbl = {}
     firmware_cmd_arg_tbl = {}
 
-    CMD_TIMEOUT_SECS = cmd_timeout_secs
+    for port in ports:
+        port_res_dict[port] = {0: CONFIG_FAIL, 1: 'unknown'}
+        port_latency_dict[port] = None
 
     time_start = time.time()
 
@@ -316,56 +361,44 @@ def update_and_get_response_for_xcvr_cmd(cmd_name, rsp_name, exp_rsp, cmd_table_
             firmware_rsp_tbl[asic_id]._del(key)
         sel.addSelectable(firmware_rsp_sub_tbl[asic_id])
 
-    rc = CONFIG_FAIL
-    res_dict[0] = CONFIG_FAIL
-    res_dict[1] = 'unknown'
-
-    logical_port_list = platform_sfputil_helper.get_logical_list()
-    if port not in logical_port_list:
-        click.echo("ERR: This is not a valid port, valid ports ({})".format(", ".join(logical_port_list)))
-        res_dict[0] = rc
-        return res_dict
-
-    asic_index = None
-    if platform_sfputil is not None:
-        asic_index = platform_sfputil_helper.get_asic_id_for_logical_port(port)
-    if asic_index is None:
-        # TODO this import is only for unit test purposes, and should be removed once sonic_platform_base
-        # is fully mocked
-        import sonic_platform_base.sonic_sfp.sfputilhelper
-        asic_index = sonic_platform_base.sonic_sfp.sfputilhelper.SfpUtilHelper().get_asic_id_for_logical_port(port)
-        if asic_index is None:
-            click.echo("Got invalid asic index for port {}, cant perform firmware cmd".format(port))
-            res_dict[0] = rc
-            return res_dict
-
     if arg is None:
         cmd_arg = "null"
     else:
         cmd_arg = str(arg)
 
-    if param_dict is not None:
-        for key, value in param_dict.items():
-            fvs = swsscommon.FieldValuePairs([(str(key), str(value))])
-            firmware_cmd_arg_tbl[asic_index].set(port, fvs)
+    # Write the command for every port before waiting on any response, so xcvrd
+    # can work through all of them while we demultiplex the answers
+    cmd_time = {}
+    for port in ports:
+        asic_index = None
+        if platform_sfputil is not None:
+            asic_index = platform_sfputil_helper.get_asic_id_for_logical_port(port)
+        if asic_index is None:
+            # TODO this import is only for unit test purposes, and should be removed once sonic_platform_base
+            # is fully mocked
+            import sonic_platform_base.sonic_sfp.sfputilhelper
+            asic_index = sonic_platform_base.sonic_sfp.sfputilhelper.SfpUtilHelper().get_asic_id_for_logical_port(port)
+            if asic_index is None:
+                click.echo("Got invalid asic index for port {}, cant perform firmware cmd".format(port))
+                continue
 
-    fvs = swsscommon.FieldValuePairs([(cmd_name, cmd_arg)])
-    firmware_cmd_tbl[asic_index].set(port, fvs)
+        if param_dict is not None:
+            for key, value in param_dict.items():
+                fvs = swsscommon.FieldValuePairs([(str(key), str(value))])
+                firmware_cmd_arg_tbl[asic_index].set(port, fvs)
 
-    # Listen indefinitely for changes to the HW_MUX_CABLE_TABLE in the Application DB's
-    while True:
-        # Use timeout to prevent ignoring the signals we want to handle
-        # in signal_handler() (e.g. SIGTERM for graceful shutdown)
+        fvs = swsscommon.FieldValuePairs([(cmd_name, cmd_arg)])
+        firmware_cmd_tbl[asic_index].set(port, fvs)
+        cmd_time[port] = time.time()
 
-        (state, selectableObj) = sel.select(SELECT_TIMEOUT)
+    while cmd_time:
+        time_left = cmd_timeout_secs - (time.time() - time_start)
+        if time_left <= 0:
+            break
 
-        time_now = time.time()
-        time_diff = time_now - time_start
-        if time_diff >= CMD_TIMEOUT_SECS:
-            return res_dict
+        (state, selectableObj) = sel.select(min(SELECT_TIMEOUT, int(time_left * 1000) + 1))
 
         if state == swsscommon.Select.TIMEOUT:
-            # Do not flood log when select times out
             continue
         if state != swsscommon.Select.OBJECT:
             click.echo("sel.select() did not  return swsscommon.Select.OBJECT for sonic_y_cable updates")
@@ -380,44 +413,29 @@ def update_and_get_response_for_xcvr_cmd(cmd_name, rsp_name, exp_rsp, cmd_table_
 
         (port_m, op_m, fvp_m) = firmware_rsp_sub_tbl[asic_index].pop()
 
-        if not port_m:
-            click.echo("Did not receive a port response {}".format(port))
-            res_dict[1] = 'unknown'
-            res_dict[0] = CONFIG_FAIL
-            firmware_rsp_tbl[asic_index]._del(port)
-            break
-
-        if port_m != port:
-
-            res_dict[1] = 'unknown'
-            res_dict[0] = CONFIG_FAIL
-            firmware_rsp_tbl[asic_index]._del(port)
+        # Only a SET is an answer, a DEL comes from clearing stale responses
+        if op_m != "SET" or port_m not in cmd_time:
             continue
 
+        res_dict = port_res_dict[port_m]
+        port_latency_dict[port_m] = time.time() - cmd_time.pop(port_m)
         if fvp_m:
-
             fvp_dict = dict(fvp_m)
             if rsp_name in fvp_dict:
-                # check if xcvrd got a probe command
-                result = fvp_dict[rsp_name]
-
-                res_dict[1] = result
+                res_dict[1] = fvp_dict[rsp_name]
                 res_dict[0] = 0
-            else:
-                res_dict[1] = 'unknown'
-                res_dict[0] = CONFIG_FAIL
-            firmware_rsp_tbl[asic_index]._del(port)
-            break
-        else:
-            res_dict[1] = 'unknown'
-            res_dict[0] = CONFIG_FAIL
-            firmware_rsp_tbl[asic_index]._del(port)
-            break
+        firmware_rsp_tbl[asic_index]._del(port_m)
 
+    for port in ports:
+        latency = port_latency_dict[port]
+        if latency is None:
+            log.log_notice("No {} response from xcvrd for port {} within {}s".format(cmd_name, port, cmd_timeout_secs))
+        else:
+            log.log_info("Got {} response from xcvrd for port {} in {:.3f}s".format(cmd_name, port, latency))
 
     delete_all_keys_in_db_tables_helper(cmd_table_name, rsp_table_name, cmd_arg_table_name, None)
 
-    return res_dict
+    return port_res_dict, port_latency_dict
 
 
 def delete_all_keys_in_db_tables_helper(cmd_table_name, rsp_table_name, cmd_arg_table_name = None, res_table_name = None):
@@ -1278,6 +1296,34 @@ def get_hwmode_mux_direction_port(db, port):
     return res_dict
 
 
+def get_hwmode_mux_direction_ports(db, ports):
+    """
+    Same as get_hwmode_mux_direction_port(), for many ports with a single request
+    to xcvrd. Returns a dict of port -> res_dict.
+    """
+
+    port_res_dict = {}
+    if not ports:
+        return port_res_dict
+
+    # xcvrd still answers one port at a time, so the deadline for the batch is
+    # the per-port timeout times the number of ports
+    rsp_dict, _ = update_and_get_response_for_xcvr_cmd_multi_port(
+        "state", "state", "XCVRD_SHOW_HWMODE_DIR_CMD", "XCVRD_SHOW_HWMODE_DIR_RES", "XCVRD_SHOW_HWMODE_DIR_RSP", None, ports, HWMODE_MUXDIRECTION_TIMEOUT * len(ports), None, "probe")
+
+    result_dict = get_result_multi_port(ports, "XCVRD_SHOW_HWMODE_DIR_RES")
+
+    for port in ports:
+        res_dict = rsp_dict[port]
+        res_dict[2] = result_dict.get(port, {}).get("presence", "unknown")
+        port_res_dict[port] = res_dict
+
+    delete_all_keys_in_db_table("APPL_DB", "XCVRD_SHOW_HWMODE_DIR_CMD")
+    delete_all_keys_in_db_table("STATE_DB", "XCVRD_SHOW_HWMODE_DIR_RSP")
+
+    return port_res_dict
+
+
 def create_active_active_mux_direction_json_result(result, port, db):
 
     port = platform_sfputil_helper.get_interface_alias(port, db)
@@ -1292,9 +1338,10 @@ def create_active_active_mux_direction_json_result(result, port, db):
 
     return rc
 
-def create_active_standby_mux_direction_json_result(result, port, db):
+def create_active_standby_mux_direction_json_result(result, port, db, res_dict=None):
 
-    res_dict = get_hwmode_mux_direction_port(db, port)
+    if res_dict is None:
+        res_dict = get_hwmode_mux_direction_port(db, port)
     port = platform_sfputil_helper.get_interface_alias(port, db)
     result["HWMODE"][port] = {}
     result["HWMODE"][port]["Direction"] = res_dict[1]
@@ -1320,9 +1367,10 @@ def create_active_active_mux_direction_result(body, port, db):
 
     return rc
 
-def create_active_standby_mux_direction_result(body, port, db):
+def create_active_standby_mux_direction_result(body, port, db, res_dict=None):
 
-    res_dict = get_hwmode_mux_direction_port(db, port)
+    if res_dict is None:
+        res_dict = get_hwmode_mux_direction_port(db, port)
 
     temp_list = []
     port = platform_sfputil_helper.get_interface_alias(port, db)
@@ -1404,6 +1452,7 @@ def muxdirection(db, port, json_output):
         rc_exit = EXIT_SUCCESS
         body = []
         active_active = False
+        port_cable_types = []
         if json_output:
             result = {}
             result ["HWMODE"] = {}
@@ -1437,19 +1486,26 @@ def muxdirection(db, port, json_output):
             
             asic_index = get_asic_index_for_port(port)
             cable_type = get_optional_value_for_key_in_config_tbl(per_npu_configdb[asic_index], port, "cable_type", "MUX_CABLE")
+            port_cable_types.append((port, cable_type))
+
+        # Query xcvrd for all the active-standby ports in one go instead of port by port
+        hwmode_dir_dict = get_hwmode_mux_direction_ports(
+            db, [port for port, cable_type in port_cable_types if cable_type != "active-active"])
+
+        for port, cable_type in port_cable_types:
             if json_output:
                 if cable_type == "active-active":
                     rc = create_active_active_mux_direction_json_result(result, port, db)
                     active_active = True
                 else:
-                    rc = create_active_standby_mux_direction_json_result(result, port, db)
+                    rc = create_active_standby_mux_direction_json_result(result, port, db, hwmode_dir_dict[port])
 
             else:
                 if cable_type == 'active-active':
                     rc = create_active_active_mux_direction_result(body, port, db)
                     active_active = True
                 else:
-                    rc = create_active_standby_mux_direction_result(body, port, db)
+                    rc = create_active_standby_mux_direction_result(body, port, db, hwmode_dir_dict[port])
 
             if rc != 0:
                 rc_exit = EXIT_FAIL
@@ -1489,7 +1545,7 @@ def switchmode(db, port):
         res_dict[0] = CONFIG_FAIL
         res_dict[1] = "unknown"
         res_dict = update_and_get_response_for_xcvr_cmd(
-            "state", "state", "True", "XCVRD_SHOW_HWMODE_SWMODE_CMD", None, "XCVRD_SHOW_HWMODE_SWMODE_RSP", None, port, 1, None, "probe")
+            "state", "state", "True", "XCVRD_SHOW_HWMODE_SWMODE_CMD", None, "XCVRD_SHOW_HWMODE_SWMODE_RSP", None, port, HWMODE_SWITCHMODE_TIMEOUT, None, "probe")
 
         body = []
         temp_list = []
@@ -1513,6 +1569,7 @@ def switchmode(db, port):
 
         rc_exit = True
         body = []
+        switchmode_ports = []
 
         for port in logical_port_list:
 
@@ -1540,12 +1597,17 @@ def switchmode(db, port):
             if port != logical_port_list_per_port[0]:
                 continue
 
+            switchmode_ports.append(port)
+
+        port_res_dict = {}
+        if switchmode_ports:
+            port_res_dict, _ = update_and_get_response_for_xcvr_cmd_multi_port(
+                "state", "state", "XCVRD_SHOW_HWMODE_SWMODE_CMD", None, "XCVRD_SHOW_HWMODE_SWMODE_RSP", None,
+                switchmode_ports, HWMODE_SWITCHMODE_TIMEOUT * len(switchmode_ports), None, "probe")
+
+        for port in switchmode_ports:
             temp_list = []
-            res_dict = {}
-            res_dict[0] = CONFIG_FAIL
-            res_dict[1] = "unknown"
-            res_dict = update_and_get_response_for_xcvr_cmd(
-                "state", "state", "True", "XCVRD_SHOW_HWMODE_SWMODE_CMD", None, "XCVRD_SHOW_HWMODE_SWMODE_RSP", None, port, 1, None, "probe")
+            res_dict = port_res_dict[port]
             port = platform_sfputil_helper.get_interface_alias(port, db)
             temp_list.append(port)
             temp_list.append(res_dict[1])
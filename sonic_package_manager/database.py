@@ -12,6 +12,7 @@ from sonic_package_manager.version import Version
 BASE_LIBRARY_PATH = '/var/lib/sonic-package-manager/'
 PACKAGE_MANAGER_DB_FILE_PATH = os.path.join(BASE_LIBRARY_PATH, 'packages.json')
 PACKAGE_MANAGER_LOCK_FILE = os.path.join(BASE_LIBRARY_PATH, '.lock')
+PACKAGE_METADATA_CACHE_PATH = os.path.join(BASE_LIBRARY_PATH, 'metadata-cache')
 
 
 @dataclass(order=True)
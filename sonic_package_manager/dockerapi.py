@@ -126,11 +126,21 @@ class DockerApi:
     def load(self, imgpath: str):
         """ Docker 'load' command.
         Args:
-
+            imgpath: path to image tarball
         """
 
         log.debug(f'loading image from {imgpath}')
 
+        with open(imgpath, 'rb') as imagefile:
+            return self.load_stream(imagefile)
+
+    def load_stream(self, data):
+        """ Docker 'load' command reading the image tarball from a stream,
+        so the image does not have to be stored on disk first.
+        Args:
+            data: file object or iterable of bytes chunks
+        """
+
         api = self.client.api
         progress_manager = self.progress_manager
 
@@ -138,23 +148,22 @@ class DockerApi:
         repotag = None
 
         with progress_manager or contextlib.nullcontext():
-            with open(imgpath, 'rb') as imagefile:
-                for line in api.load_image(imagefile, quiet=False):
-                    log.debug(f'pull status: {line}')
-
-                    if progress_manager:
-                        process_progress(progress_manager, line)
-
-                    if 'stream' not in line:
-                        continue
-
-                    stream = line['stream']
-                    repotag_match = re.match(r'Loaded image: (?P<repotag>.*)\n', stream)
-                    if repotag_match:
-                        repotag = repotag_match.groupdict()['repotag']
-                    imageid_match = re.match(r'Loaded image ID: sha256:(?P<id>.*)\n', stream)
-                    if imageid_match:
-                        imageid = imageid_match.groupdict()['id']
+            for line in api.load_image(data, quiet=False):
+                log.debug(f'pull status: {line}')
+
+                if progress_manager:
+                    process_progress(progress_manager, line)
+
+                if 'stream' not in line:
+                    continue
+
+                stream = line['stream']
+                repotag_match = re.match(r'Loaded image: (?P<repotag>.*)\n', stream)
+                if repotag_match:
+                    repotag = repotag_match.groupdict()['repotag']
+                imageid_match = re.match(r'Loaded image ID: sha256:(?P<id>.*)\n', stream)
+                if imageid_match:
+                    imageid = imageid_match.groupdict()['id']
 
         imagename = repotag if repotag else imageid
         log.debug(f'Loaded image {imagename}')
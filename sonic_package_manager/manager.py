@@ -1,16 +1,17 @@
 #!/usr/bin/env python
 
+import concurrent.futures
 import contextlib
 import functools
 import os
 import pkgutil
-import tempfile
 import yang as ly
 from inspect import signature
 from typing import Any, Iterable, List, Callable, Dict, Optional
 
 import docker
 import filelock
+from toposort import toposort_flatten, CircularDependencyError
 from config import config_mgmt
 from sonic_py_common import device_info
 
@@ -23,6 +24,7 @@ from sonic_package_manager.constraint import (
 )
 from sonic_package_manager.database import (
     PACKAGE_MANAGER_LOCK_FILE,
+    PACKAGE_METADATA_CACHE_PATH,
     PackageDatabase
 )
 from sonic_package_manager.dockerapi import DockerApi
@@ -38,7 +40,7 @@ from sonic_package_manager.errors import (
     PackageUpgradeError
 )
 from sonic_package_manager.logger import log
-from sonic_package_manager.metadata import MetadataResolver
+from sonic_package_manager.metadata import MetadataCache, MetadataResolver
 from sonic_package_manager.package import Package
 from sonic_package_manager.progress import ProgressManager
 from sonic_package_manager.reference import PackageReference
@@ -53,6 +55,7 @@ from sonic_package_manager.service_creator.sonic_db import (
 from sonic_package_manager.service_creator.utils import in_chroot
 from sonic_package_manager.source import (
     PackageSource,
+    DockerSource,
     LocalSource,
     RegistrySource,
     TarballSource
@@ -64,6 +67,10 @@ from sonic_package_manager.version import (
 )
 
 
+# Number of package images transferred at once during migration.
+MIGRATION_IMAGE_TRANSFER_WORKERS = 4
+
+
 @contextlib.contextmanager
 def failure_ignore(ignore: bool):
     """ Ignores failures based on parameter passed. """
@@ -260,6 +267,27 @@ def validate_package_tree(packages: Dict[str, Package]):
                                                         constraint, component_version)
 
 
+def get_installation_order(packages: Dict[str, Package]) -> List[str]:
+    """ Order package names so that each package comes after the packages
+    it depends on among the ones passed to this function.
+    Args:
+        packages: packages to order
+    Returns:
+        List of package names
+    """
+
+    graph = {}
+    for name, package in packages.items():
+        graph[name] = {dependency.name for dependency in package.manifest['package']['depends']
+                       if dependency.name in packages}
+
+    try:
+        return toposort_flatten(graph)
+    except CircularDependencyError as err:
+        log.warning(f'circular dependency between packages, installing in database order: {err}')
+        return list(packages)
+
+
 def validate_package_cli_can_be_skipped(package: Package, skip: bool):
     """ Checks whether package CLI installation can be skipped.
 
@@ -352,6 +380,9 @@ class PackageManager:
         """
 
         source = self.get_package_source(expression, repotag, tarball)
+        self._install_or_upgrade_from_source(source, **kwargs)
+
+    def _install_or_upgrade_from_source(self, source: PackageSource, **kwargs):
         package = source.get_package()
 
         if self.is_installed(package.name):
@@ -681,9 +712,20 @@ class PackageManager:
 
         self._migrate_package_database(old_package_database)
 
+        source_docker = None
+        if dockerd_sock:
+            # dockerd_sock is defined, so use docked_sock to connect to
+            # dockerd and fetch package images from it.
+            source_docker = DockerApi(docker.DockerClient(base_url=f'unix://{dockerd_sock}'))
+            # Images are loaded concurrently, which the progress bars do not support.
+            target_docker = DockerApi(self.docker.client)
+
+        # Package name -> PackageSource to install from.
+        migrations = {}
+
         def migrate_package(old_package_entry,
                             new_package_entry):
-            """ Migrate package routine
+            """ Select the source to migrate package from
 
             Args:
                 old_package_entry: Entry in old package database.
@@ -694,25 +736,16 @@ class PackageManager:
             version = new_package_entry.version
 
             if dockerd_sock:
-                # dockerd_sock is defined, so use docked_sock to connect to
-                # dockerd and fetch package image from it.
                 log.info(f'installing {name} from old docker library')
-                docker_api = DockerApi(docker.DockerClient(base_url=f'unix://{dockerd_sock}'))
-
-                image = docker_api.get_image(old_package_entry.image_id)
-
-                with tempfile.NamedTemporaryFile('wb') as file:
-                    for chunk in image.save(named=True):
-                        file.write(chunk)
-                    file.flush()
-
-                    self.install(tarball=file.name)
+                migrations[name] = DockerSource(source_docker,
+                                                old_package_entry.image_id,
+                                                self.database,
+                                                target_docker,
+                                                self.metadata_resolver)
             else:
                 log.info(f'installing {name} version {version}')
+                migrations[name] = self.get_package_source(f'{name}={version}')
 
-                self.install(f'{name}={version}')
-
-        # TODO: Topological sort packages by their dependencies first.
         for old_package in old_package_database:
             if not old_package.installed or old_package.built_in:
                 continue
@@ -743,7 +776,7 @@ class PackageManager:
                     new_package.version = old_package.version
                     migrate_package(old_package, new_package)
                 else:
-                    self.install(f'{new_package.name}={new_package_default_version}')
+                    migrations[new_package.name] = package_source
             else:
                 # No default version and package is not installed.
                 # Migrate old package same version.
@@ -752,6 +785,23 @@ class PackageManager:
 
             self.database.commit()
 
+        # Images streamed from the old docker library are transferred concurrently,
+        # ahead of the installation. Installation itself updates the package database,
+        # services and CLI plugins, so it is done one package at a time, each after
+        # the packages it depends on.
+        packages = {name: source.get_package() for name, source in migrations.items()}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MIGRATION_IMAGE_TRANSFER_WORKERS) as executor:
+            transfers = {}
+            for name, source in migrations.items():
+                if isinstance(source, DockerSource):
+                    transfers[name] = executor.submit(source.install_image, packages[name])
+
+            for name in get_installation_order(packages):
+                if name in transfers:
+                    transfers[name].result()
+                self._install_or_upgrade_from_source(migrations[name])
+
     def get_installed_package(self, name: str) -> Package:
         """ Get installed package by name.
 
@@ -1005,7 +1055,9 @@ class PackageManager:
 
         docker_api = DockerApi(docker.from_env(), ProgressManager())
         registry_resolver = RegistryResolver()
-        metadata_resolver = MetadataResolver(docker_api, registry_resolver)
+        metadata_resolver = MetadataResolver(docker_api,
+                                             registry_resolver,
+                                             MetadataCache(PACKAGE_METADATA_CACHE_PATH))
         cfg_mgmt = config_mgmt.ConfigMgmt(source=INIT_CFG_JSON, sonicYangOptions=ly.LY_CTX_DISABLE_SEARCHDIR_CWD)
         cli_generator = CliGenerator(log)
         feature_registry = FeatureRegistry(SonicDB)
@@ -2,9 +2,14 @@
 
 from dataclasses import dataclass, field
 
+import contextlib
+import hashlib
 import json
+import os
+import re
 import tarfile
-from typing import Dict, List
+import tempfile
+from typing import Dict, List, Optional
 
 from sonic_package_manager import utils
 from sonic_package_manager.errors import MetadataError
@@ -48,6 +53,91 @@ def translate_plain_to_tree(plain: Dict[str, str], sep='.') -> Dict:
     return res
 
 
+def is_digest(reference: str) -> bool:
+    """ Returns True if reference is a content digest, e.g. "sha256:<hex>". """
+
+    return re.fullmatch(r'sha256:[0-9a-f]{64}', reference) is not None
+
+
+def has_digest(data: bytes, digest: str) -> bool:
+    """ Returns True if data hashes to digest, so that it
+    can be cached under that digest. """
+
+    return is_digest(digest) and hashlib.sha256(data).hexdigest() == digest.split(':', 1)[1]
+
+
+def find_tar_member(tar: tarfile.TarFile, name: str) -> Optional[tarfile.TarInfo]:
+    """ Find member by name in tarball reading member headers
+    only until the member is found, unlike TarFile.getmember()
+    which reads the whole tarball index first.
+
+    Args:
+        tar: Opened tarball.
+        name: Member name.
+    Returns:
+        TarInfo or None if member is not found.
+    """
+
+    name = os.path.normpath(name)
+
+    for member in tar.members:
+        if os.path.normpath(member.name) == name:
+            return member
+
+    while True:
+        member = tar.next()
+        if member is None:
+            return None
+        if os.path.normpath(member.name) == name:
+            return member
+
+
+class MetadataCache:
+    """ On-disk cache of image labels keyed by content digest.
+    Content addressed entries never change, so they need no invalidation. """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _entry_path(self, digest: str) -> str:
+        algorithm, value = digest.split(':', 1)
+        return os.path.join(self.path, f'{algorithm}-{value}.json')
+
+    def get(self, digest: str) -> Optional[Dict[str, str]]:
+        """ Returns cached image labels for digest or None. """
+
+        if not is_digest(digest):
+            return None
+
+        try:
+            with open(self._entry_path(digest)) as entry:
+                labels = json.load(entry)
+        except (OSError, ValueError):
+            return None
+
+        log.debug(f'using cached metadata for {digest}')
+        return labels
+
+    def put(self, digest: str, labels: Dict[str, str]):
+        """ Stores image labels for digest. Failure to store
+        the entry is not an error, the cache is just not used. """
+
+        if not is_digest(digest):
+            return
+
+        entry = None
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=self.path, delete=False) as entry:
+                json.dump(labels, entry)
+            os.replace(entry.name, self._entry_path(digest))
+        except (OSError, TypeError, ValueError) as err:
+            log.debug(f'failed to cache metadata for {digest}: {err}')
+            if entry is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(entry.name)
+
+
 @dataclass
 class Metadata:
     """ Package metadata object that can be retrieved from
@@ -61,24 +151,53 @@ class Metadata:
 class MetadataResolver:
     """ Resolve metadata for package from different sources. """
 
-    def __init__(self, docker, registry_resolver):
+    def __init__(self, docker, registry_resolver, cache: Optional[MetadataCache] = None):
         self.docker = docker
         self.registry_resolver = registry_resolver
+        self.cache = cache
+        # Image name -> image ID, for images referenced by name.
+        self.image_ids = {}
+
+    def _get_cached_labels(self, digest: str) -> Optional[Dict[str, str]]:
+        if self.cache is None:
+            return None
+        return self.cache.get(digest)
+
+    def _cache_labels(self, labels: Dict[str, str], *digests: str):
+        if self.cache is None:
+            return
+        for digest in digests:
+            self.cache.put(digest, labels)
 
     def from_local(self, image: str) -> Metadata:
         """ Reads manifest from locally installed docker image.
+        Image ID is the digest of the image config, so metadata
+        is served from the cache. Images referenced by name,
+        like the ones of built-in packages, are resolved to
+        their image ID once.
 
         Args:
-            image: Docker image ID
+            image: Docker image ID or name
         Returns:
             Metadata
         Raises:
             MetadataError
         """
 
-        labels = self.docker.labels(image)
+        if self.cache is not None and not is_digest(image):
+            if image not in self.image_ids:
+                docker_image = self.docker.get_image(image)
+                self.image_ids[image] = docker_image.id
+                if docker_image.labels is not None:
+                    self._cache_labels(docker_image.labels, docker_image.id)
+            image = self.image_ids[image]
+
+        labels = self._get_cached_labels(image)
         if labels is None:
-            raise MetadataError('No manifest found in image labels')
+            labels = self.docker.labels(image)
+            if labels is None:
+                raise MetadataError('No manifest found in image labels')
+            self._cache_labels(labels, image)
 
         return self.from_labels(labels)
 
@@ -86,6 +205,11 @@ class MetadataResolver:
                       repository: str,
                       reference: str) -> Metadata:
         """ Reads manifest from remote registry.
+        When reference is a digest, metadata is served from the cache
+        without accessing the registry. Otherwise, only the image manifest
+        is fetched to resolve the tag and the config blob comes from cache.
+        Labels are only cached under the digests the manifest and the
+        config blob served by the registry actually hash to.
 
         Args:
             repository: Repository to pull image from
@@ -96,20 +220,37 @@ class MetadataResolver:
             MetadataError
         """
 
+        labels = self._get_cached_labels(reference)
+        if labels is not None:
+            return self.from_labels(labels)
+
         registry = self.registry_resolver.get_registry_for(repository)
 
-        manifest = registry.manifest(repository, reference)
+        manifest_data = registry.manifest_content(repository, reference)
+        manifest = json.loads(manifest_data)
         digest = manifest['config']['digest']
 
-        blob = registry.blobs(repository, digest)
-        labels = blob['config']['Labels']
+        labels = self._get_cached_labels(digest)
         if labels is None:
-            raise MetadataError('No manifest found in image labels')
+            blob_data = registry.blob_content(repository, digest)
+            blob = json.loads(blob_data)
+            labels = blob['config']['Labels']
+            if labels is None:
+                raise MetadataError('No manifest found in image labels')
+            if not has_digest(blob_data, digest):
+                return self.from_labels(labels)
+            self._cache_labels(labels, digest)
+
+        if has_digest(manifest_data, reference):
+            self._cache_labels(labels, reference)
 
         return self.from_labels(labels)
 
     def from_tarball(self, image_path: str) -> Metadata:
-        """ Reads manifest image tarball.
+        """ Reads manifest image tarball. Only the tarball members
+        up to manifest.json and the image config are read and
+        the image config is not read at all if it is cached.
+
         Args:
             image_path: Path to image tarball.
         Returns:
@@ -119,13 +260,29 @@ class MetadataResolver:
         """
 
         with tarfile.open(image_path) as image:
-            manifest = json.loads(image.extractfile('manifest.json').read())
+            manifest_member = find_tar_member(image, 'manifest.json')
+            if manifest_member is None:
+                raise MetadataError('No manifest.json found in image tarball')
+            manifest = json.loads(image.extractfile(manifest_member).read())
 
             blob = manifest[0]['Config']
-            image_config = json.loads(image.extractfile(blob).read())
-            labels = image_config['config']['Labels']
+            # Config blob is named after its digest, either "<hex>.json"
+            # or "blobs/sha256/<hex>" depending on the tarball layout.
+            digest = 'sha256:' + os.path.splitext(os.path.basename(blob))[0]
+
+            labels = self._get_cached_labels(digest)
             if labels is None:
-                raise MetadataError('No manifest found in image labels')
+                blob_member = find_tar_member(image, blob)
+                if blob_member is None:
+                    raise MetadataError(f'No image config {blob} found in image tarball')
+                image_config_data = image.extractfile(blob_member).read()
+                image_config = json.loads(image_config_data)
+                labels = image_config['config']['Labels']
+                if labels is None:
+                    raise MetadataError('No manifest found in image labels')
+                # Do not trust the member name to cache under the digest.
+                if has_digest(image_config_data, digest):
+                    self._cache_labels(labels, digest)
 
             return self.from_labels(labels)
 
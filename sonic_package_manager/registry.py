@@ -109,7 +109,10 @@ class Registry:
 
         return content['tags']
 
-    def manifest(self, repository: str, ref: str) -> Dict:
+    def manifest_content(self, repository: str, ref: str) -> bytes:
+        """ Returns the image manifest as served by the registry,
+        which is what the manifest digest is computed over. """
+
         log.debug(f'getting manifest for {repository}:{ref}')
 
         _, repository = reference.Reference.split_docker_domain(repository)
@@ -120,12 +123,18 @@ class Registry:
         if response.status_code != requests.codes.ok:
             raise RegistryApiError(f'Failed to retrieve manifest for {repository}:{ref}', response)
 
-        content = json.loads(response.content)
+        return response.content
+
+    def manifest(self, repository: str, ref: str) -> Dict:
+        content = json.loads(self.manifest_content(repository, ref))
         log.debug(f'manifest content for {repository}:{ref}: {content}')
 
         return content
 
-    def blobs(self, repository: str, digest: str):
+    def blob_content(self, repository: str, digest: str) -> bytes:
+        """ Returns the blob as served by the registry,
+        which is what the blob digest is computed over. """
+
         log.debug(f'retrieving blob for {repository}:{digest}')
 
         _, repository = reference.Reference.split_docker_domain(repository)
@@ -134,7 +143,11 @@ class Registry:
         response = self._execute_get_request(url, headers)
         if response.status_code != requests.codes.ok:
             raise RegistryApiError(f'Failed to retrieve blobs for {repository}:{digest}', response)
-        content = json.loads(response.content)
+
+        return response.content
+
+    def blobs(self, repository: str, digest: str):
+        content = json.loads(self.blob_content(repository, digest))
 
         log.debug(f'retrieved blob for {repository}:{digest}: {content}')
         return content
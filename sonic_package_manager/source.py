@@ -18,6 +18,7 @@ class PackageSource(object):
         self.database = database
         self.docker = docker
         self.metadata_resolver = metadata_resolver
+        self.metadata = None
 
     def get_metadata(self) -> Metadata:
         """ Returns package manifest.
@@ -68,12 +69,15 @@ class PackageSource(object):
 
     def get_package(self) -> Package:
         """ Returns SONiC Package based on manifest.
+        Metadata is resolved on the first call only.
 
         Returns:
               SONiC Package
         """
 
-        metadata = self.get_metadata()
+        if self.metadata is None:
+            self.metadata = self.get_metadata()
+        metadata = self.metadata
         manifest = metadata.manifest
 
         name = manifest['package']['name']
@@ -182,3 +186,37 @@ class LocalSource(PackageSource):
 
     def get_package(self) -> Package:
         return Package(self.entry, self.get_metadata())
+
+
+class DockerSource(PackageSource):
+    """ DockerSource implements PackageSource for an image
+    found in another docker library, e.g. the one of the
+    previously installed SONiC image, which is streamed
+    into the local docker library. """
+
+    def __init__(self,
+                 source_docker: DockerApi,
+                 image_id: str,
+                 database: PackageDatabase,
+                 docker: DockerApi,
+                 metadata_resolver: MetadataResolver):
+        super().__init__(database,
+                         docker,
+                         metadata_resolver)
+        self.source_docker = source_docker
+        self.image_id = image_id
+        self.image = None
+
+    def get_metadata(self) -> Metadata:
+        """ Returns manifest read from the source docker library. """
+
+        return self.metadata_resolver.from_labels(self.source_docker.labels(self.image_id))
+
+    def install_image(self, package: Package):
+        """ Streams the image from the source docker library,
+        once, no matter how many times it is called. """
+
+        if self.image is None:
+            image = self.source_docker.get_image(self.image_id)
+            self.image = self.docker.load_stream(image.save(named=True))
+        return self.image
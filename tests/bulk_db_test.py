@@ -0,0 +1,177 @@
+import fnmatch
+from unittest import mock
+
+from mockredis import MockRedis
+
+from utilities_common import bulk_db
+from utilities_common.bulk_db import BulkHashWriter, hgetall_bulk, hgetall_bulk_client, scan_keys_client
+
+
+class NoPipelineClient(object):
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    def hgetall(self, key):
+        self.calls += 1
+        return self.data.get(key)
+
+    def hset(self, key, field, value):
+        self.calls += 1
+        self.data.setdefault(key, {})[field] = value
+
+
+class FakeConnector(object):
+    APPL_DB = 'APPL_DB'
+
+    def __init__(self, client):
+        self.client = client
+        self.namespace = ''
+
+    def get_redis_client(self, db_name):
+        return self.client
+
+    def get_db_separator(self, db_name):
+        return ':'
+
+
+class FakeTable(object):
+    def __init__(self, client, table_name):
+        self.client = client
+        self.table_name = table_name
+        self.buffered = False
+        self.pending = []
+
+    def setBuffered(self, buffered):
+        self.buffered = buffered
+
+    def set(self, key, fvs):
+        self.pending.append((key, fvs))
+
+    def flush(self):
+        for key, fvs in self.pending:
+            for field, value in fvs:
+                self.client.hset(self.table_name + ':' + key, field, value)
+        self.pending = []
+
+
+class CursorScanClient(object):
+    def __init__(self, keys):
+        self.keys = sorted(keys)
+
+    def scan(self, cursor, match, count):
+        batch = [key for key in self.keys[cursor:cursor + count] if fnmatch.fnmatchcase(key, match)]
+        cursor += count
+        return (0 if cursor >= len(self.keys) else cursor), batch
+
+
+class TestBulkDb(object):
+    def test_hgetall_bulk_pipeline(self):
+        client = MockRedis()
+        client.hset("COUNTERS:oid:0x1", "SAI_PORT_STAT_IF_IN_ERRORS", "10")
+        client.hset("RATES:oid:0x1", "RX_BPS", "100")
+
+        result = hgetall_bulk_client(client, ["COUNTERS:oid:0x1", "RATES:oid:0x1", "RATES:oid:0x2"], batch_size=2)
+
+        assert list(result) == ["COUNTERS:oid:0x1", "RATES:oid:0x1", "RATES:oid:0x2"]
+        assert result["COUNTERS:oid:0x1"] == {b"SAI_PORT_STAT_IF_IN_ERRORS": b"10"}
+        assert result["RATES:oid:0x1"] == {b"RX_BPS": b"100"}
+        assert result["RATES:oid:0x2"] == {}
+
+    def test_hgetall_bulk_without_pipeline(self):
+        client = NoPipelineClient({"RATES:oid:0x1": {"RX_BPS": "100"}})
+
+        result = hgetall_bulk_client(client, ["RATES:oid:0x1", "RATES:oid:0x2"])
+
+        assert result == {"RATES:oid:0x1": {"RX_BPS": "100"}, "RATES:oid:0x2": {}}
+        assert client.calls == 2
+
+    @mock.patch('utilities_common.bulk_db.swsscommon.SonicDBConfig')
+    def test_hgetall_bulk_redis_client(self, db_config):
+        db_config.getDbSock.return_value = '/var/run/redis0/redis.sock'
+        db_config.getDbId.return_value = 0
+        redis_client = MockRedis()
+        redis_client.hset("RATES:oid:0x1", "RX_BPS", "100")
+        connector = FakeConnector(NoPipelineClient({}))
+
+        with mock.patch.dict(bulk_db._redis_clients, clear=True), \
+                mock.patch('redis.Redis', return_value=redis_client) as redis_cls:
+            result = hgetall_bulk(connector, connector.APPL_DB, ["RATES:oid:0x1"])
+
+        redis_cls.assert_called_once_with(unix_socket_path='/var/run/redis0/redis.sock', db=0,
+                                          decode_responses=True)
+        db_config.getDbSock.assert_called_once_with('APPL_DB', '')
+        db_config.getDbId.assert_called_once_with('APPL_DB', '')
+        assert result == {"RATES:oid:0x1": {b"RX_BPS": b"100"}}
+        assert connector.client.calls == 0
+
+    @mock.patch('utilities_common.bulk_db.swsscommon.SonicDBConfig')
+    def test_hgetall_bulk_no_unix_socket(self, db_config):
+        db_config.getDbSock.return_value = ''
+        connector = FakeConnector(NoPipelineClient({"RATES:oid:0x1": {"RX_BPS": "100"}}))
+
+        with mock.patch.dict(bulk_db._redis_clients, clear=True), \
+                mock.patch('redis.Redis') as redis_cls:
+            result = hgetall_bulk(connector, connector.APPL_DB, ["RATES:oid:0x1"])
+
+        redis_cls.assert_not_called()
+        assert result == {"RATES:oid:0x1": {"RX_BPS": "100"}}
+        assert connector.client.calls == 1
+
+    @mock.patch('utilities_common.bulk_db.swsscommon.SonicDBConfig')
+    def test_hgetall_bulk_redis_client_failure(self, db_config):
+        redis_client = mock.MagicMock()
+        redis_client.pipeline.return_value.execute.side_effect = Exception('Connection refused')
+        connector = FakeConnector(NoPipelineClient({"RATES:oid:0x1": {"RX_BPS": "100"}}))
+
+        with mock.patch.dict(bulk_db._redis_clients, clear=True), \
+                mock.patch('redis.Redis', return_value=redis_client):
+            result = hgetall_bulk(connector, connector.APPL_DB, ["RATES:oid:0x1"])
+
+        assert result == {"RATES:oid:0x1": {"RX_BPS": "100"}}
+        assert connector.client.calls == 1
+
+    def test_bulk_hash_writer_pipeline(self):
+        client = MockRedis()
+        connector = FakeConnector(client)
+
+        with BulkHashWriter(connector, connector.APPL_DB, batch_size=2) as writer:
+            writer.hset("ROUTE_TABLE:1.1.1.0/24", "weight", "")
+            writer.hset("ROUTE_TABLE:2.2.2.0/24", "weight", "")
+            assert writer.pending == 0
+            writer.hset("ROUTE_TABLE:3.3.3.0/24", "weight", "")
+            assert writer.pending == 1
+            assert client.hgetall("ROUTE_TABLE:3.3.3.0/24") == {}
+
+        assert writer.pending == 0
+        for prefix in ["1.1.1.0/24", "2.2.2.0/24", "3.3.3.0/24"]:
+            assert client.hgetall("ROUTE_TABLE:" + prefix) == {b"weight": b""}
+
+    @mock.patch('utilities_common.bulk_db.swsscommon.Table', FakeTable)
+    def test_bulk_hash_writer_buffered_table(self):
+        client = NoPipelineClient({})
+        connector = FakeConnector(client)
+
+        with BulkHashWriter(connector, connector.APPL_DB, batch_size=2) as writer:
+            writer.hset("ROUTE_TABLE:1.1.1.0/24", "weight", "")
+            writer.hset("ROUTE_TABLE:fc00::/64", "weight", "")
+            writer.hset("ROUTE_TABLE:2.2.2.0/24", "weight", "")
+            assert writer.tables["ROUTE_TABLE"].buffered
+            assert client.data == {"ROUTE_TABLE:1.1.1.0/24": {"weight": ""},
+                                   "ROUTE_TABLE:fc00::/64": {"weight": ""}}
+
+        assert client.data["ROUTE_TABLE:2.2.2.0/24"] == {"weight": ""}
+        assert list(writer.tables) == ["ROUTE_TABLE"]
+
+    def test_scan_keys_scan_iter(self):
+        client = MockRedis()
+        for index in range(5):
+            client.hset("FDB:%d" % index, "port", "Ethernet0")
+        client.hset("VLAN:1", "vlanid", "1")
+
+        assert sorted(scan_keys_client(client, "FDB:*", count=2)) == [b"FDB:%d" % index for index in range(5)]
+
+    def test_scan_keys_cursor(self):
+        client = CursorScanClient(["FDB:%d" % index for index in range(5)] + ["VLAN:1"])
+
+        assert scan_keys_client(client, "FDB:*", count=2) == ["FDB:%d" % index for index in range(5)]
@@ -0,0 +1,19 @@
+import click
+
+
+@click.command()
+def hello():
+    """Say hello"""
+    click.echo('hello')
+
+
+@click.group()
+def greetings():
+    """Greetings"""
+    pass
+
+
+@greetings.command()
+def morning():
+    """Say good morning"""
+    click.echo('good morning')
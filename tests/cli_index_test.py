@@ -0,0 +1,121 @@
+import sys
+
+import click
+from click.testing import CliRunner
+
+import show.main as show
+import config.main as config
+import utilities_common.cli as clicommon
+from show import commands_index as show_index
+from config import commands_index as config_index
+from utilities_common import cli_index
+
+LAZY_MODULE = 'tests.cli_index_input.lazy_commands'
+
+
+def make_cli(conditions=None):
+    @click.group(cls=clicommon.LazyAliasedGroup)
+    def cli():
+        pass
+
+    @cli.command()
+    def version():
+        click.echo('version')
+
+    cli.add_lazy_commands({
+        'hello': LAZY_MODULE + ':hello',
+        'greetings': LAZY_MODULE + ':greetings',
+    }, conditions)
+    return cli
+
+
+class TestLazyGroup(object):
+    def setup_method(self):
+        sys.modules.pop(LAZY_MODULE, None)
+
+    def test_lazy_command(self):
+        cli = make_cli()
+        assert 'hello' in cli.commands
+        assert sorted(cli.commands) == ['greetings', 'hello', 'version']
+        assert LAZY_MODULE not in sys.modules
+        assert not cli.commands.is_loaded('hello')
+
+        result = CliRunner().invoke(cli, ['version'])
+        assert result.exit_code == 0
+        assert LAZY_MODULE not in sys.modules
+
+        result = CliRunner().invoke(cli, ['hel'])
+        assert result.exit_code == 0
+        assert result.output == 'hello\n'
+        assert LAZY_MODULE in sys.modules
+        assert cli.commands.is_loaded('hello')
+
+    def test_lazy_condition(self):
+        cli = make_cli(conditions={'greetings': lambda: False})
+        assert 'greetings' not in cli.commands
+        assert sorted(cli.commands) == ['hello', 'version']
+        assert cli.commands.get('greetings') is None
+
+    def test_lazy_plugin(self):
+        cli = make_cli()
+        registered = []
+
+        @click.command()
+        def night():
+            click.echo('good night')
+
+        @click.command()
+        def evening():
+            click.echo('good evening')
+
+        def register():
+            registered.append(True)
+            assert 'evening' not in cli.commands
+            cli.add_command(evening)
+            cli.commands['greetings'].add_command(night)
+
+        cli.add_lazy_plugin(['evening', 'greetings'], register)
+        assert sorted(cli.commands) == ['evening', 'greetings', 'hello', 'version']
+        assert not registered
+
+        result = CliRunner().invoke(cli, ['greetings', 'night'])
+        assert result.exit_code == 0
+        assert result.output == 'good night\n'
+        assert registered == [True]
+
+        result = CliRunner().invoke(cli, ['evening'])
+        assert result.exit_code == 0
+        assert registered == [True]
+
+    def test_lazy_plugin_loaded_command(self):
+        cli = make_cli()
+        registered = []
+        cli.add_lazy_plugin(['version'], lambda: registered.append(True))
+        assert registered == [True]
+
+
+class TestCommandsIndex(object):
+    def test_show_index(self):
+        commands, plugins = cli_index.build_index('show', show_index.MODULES)
+        assert commands == show_index.COMMANDS
+        assert plugins == show_index.PLUGINS
+
+    def test_config_index(self):
+        commands, plugins = cli_index.build_index('config', config_index.MODULES)
+        assert commands == config_index.COMMANDS
+        assert plugins == config_index.PLUGINS
+
+    def test_show_commands(self):
+        for name in show_index.COMMANDS:
+            if name == 'gearbox':
+                continue
+            assert show.cli.commands[name].name == name
+
+    def test_config_commands(self):
+        for name in config_index.COMMANDS:
+            assert config.config.commands[name].name == name
+
+    def test_render_index(self):
+        with open(show_index.__file__) as f:
+            assert f.read() == cli_index.render_index('show', show_index.ROOT, show_index.MODULES,
+                                                      show_index.COMMANDS, show_index.PLUGINS)
@@ -586,6 +586,24 @@ class TestWarmUpgrade_without_route_weights(object):
             diff = DeepDiff(resulting_keys, expected_keys, ignore_order=True)
             assert not diff
 
+    def test_migrate_weights_for_nexthops_profile(self):
+        dbconnector.dedicated_dbs['CONFIG_DB'] = os.path.join(mock_db_path, 'config_db', 'routes_migrate_input')
+        dbconnector.dedicated_dbs['APPL_DB'] = os.path.join(mock_db_path, 'appl_db', 'routes_migrate_input')
+
+        import db_migrator
+        dbmgtr = db_migrator.DBMigrator(None, profile=True)
+        report = dbmgtr.migrate().splitlines()
+
+        steps = [step for step, _ in dbmgtr.step_times]
+        assert steps[-1] == 'common_migration_ops'
+        assert report[0].split() == ['Step', 'Time', '(s)']
+        assert [line.split()[0] for line in report[1:]] == steps + ['total']
+        total = float(report[-1].split()[1])
+        assert total == pytest.approx(sum(seconds for _, seconds in dbmgtr.step_times), abs=1e-3)
+
+        for key in dbmgtr.appDB.keys(dbmgtr.appDB.APPL_DB, "ROUTE_TABLE:*"):
+            assert 'weight' in dbmgtr.appDB.get_all(dbmgtr.appDB.APPL_DB, key)
+
 class TestWarmUpgrade_T0_EdgeZoneAggregator(object):
     @classmethod
     def setup_class(cls):
@@ -0,0 +1,62 @@
+import os
+
+from swsscommon.swsscommon import SonicV2Connector
+
+from utilities_common.fdb import FdbSnapshot
+
+from .mock_tables import dbconnector
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+mock_db_path = os.path.join(test_path, "fdbshow_input")
+
+
+class TestFdbSnapshot(object):
+    def setup_method(self):
+        dbconnector.dedicated_dbs['ASIC_DB'] = os.path.join(mock_db_path, 'asic_db')
+        self.db = SonicV2Connector(host="127.0.0.1")
+        self.db.connect(self.db.ASIC_DB)
+
+    def teardown_method(self):
+        dbconnector.dedicated_dbs['ASIC_DB'] = None
+
+    def test_vlan_maps(self):
+        snapshot = FdbSnapshot(self.db)
+
+        assert snapshot.get_bvid_2_vlan_id() == {'oid:0x260000000005c5': '2',
+                                                 'oid:0x260000000006c6': '3',
+                                                 'oid:0x260000000007c7': '4'}
+        assert snapshot.get_vlan_id_2_bvid() == {2: 'oid:0x260000000005c5',
+                                                 3: 'oid:0x260000000006c6',
+                                                 4: 'oid:0x260000000007c7'}
+        assert snapshot.get_vlan_id({'vlan': '5'}) == '5'
+        assert snapshot.get_vlan_id({'bvid': 'oid:0x260000000006c6'}) == '3'
+        assert snapshot.get_vlan_id({'mac': '77:66:55:33:22:11'}) is None
+
+    def test_bridge_port_map(self):
+        snapshot = FdbSnapshot(self.db)
+
+        bridge_port_map = snapshot.get_bridge_port_map('SAI_BRIDGE_PORT_TYPE_PORT')
+
+        assert bridge_port_map['oid:0x3a0000000005cb'] == 'oid:0x1000000000528'
+        assert bridge_port_map['oid:0x3a0000000006cd'] == 'oid:0x1000000000549'
+
+    def test_fdb_entries(self):
+        snapshot = FdbSnapshot(self.db)
+
+        macs = sorted(fdb['mac'] for _, fdb, _ in snapshot.get_fdb_entries())
+        assert macs == ['11:22:33:44:55:66', '11:22:33:66:55:44', '66:55:44:33:22:11',
+                        '77:55:44:33:22:11', '77:66:44:33:22:11', '77:66:55:33:22:11',
+                        '77:66:55:44:22:11']
+
+    def test_fdb_entries_filtered(self):
+        snapshot = FdbSnapshot(self.db)
+
+        entries = snapshot.get_fdb_entries(vlan_ids=[4, 5])
+        assert sorted(fdb['mac'] for _, fdb, _ in entries) == ['66:55:44:33:22:11', '77:55:44:33:22:11',
+                                                              '77:66:44:33:22:11', '77:66:55:44:22:11']
+
+        entries = snapshot.get_fdb_entries(vlan_ids=[4], mac='66:55:44:33:22:11')
+        assert len(entries) == 1
+        key, fdb, attrs = entries[0]
+        assert fdb['bvid'] == 'oid:0x260000000007c7'
+        assert attrs['SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID'] == 'oid:0x3a0000000005cb'
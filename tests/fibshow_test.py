@@ -33,6 +33,19 @@ show_ip_fib_v6 = """\
 Total number of entries 3
 """
 
+show_ip_fib_v4_ipaddr = """\
+  No.  Vrf    Route               Nexthop                                  Ifname
+-----  -----  ------------------  ---------------------------------------  -----------------------------------------------------------
+    1  Red    192.168.112.128/25  10.0.0.57,10.0.0.59,10.0.0.61,10.0.0.63  PortChannel101,PortChannel102,PortChannel103,PortChannel104
+Total number of entries 1
+"""
+
+show_ip_fib_no_entries = """\
+No.    Vrf    Route    Nexthop    Ifname
+-----  -----  -------  ---------  --------
+Total number of entries 0
+"""
+
 root_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(root_path)
 scripts_path = os.path.join(modules_path, "scripts")
@@ -90,3 +103,33 @@ class TestFibshow():
         assert result.exit_code == 0
         assert result.output == show_ip_fib_v6
 
+
+    def test_show_ip_fib_ipaddr(self):
+        self.set_mock_variant("1")
+        from .mock_tables import dbconnector
+        modules_path = os.path.join(os.path.dirname(__file__), "..")
+        test_path = os.path.join(modules_path, "tests")
+        mock_db_path = os.path.join(test_path, "fibshow_input")
+        jsonfile_appl = os.path.join(mock_db_path, 'appl_db')
+        dbconnector.dedicated_dbs['APPL_DB'] = jsonfile_appl
+        result = self.runner.invoke(show.cli.commands["ip"].commands["fib"], ["VRF-Red:192.168.112.128/25"])
+        dbconnector.dedicated_dbs['APPL_DB'] = None
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+        assert result.output == show_ip_fib_v4_ipaddr
+
+    def test_show_ipv6_fib_ipv4_ipaddr(self):
+        self.set_mock_variant("1")
+        from .mock_tables import dbconnector
+        modules_path = os.path.join(os.path.dirname(__file__), "..")
+        test_path = os.path.join(modules_path, "tests")
+        mock_db_path = os.path.join(test_path, "fibshow_input")
+        jsonfile_appl = os.path.join(mock_db_path, 'appl_db')
+        dbconnector.dedicated_dbs['APPL_DB'] = jsonfile_appl
+        result = self.runner.invoke(show.cli.commands["ipv6"].commands["fib"], ["192.168.104.0/25"])
+        dbconnector.dedicated_dbs['APPL_DB'] = None
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+        assert result.output == show_ip_fib_no_entries
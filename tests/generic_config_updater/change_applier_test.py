@@ -73,17 +73,14 @@ def debug_print(msg):
     print(msg)
 
 
-# Mimics os.system call for sonic-cfggen -d --print-data > filename
+# Mimics ConfigDbSnapshot reading the whole ConfigDB
 #
-def os_system_cfggen(cmd):
+def read_config_db():
     global running_config
 
-    fname = cmd.split(">")[-1].strip()
-    with open(fname, "w") as s:
-        s.write(json.dumps(running_config, indent=4))
-    debug_print("File created {} type={} cfg={}".format(fname,
+    debug_print("ConfigDB read type={} cfg={}".format(
         type(running_config), json.dumps(running_config)[1:40]))
-    return 0
+    return copy.deepcopy(running_config)
 
 
 # mimics config_db.set_entry
@@ -213,14 +210,14 @@ def vlan_validate(old_cfg, new_cfg, keys):
 
 class TestChangeApplier(unittest.TestCase):
 
-    @patch("generic_config_updater.change_applier.os.system")
+    @patch("generic_config_updater.gu_common.ConfigDbSnapshot._read_config_db")
     @patch("generic_config_updater.change_applier.get_config_db")
     @patch("generic_config_updater.change_applier.set_config")
-    def test_change_apply(self, mock_set, mock_db, mock_os_sys):
+    def test_change_apply(self, mock_set, mock_db, mock_read):
         global read_data, running_config, json_changes, json_change_index
         global start_running_config
 
-        mock_os_sys.side_effect = os_system_cfggen
+        mock_read.side_effect = read_config_db
         mock_db.return_value = DB_HANDLE
         mock_set.side_effect = set_entry
 
@@ -2,7 +2,7 @@ import json
 import os
 import shutil
 import unittest
-from unittest.mock import MagicMock, Mock, call
+from unittest.mock import MagicMock, Mock, call, patch
 from .gutest_helpers import create_side_effect_dict, Files
 
 import generic_config_updater.generic_updater as gu
@@ -299,6 +299,18 @@ class TestFileSystemConfigRollbacker(unittest.TestCase):
         path=os.path.join(self.checkpoints_dir, f"{name}{self.checkpoint_ext}")
         return os.path.isfile(path)
 
+    @patch("generic_config_updater.change_applier.get_config_db")
+    def test_init__default_components__share_config_db_snapshot(self, mock_get_config_db):
+        rollbacker = gu.FileSystemConfigRollbacker()
+        other_rollbacker = gu.FileSystemConfigRollbacker()
+
+        snapshot = rollbacker.config_wrapper.config_db_snapshot
+        replacer = rollbacker.config_replacer
+        self.assertIs(snapshot, replacer.config_wrapper.config_db_snapshot)
+        self.assertIs(snapshot, replacer.patch_applier.config_wrapper.config_db_snapshot)
+        self.assertIs(snapshot, replacer.patch_applier.changeapplier.config_db_snapshot)
+        self.assertIsNot(snapshot, other_rollbacker.config_wrapper.config_db_snapshot)
+
     def create_rollbacker(self):
         replacer = Mock()
         replacer.replace.side_effect = create_side_effect_dict({(str(self.any_config),): 0})
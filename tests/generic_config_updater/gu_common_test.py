@@ -11,14 +11,11 @@ from .gutest_helpers import create_side_effect_dict, Files
 import generic_config_updater.gu_common as gu_common
 
 class TestDryRunConfigWrapper(unittest.TestCase):
-    @patch('generic_config_updater.gu_common.subprocess.Popen')
-    def test_get_config_db_as_json(self, mock_popen):
+    @patch('generic_config_updater.gu_common.ConfigDBPipeConnector')
+    def test_get_config_db_as_json(self, mock_connector):
+        config_db = mock_connector.return_value
+        config_db.get_config.return_value = {"PORT": {}}
         config_wrapper = gu_common.DryRunConfigWrapper()
-        mock_proc = MagicMock()
-        mock_proc.communicate = MagicMock(
-            return_value=('{"PORT": {}, "bgpraw": ""}', None))
-        mock_proc.returncode = 0
-        mock_popen.return_value = mock_proc
         actual = config_wrapper.get_config_db_as_json()
         expected = {"PORT": {}}
         self.assertDictEqual(actual, expected)
@@ -66,6 +63,48 @@ class TestDryRunConfigWrapper(unittest.TestCase):
             # Assert
             self.assertDictEqual(expected, actual)
 
+class TestConfigDbSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.config = {
+            "PORT": {"Ethernet0": {"alias": "etp1"}},
+            "VLAN_MEMBER": {("Vlan1000", "Ethernet0"): {"tagging_mode": "untagged"}}
+        }
+        self.connector_patcher = patch('generic_config_updater.gu_common.ConfigDBPipeConnector')
+        self.config_db = self.connector_patcher.start().return_value
+        self.config_db.get_config.side_effect = lambda: copy.deepcopy(self.config)
+        self.config_db.serialize_key.side_effect = lambda key: key if isinstance(key, str) else "|".join(key)
+
+    def tearDown(self):
+        self.connector_patcher.stop()
+
+    def test_get_config_db_as_json__serializes_keys(self):
+        snapshot = gu_common.ConfigDbSnapshot()
+        expected = {
+            "PORT": {"Ethernet0": {"alias": "etp1"}},
+            "VLAN_MEMBER": {"Vlan1000|Ethernet0": {"tagging_mode": "untagged"}}
+        }
+        self.assertDictEqual(expected, snapshot.get_config_db_as_json())
+
+    def test_get_config_db_as_json__reuses_snapshot_until_invalidated(self):
+        snapshot = gu_common.ConfigDbSnapshot()
+        first = snapshot.get_config_db_as_json()
+        first["PORT"]["Ethernet0"]["alias"] = "modified"
+        self.config["PORT"]["Ethernet4"] = {"alias": "etp2"}
+
+        self.assertNotIn("Ethernet4", snapshot.get_config_db_as_json()["PORT"])
+        self.assertEqual("etp1", snapshot.get_config_db_as_json()["PORT"]["Ethernet0"]["alias"])
+        self.assertEqual(1, self.config_db.get_config.call_count)
+
+        snapshot.invalidate()
+
+        self.assertIn("Ethernet4", snapshot.get_config_db_as_json()["PORT"])
+        self.assertEqual(2, self.config_db.get_config.call_count)
+
+    def test_get_config_db_as_json__read_failure__raises(self):
+        self.config_db.get_config.side_effect = Exception("connection refused")
+        snapshot = gu_common.ConfigDbSnapshot()
+        self.assertRaises(gu_common.GenericConfigUpdaterError, snapshot.get_config_db_as_json)
+
 class TestConfigWrapper(unittest.TestCase):
     def setUp(self):
         self.config_wrapper_mock = gu_common.ConfigWrapper()
@@ -528,6 +567,22 @@ class TestConfigWrapper(unittest.TestCase):
         check(sy1, config_wrapper.sonic_yang_with_loaded_models)
         check(sy2, config_wrapper.sonic_yang_with_loaded_models)
 
+    def test_create_sonic_yang_with_loaded_models__loads_models_once_per_process(self):
+        # Arrange
+        config_wrapper1 = gu_common.ConfigWrapper()
+        config_wrapper2 = gu_common.ConfigWrapper()
+
+        # Act
+        sy1 = config_wrapper1.create_sonic_yang_with_loaded_models()
+        with patch('generic_config_updater.gu_common.sonic_yang.SonicYang') as mock_sonic_yang:
+            sy2 = config_wrapper2.create_sonic_yang_with_loaded_models()
+
+        # Assert
+        mock_sonic_yang.assert_not_called()
+        self.assertFalse(sy1 is sy2)
+        self.assertTrue(sy1.ctx is sy2.ctx)
+        self.assertTrue(sy1.yJson is sy2.yJson)
+
 class TestPatchWrapper(unittest.TestCase):
     def setUp(self):
         self.config_wrapper_mock = gu_common.ConfigWrapper()
@@ -881,6 +936,25 @@ class TestPathAddressing(unittest.TestCase):
         # Assert
         self.assertEqual(expected, actual)
 
+    def test_find_ref_paths__same_config__loads_config_once(self):
+        # Arrange
+        config = Files.CROPPED_CONFIG_DB_AS_JSON
+        config_wrapper = gu_common.ConfigWrapper()
+        config_wrapper.create_sonic_yang_with_loaded_models = \
+            MagicMock(side_effect=gu_common.ConfigWrapper().create_sonic_yang_with_loaded_models)
+        path_addressing = gu_common.PathAddressing(config_wrapper)
+        expected_port_refs = self.path_addressing.find_ref_paths("/PORT/Ethernet0", Files.CROPPED_CONFIG_DB_AS_JSON)
+
+        # Act
+        actual_port_refs = path_addressing.find_ref_paths("/PORT/Ethernet0", config)
+        path_addressing.find_ref_paths("/PORT", config)
+        actual_port_refs_again = path_addressing.find_ref_paths("/PORT/Ethernet0", config)
+
+        # Assert
+        self.assertEqual(expected_port_refs, actual_port_refs)
+        self.assertEqual(expected_port_refs, actual_port_refs_again)
+        config_wrapper.create_sonic_yang_with_loaded_models.assert_called_once()
+
     def test_find_ref_paths__whole_config_path__returns_all_refs(self):
         # Arrange
         path = ""
@@ -23,6 +23,37 @@ class TestDiff(unittest.TestCase):
         self.assertEqual(expected.current_config, actual.current_config)
         self.assertEqual(expected.target_config, actual.target_config)
 
+    def test_apply_move__shares_untouched_config(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"alias": "etp1"}}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}}
+        diff = ps.Diff(current_config=current_config, target_config=Files.ANY_CONFIG_DB)
+        move = ps.JsonMove.from_patch(jsonpatch.JsonPatch([{"op": "replace", "path": "/PORT/Ethernet0/alias",
+                                                            "value": "etp2"}]))
+
+        # Act
+        actual = diff.apply_move(move)
+
+        # Assert
+        self.assertEqual("etp1", current_config["PORT"]["Ethernet0"]["alias"])
+        self.assertEqual("etp2", actual.current_config["PORT"]["Ethernet0"]["alias"])
+        self.assertIs(current_config["VLAN"], actual.current_config["VLAN"])
+
+    def test_apply_move__hash_matches_hash_of_new_diff(self):
+        # Arrange
+        diff = ps.Diff(current_config=Files.CROPPED_CONFIG_DB_AS_JSON, target_config=Files.ANY_CONFIG_DB)
+        hash(diff) # compute hashes so apply_move updates them incrementally
+        moves = [ps.JsonMove.from_patch(Files.SINGLE_OPERATION_CONFIG_DB_PATCH),
+                 ps.JsonMove.from_patch(jsonpatch.JsonPatch([{"op": "remove", "path": "/PORT/Ethernet0"}])),
+                 ps.JsonMove.from_patch(jsonpatch.JsonPatch([{"op": "remove", "path": "/ACL_TABLE"}]))]
+
+        for move in moves:
+            # Act
+            diff = diff.apply_move(move)
+
+            # Assert
+            expected = ps.Diff(current_config=diff.current_config, target_config=diff.target_config)
+            self.assertEqual(hash(expected), hash(diff))
+
     def test_has_no_diff__diff_exists__returns_false(self):
         # Arrange
         diff = ps.Diff(current_config=Files.CROPPED_CONFIG_DB_AS_JSON,
@@ -753,6 +784,29 @@ class TestMoveWrapper(unittest.TestCase):
         # Assert
         self.assertIs(self.any_diff, actual)
 
+    def test_generate_valid_moves__valid_moves_returned_in_order(self):
+        # Arrange
+        diff, move_generators, move_validators = self._create_even_key_moves()
+        move_wrapper = ps.MoveWrapper(move_generators, [], [], move_validators)
+
+        # Act
+        actual = [move.path for move in move_wrapper.generate_valid_moves(diff)]
+
+        # Assert
+        self.assertListEqual(["/TABLE/key0", "/TABLE/key2", "/TABLE/key4", "/TABLE/key6", "/TABLE/key8"], actual)
+
+    def _create_even_key_moves(self):
+        current_config = {"TABLE": {f"key{index}": {} for index in range(10)}}
+        diff = ps.Diff(current_config, {"TABLE": {}})
+        move_generator = Mock()
+        move_generator.generate.return_value = \
+            [ps.JsonMove(diff, OperationType.REMOVE, ["TABLE", f"key{index}"]) for index in range(10)]
+        return diff, [move_generator], [EvenKeyMoveValidator()]
+
+class EvenKeyMoveValidator:
+    def validate(self, move, diff):
+        return int(move.path[-1]) % 2 == 0
+
 class TestJsonPointerFilter(unittest.TestCase):
     def test_get_paths__common_prefix__exact_match_returned(self):
         config = {
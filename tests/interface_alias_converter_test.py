@@ -0,0 +1,58 @@
+from unittest import mock
+
+import utilities_common.cli as clicommon
+
+
+class TestInterfaceAliasConverter(object):
+    def get_converter(self):
+        db = mock.MagicMock()
+        db.cfgdb.get_table.return_value = {
+            "Ethernet0": {"alias": "etp1"},
+            "Ethernet4": {"alias": "etp2"},
+        }
+        return clicommon.InterfaceAliasConverter(db)
+
+    def test_name_to_alias(self):
+        converter = self.get_converter()
+        assert converter.name_to_alias("Ethernet4") == "etp2"
+        assert converter.name_to_alias("Ethernet4.10") == "etp2.10"
+        assert converter.name_to_alias("Ethernet8") == "Ethernet8"
+        assert converter.name_to_alias(None) is None
+
+    def test_alias_to_name(self):
+        converter = self.get_converter()
+        assert converter.alias_to_name("etp1") == "Ethernet0"
+        assert converter.alias_to_name("etp1.10") == "Ethernet0.10"
+        assert converter.alias_to_name("etp3") == "etp3"
+        assert converter.alias_to_name(None) is None
+
+    def test_get_interface_alias_converter_is_cached(self):
+        with mock.patch.object(clicommon, "_iface_alias_converters", {}), \
+                mock.patch.object(clicommon, "InterfaceAliasConverter") as mock_converter:
+            first = clicommon.get_interface_alias_converter()
+            second = clicommon.get_interface_alias_converter()
+        assert first is second
+        mock_converter.assert_called_once_with()
+
+    def test_replace_names_with_aliases(self):
+        converter = self.get_converter()
+        output = converter.replace_names_with_aliases("Ethernet0 Ethernet4, xEthernet4 Ethernet40\n")
+        assert output == "etp1 etp2, xEthernet4 Ethernet40\n"
+
+    def test_run_command_in_alias_mode_streams_output(self):
+        echoed = []
+
+        def stdout():
+            yield "Ethernet0 up\n"
+            # The first line is written out before the next one is read
+            assert echoed == ["etp1 up"]
+            yield "Ethernet4 down\n"
+
+        process = mock.MagicMock()
+        process.stdout = stdout()
+        process.wait.return_value = 0
+        with mock.patch.object(clicommon, "iface_alias_converter", self.get_converter()), \
+                mock.patch("subprocess.Popen", return_value=process), \
+                mock.patch("click.echo", side_effect=echoed.append):
+            clicommon.run_command_in_alias_mode("tail -F /var/log/syslog")
+        assert echoed == ["etp1 up", "etp2 down"]
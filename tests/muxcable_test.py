@@ -655,6 +655,20 @@ show_muxcable_resetcause_expected_port_output_json="""\
 }
 """
 
+def mock_xcvrd_swsscommon(responses, results=None):
+    """ Return a swsscommon mock on which xcvrd answers the commands with
+        responses, a list of (port, op, fvs) popped from the response table,
+        and holds results, a dict of port -> fvs, in the result table. """
+    mock_swsscommon = mock.MagicMock()
+    mock_swsscommon.Select.OBJECT = 1
+    mock_swsscommon.Select.TIMEOUT = 2
+    mock_swsscommon.Select.return_value.select.return_value = (1, None)
+    mock_swsscommon.Table.return_value.getKeys.return_value = []
+    mock_swsscommon.Table.return_value.get.side_effect = lambda port: (True, (results or {}).get(port, ()))
+    mock_swsscommon.SubscriberStateTable.return_value.pop.side_effect = responses
+    return mock_swsscommon
+
+
 class TestMuxcable(object):
     @classmethod
     def setup_class(cls):
@@ -1367,12 +1381,20 @@ class TestMuxcable(object):
     @mock.patch('sonic_y_cable.y_cable.check_read_side', mock.MagicMock(return_value=(1)))
     @mock.patch('sonic_y_cable.y_cable.check_mux_direction', mock.MagicMock(return_value=(1)))
     @mock.patch('re.match', mock.MagicMock(return_value=(True)))
+    @mock.patch('show.muxcable.db_connect', mock.MagicMock(return_value=None))
+    @mock.patch('show.muxcable.multi_asic.get_front_end_namespaces', mock.MagicMock(return_value=['']))
+    @mock.patch('show.muxcable.multi_asic.get_asic_index_from_namespace', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.swsscommon', mock_xcvrd_swsscommon(
+        [("Ethernet12", "DEL", ()), ("Ethernet12", "SET", (("state", "standby"),))],
+        {"Ethernet12": (("presence", "True"),)}))
     def test_show_muxcable_hwmode_muxdirection_active(self):
         runner = CliRunner()
         db = Db()
 
         result = runner.invoke(show.cli.commands["muxcable"].commands["hwmode"].commands["muxdirection"], obj=db)
         assert result.exit_code == 0
+        assert "standby" in result.output
+        assert "True" in result.output
 
     @mock.patch('show.muxcable.delete_all_keys_in_db_table', mock.MagicMock(return_value=0))
     @mock.patch('show.muxcable.update_and_get_response_for_xcvr_cmd', mock.MagicMock(return_value={0: 0,
@@ -1439,12 +1461,91 @@ class TestMuxcable(object):
     @mock.patch('sonic_y_cable.y_cable.check_read_side', mock.MagicMock(return_value=(1)))
     @mock.patch('sonic_y_cable.y_cable.check_mux_direction', mock.MagicMock(return_value=(2)))
     @mock.patch('re.match', mock.MagicMock(return_value=(True)))
+    @mock.patch('show.muxcable.db_connect', mock.MagicMock(return_value=None))
+    @mock.patch('show.muxcable.multi_asic.get_front_end_namespaces', mock.MagicMock(return_value=['']))
+    @mock.patch('show.muxcable.multi_asic.get_asic_index_from_namespace', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.swsscommon', mock_xcvrd_swsscommon(
+        [("Ethernet12", "DEL", ()), ("Ethernet12", "SET", (("state", "sucess"),))],
+        {"Ethernet12": (("presence", "True"),)}))
     def test_show_muxcable_hwmode_muxdirection_standby(self):
         runner = CliRunner()
         db = Db()
 
         result = runner.invoke(show.cli.commands["muxcable"].commands["hwmode"].commands["muxdirection"], obj=db)
         assert result.exit_code == 0
+        assert "sucess" in result.output
+        assert "True" in result.output
+
+    @mock.patch('show.muxcable.delete_all_keys_in_db_tables_helper', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.db_connect', mock.MagicMock(return_value=None))
+    @mock.patch('show.muxcable.platform_sfputil', mock.MagicMock())
+    @mock.patch('utilities_common.platform_sfputil_helper.get_asic_id_for_logical_port', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.multi_asic.get_front_end_namespaces', mock.MagicMock(return_value=['']))
+    @mock.patch('show.muxcable.multi_asic.get_asic_index_from_namespace', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.swsscommon')
+    def test_update_and_get_response_for_xcvr_cmd_multi_port(self, mock_swsscommon):
+        mock_swsscommon.Select.OBJECT = 1
+        mock_swsscommon.Select.TIMEOUT = 2
+        mock_swsscommon.Select.return_value.select.return_value = (1, None)
+        mock_swsscommon.Table.return_value.getKeys.return_value = []
+        # Responses arrive out of order, with a stale one for a port that was not asked
+        # and the deletion of a response, which is not an answer
+        mock_swsscommon.SubscriberStateTable.return_value.pop.side_effect = [
+            ("Ethernet0", "DEL", ()),
+            ("Ethernet12", "SET", (("state", "standby"),)),
+            ("Ethernet4", "SET", (("state", "active"),)),
+            ("Ethernet0", "SET", (("state", "active"),))]
+
+        res, latency = show.muxcable.update_and_get_response_for_xcvr_cmd_multi_port(
+            "state", "state", "XCVRD_SHOW_HWMODE_DIR_CMD", None, "XCVRD_SHOW_HWMODE_DIR_RSP", None,
+            ["Ethernet0", "Ethernet12"], 5, None, "probe")
+
+        assert mock_swsscommon.Table.return_value.set.call_count == 2
+        assert res["Ethernet0"][0] == 0
+        assert res["Ethernet0"][1] == "active"
+        assert res["Ethernet12"][0] == 0
+        assert res["Ethernet12"][1] == "standby"
+        assert res["Ethernet12"] == {0: 0, 1: "standby"}
+        assert latency["Ethernet12"] is not None
+        assert "Ethernet4" not in res
+
+    @mock.patch('show.muxcable.delete_all_keys_in_db_tables_helper', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.delete_all_keys_in_db_table', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.db_connect', mock.MagicMock(return_value=None))
+    @mock.patch('show.muxcable.platform_sfputil', mock.MagicMock())
+    @mock.patch('utilities_common.platform_sfputil_helper.get_logical_list', mock.MagicMock(return_value=["Ethernet0", "Ethernet12"]))
+    @mock.patch('utilities_common.platform_sfputil_helper.get_asic_id_for_logical_port', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.multi_asic.get_front_end_namespaces', mock.MagicMock(return_value=['']))
+    @mock.patch('show.muxcable.multi_asic.get_asic_index_from_namespace', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.swsscommon', mock_xcvrd_swsscommon(
+        [("Ethernet12", "SET", (("state", "active"),))], {"Ethernet12": (("presence", "True"),)}))
+    def test_update_and_get_response_for_xcvr_cmd_single_port(self):
+        res_dict = show.muxcable.update_and_get_response_for_xcvr_cmd(
+            "state", "state", "True", "XCVRD_SHOW_HWMODE_DIR_CMD", "XCVRD_SHOW_HWMODE_DIR_RES",
+            "XCVRD_SHOW_HWMODE_DIR_RSP", None, "Ethernet12", 5, None, "probe")
+        result = show.muxcable.get_result("Ethernet12", res_dict, "muxdirection", {}, "XCVRD_SHOW_HWMODE_DIR_RES")
+
+        assert res_dict[0] == 0
+        assert res_dict[1] == "active"
+        assert result == {"presence": "True"}
+
+        res_dict = show.muxcable.update_and_get_response_for_xcvr_cmd(
+            "state", "state", "True", "XCVRD_SHOW_HWMODE_DIR_CMD", "XCVRD_SHOW_HWMODE_DIR_RES",
+            "XCVRD_SHOW_HWMODE_DIR_RSP", None, "Ethernet4", 5, None, "probe")
+        assert res_dict == {0: 1, 1: "unknown"}
+
+    @mock.patch('utilities_common.platform_sfputil_helper.get_logical_list', mock.MagicMock(return_value=["Ethernet12"]))
+    @mock.patch('show.muxcable.update_and_get_response_for_xcvr_cmd_multi_port')
+    def test_update_and_get_response_for_xcvr_cmd_single_port_wait(self, multi_port):
+        multi_port.return_value = ({"Ethernet12": {0: 0, 1: "active"}}, {"Ethernet12": 0.7})
+
+        res_dict = show.muxcable.update_and_get_response_for_xcvr_cmd(
+            "state", "state", "True", "XCVRD_SHOW_HWMODE_DIR_CMD", "XCVRD_SHOW_HWMODE_DIR_RES",
+            "XCVRD_SHOW_HWMODE_DIR_RSP", None, "Ethernet12", show.muxcable.HWMODE_MUXDIRECTION_TIMEOUT, None, "probe")
+
+        # A single port is given a full select period, as before batching
+        assert multi_port.call_args[0][7] == show.muxcable.SELECT_TIMEOUT / 1000.0
+        assert res_dict == {0: 0, 1: "active"}
 
     @mock.patch('config.muxcable.delete_all_keys_in_db_table', mock.MagicMock(return_value=0))
     @mock.patch('config.muxcable.update_and_get_response_for_xcvr_cmd', mock.MagicMock(return_value={0: 0,
@@ -1995,12 +2096,20 @@ class TestMuxcable(object):
     @mock.patch('sonic_y_cable.y_cable.check_read_side', mock.MagicMock(return_value=(1)))
     @mock.patch('sonic_y_cable.y_cable.check_mux_direction', mock.MagicMock(return_value=(1)))
     @mock.patch('re.match', mock.MagicMock(return_value=(True)))
+    @mock.patch('show.muxcable.db_connect', mock.MagicMock(return_value=None))
+    @mock.patch('show.muxcable.multi_asic.get_front_end_namespaces', mock.MagicMock(return_value=['']))
+    @mock.patch('show.muxcable.multi_asic.get_asic_index_from_namespace', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.swsscommon', mock_xcvrd_swsscommon(
+        [("Ethernet12", "DEL", ()), ("Ethernet12", "SET", (("state", "standby"),))],
+        {"Ethernet12": (("presence", "True"),)}))
     def test_show_muxcable_hwmode_muxdirection_active(self):
         runner = CliRunner()
         db = Db()
 
         result = runner.invoke(show.cli.commands["muxcable"].commands["hwmode"].commands["muxdirection"], obj=db)
         assert result.exit_code == 0
+        assert "standby" in result.output
+        assert "True" in result.output
 
     @mock.patch('show.muxcable.delete_all_keys_in_db_table', mock.MagicMock(return_value=0))
     @mock.patch('show.muxcable.update_and_get_response_for_xcvr_cmd', mock.MagicMock(return_value={0: 0,
@@ -2067,12 +2176,20 @@ class TestMuxcable(object):
     @mock.patch('sonic_y_cable.y_cable.check_read_side', mock.MagicMock(return_value=(1)))
     @mock.patch('sonic_y_cable.y_cable.check_mux_direction', mock.MagicMock(return_value=(2)))
     @mock.patch('re.match', mock.MagicMock(return_value=(True)))
+    @mock.patch('show.muxcable.db_connect', mock.MagicMock(return_value=None))
+    @mock.patch('show.muxcable.multi_asic.get_front_end_namespaces', mock.MagicMock(return_value=['']))
+    @mock.patch('show.muxcable.multi_asic.get_asic_index_from_namespace', mock.MagicMock(return_value=0))
+    @mock.patch('show.muxcable.swsscommon', mock_xcvrd_swsscommon(
+        [("Ethernet12", "DEL", ()), ("Ethernet12", "SET", (("state", "sucess"),))],
+        {"Ethernet12": (("presence", "True"),)}))
     def test_show_muxcable_hwmode_muxdirection_standby(self):
         runner = CliRunner()
         db = Db()
 
         result = runner.invoke(show.cli.commands["muxcable"].commands["hwmode"].commands["muxdirection"], obj=db)
         assert result.exit_code == 0
+        assert "sucess" in result.output
+        assert "True" in result.output
 
     @mock.patch('config.muxcable.delete_all_keys_in_db_table', mock.MagicMock(return_value=0))
     @mock.patch('config.muxcable.update_and_get_response_for_xcvr_cmd', mock.MagicMock(return_value={0: 0,
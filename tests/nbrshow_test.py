@@ -0,0 +1,66 @@
+import os
+import sys
+from unittest import mock
+
+from utilities_common.general import load_module_from_source
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+modules_path = os.path.dirname(test_path)
+scripts_path = os.path.join(modules_path, "scripts")
+sys.path.insert(0, modules_path)
+
+from .mock_tables import dbconnector
+
+# Load the file under test
+nbrshow_path = os.path.join(scripts_path, 'nbrshow')
+nbrshow = load_module_from_source('nbrshow', nbrshow_path)
+
+mock_db_path = os.path.join(test_path, "fdbshow_input")
+
+arp_output = """\
+Address                  HWtype  HWaddress           Flags Mask            Iface
+192.168.0.2              ether   11:22:33:44:55:66   C                     Vlan2
+192.168.0.3              ether   77:66:44:33:22:11   C                     Vlan4
+192.168.0.4              ether   11:22:33:66:55:44   C                     Vlan4
+10.0.0.57                ether   52:54:00:87:8f:2c   C                     PortChannel0001
+"""
+
+show_arp_output = """\
+Address      MacAddress         Iface            Vlan
+-----------  -----------------  ---------------  ------
+10.0.0.57    52:54:00:87:8f:2c  PortChannel0001  -
+192.168.0.2  11:22:33:44:55:66  Ethernet0        2
+192.168.0.3  77:66:44:33:22:11  1000000000fff    4
+192.168.0.4  11:22:33:66:55:44  -                4
+Total number of entries 4 \n"""
+
+
+class TestNbrshow(object):
+    def setup_method(self):
+        dbconnector.dedicated_dbs['ASIC_DB'] = os.path.join(mock_db_path, 'asic_db')
+        dbconnector.dedicated_dbs['COUNTERS_DB'] = os.path.join(mock_db_path, 'counters_db')
+
+    def teardown_method(self):
+        dbconnector.dedicated_dbs['ASIC_DB'] = None
+        dbconnector.dedicated_dbs['COUNTERS_DB'] = None
+
+    def test_fdb_port_map(self):
+        arp = nbrshow.ArpShow(None, None)
+        arp.fetch_fdb_data()
+        assert arp.fdb_port_map[(2, '11:22:33:44:55:66')] == 'Ethernet0'
+        assert arp.fdb_port_map[(3, '11:22:33:66:55:44')] == 'Ethernet4'
+        assert arp.fdb_port_map[(4, '77:66:44:33:22:11')] == '1000000000fff'
+        assert arp.fdb_port_map[(5, '77:66:55:44:22:11')] == 'Ethernet4'
+
+    def test_fdb_port_map_vlan(self):
+        arp = nbrshow.ArpShow(None, None)
+        arp.fetch_fdb_data([2, 5])
+        assert arp.fdb_port_map == {(2, '11:22:33:44:55:66'): 'Ethernet0',
+                                    (5, '77:66:55:44:22:11'): 'Ethernet4'}
+
+    def test_show_arp(self, capsys):
+        arp = nbrshow.ArpShow(None, None)
+        with mock.patch.object(arp, 'fetch_nbr_data', return_value=arp_output):
+            arp.display()
+        output = capsys.readouterr().out
+        assert output == show_arp_output
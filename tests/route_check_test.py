@@ -109,12 +109,12 @@ class mock_selector:
     def __init__(self):
         self.select_state = 0
         self.select_cnt = 0
-        self.subs = None
+        self.subs = []
         # print("Mock Selector constructed")
 
 
     def addSelectable(self, subs):
-        self.subs = subs
+        self.subs.append(subs)
         return 0
 
 
@@ -122,7 +122,8 @@ class mock_selector:
         # Toggle between good & timeout
         #
         state = self.select_state
-        self.subs.update()
+        for subs in self.subs:
+            subs.update()
 
         if mock_selector.EMULATE_HANG:
             time.sleep(60)
@@ -130,7 +131,8 @@ class mock_selector:
         if self.select_state == 0:
             self.select_state = self.TIMEOUT
         else:
-            time.sleep(timeout)
+            # timeout is in milliseconds
+            time.sleep(timeout / 1000)
 
         return (state, None)
 
@@ -283,6 +285,19 @@ class TestRouteCheck(object):
             assert ret == expect_ret
             assert res == expect_res
 
+    @pytest.mark.parametrize("test_num", [k for k, v in TEST_DATA.items() if "-i" in v[ARGS].split()])
+    def test_route_check_incremental(self, mock_dbs, test_num):
+        self.init()
+
+        ct_data = TEST_DATA[test_num]
+        set_test_case_data(ct_data)
+        logger.info("Running incremental test case {}: {}".format(test_num, ct_data[DESCR]))
+
+        with patch('sys.argv', (ct_data[ARGS] + " -I").split()):
+            ret, res = route_check.main()
+            assert ret == (ct_data[RET] if RET in ct_data else 0)
+            assert res == (ct_data[RESULT] if RESULT in ct_data else None)
+
     def test_timeout(self, mock_dbs, force_hang):
         # Test timeout
         ex_raised = False
@@ -1,11 +1,13 @@
 import sys
 import os
+import threading
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 from .mock_tables import dbconnector
 
 import pytest
+import click
 from click.testing import CliRunner
 from utilities_common.db import Db
 
@@ -458,6 +460,59 @@ Ethernet0  N/A
         expected_output = "Ethernet16: SFP EEPROM is not applicable for RJ45 port\n\n\n"
         assert result.output == expected_output
 
+    @patch('sfputil.main.logical_port_name_to_physical_port_list', MagicMock(side_effect=lambda port: [int(port[8:])]))
+    @patch('sfputil.main.platform_sfputil', MagicMock(logical=["Ethernet0", "Ethernet4", "Ethernet8"]))
+    def test_show_eeprom_workers(self):
+        # Port -> event the read of the port waits for before finishing
+        wait_for = {}
+        read = {port: threading.Event() for port in (0, 4, 8)}
+        ethernet8_written = threading.Event()
+
+        def get_sfp_eeprom_output(logical_port_name, physical_port_list, dump_dom):
+            port = physical_port_list[0]
+            if port in wait_for:
+                assert wait_for[port].wait(timeout=10)
+            read[port].set()
+            return "{}: SFP EEPROM not detected\n\n".format(logical_port_name)
+
+        echo = click.echo
+
+        def echo_output(message=None, *args, **kwargs):
+            echo(message, *args, **kwargs)
+            if message is not None and message.startswith("Ethernet8"):
+                ethernet8_written.set()
+
+        expected_output = "Ethernet0: SFP EEPROM not detected\n\n" \
+                          "Ethernet4: SFP EEPROM not detected\n\n" \
+                          "Ethernet8: SFP EEPROM not detected\n\n\n"
+        runner = CliRunner()
+        with patch('sfputil.main.get_sfp_eeprom_output', MagicMock(side_effect=get_sfp_eeprom_output)), \
+                patch('sfputil.main.click.echo', echo_output):
+            # The ports finish in reverse order but are displayed in port order
+            wait_for.update({0: read[4], 4: read[8]})
+            result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom'], ["-w", "3"])
+            assert result.exit_code == 0
+            assert result.output == expected_output
+
+            # Ethernet8 is displayed before the other ports finish
+            wait_for.update({0: ethernet8_written, 4: ethernet8_written})
+            result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom'], ["-w", "3", "-s"])
+            assert result.exit_code == 0
+            assert sorted(result.output.split("\n\n")) == sorted(expected_output.split("\n\n"))
+            assert result.output.startswith("Ethernet8")
+
+    @patch('sfputil.main.platform_chassis')
+    @patch('sfputil.main.logical_port_name_to_physical_port_list', MagicMock(side_effect=lambda port: [int(port[8:])]))
+    @patch('sfputil.main.platform_sfputil', MagicMock(logical=["Ethernet0", "Ethernet4", "Ethernet8"]))
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=False))
+    def test_show_eeprom_workers_not_implemented(self, mock_chassis):
+        mock_chassis.get_sfp.return_value.get_presence.side_effect = NotImplementedError
+        runner = CliRunner()
+        for args in (["-w", "3"], ["-w", "3", "-s"], ["-w", "1"]):
+            result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom'], args)
+            assert result.exit_code == ERROR_NOT_IMPLEMENTED
+            assert result.output == "Sfp.get_presence() is currently not implemented for this platform\n"
+
     @patch('sfputil.main.platform_chassis')
     @patch('sfputil.main.platform_sfputil', MagicMock(is_logical_port=MagicMock(return_value=0)))
     def test_show_eeprom_hexdump_invalid_port(self, mock_chassis):
@@ -757,6 +812,93 @@ Ethernet0  N/A
         assert result.output == 'Firmware download complete success\nFirmware run in mode 0 successful\nFirmware commit successful\n'
         assert result.exit_code == 0
 
+    @patch('sfputil.main.platform_chassis')
+    @patch('sfputil.main.logical_port_to_physical_port_index', MagicMock(return_value=1))
+    def test_download_firmware_image(self, mock_chassis):
+        mock_sfp = MagicMock()
+        mock_api = MagicMock()
+        mock_sfp.get_xcvr_api = MagicMock(return_value=mock_api)
+        mock_chassis.get_sfp = MagicMock(return_value=mock_sfp)
+        mock_api.get_module_fw_mgmt_feature.return_value = {'status': True, 'feature': (2, 4, False, False, 4)}
+        mock_api.cdb_start_firmware_download.return_value = 1
+        mock_api.cdb_epl_block_write.return_value = 1
+        mock_api.cdb_firmware_download_complete.return_value = 1
+        progress = MagicMock()
+
+        status = sfputil.download_firmware_image("Ethernet0", b"0123456789", progress)
+
+        assert status == 1
+        mock_api.cdb_start_firmware_download.assert_called_once_with(2, b"01", 10)
+        assert mock_api.cdb_epl_block_write.call_args_list == [
+            mock.call(0, b"2345", False, 4), mock.call(4, b"6789", False, 4)]
+        assert progress.call_args_list == [mock.call(4), mock.call(4)]
+        mock_sfp.set_optoe_write_max.assert_called_with(1)
+
+        mock_api.cdb_epl_block_write.return_value = 0
+        with pytest.raises(sfputil.FirmwareDownloadError):
+            sfputil.download_firmware_image("Ethernet0", b"0123456789", progress)
+        mock_sfp.set_optoe_write_max.assert_called_with(1)
+
+    @patch('sfputil.main.platform_sfputil', MagicMock(logical=["Ethernet0", "Ethernet4", "Ethernet8"]))
+    @patch('sfputil.main.read_firmware_image', MagicMock(return_value=b"image"))
+    @patch('sfputil.main.logical_port_to_physical_port_index', MagicMock(side_effect=lambda port: int(port[8:])))
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(side_effect=lambda port: port == "Ethernet8"))
+    @patch('sfputil.main.is_sfp_present', MagicMock(return_value=True))
+    @patch('sfputil.main.is_fw_switch_done', MagicMock(return_value=1))
+    @patch('sfputil.main.commit_firmware', MagicMock(return_value=1))
+    def test_firmware_upgrade_all(self):
+        def download_firmware_image(port_name, image, progress):
+            if port_name == "Ethernet4":
+                raise sfputil.FirmwareDownloadError("CDB: firmware download failed! - status 0")
+            progress(len(image))
+            return 1
+
+        runner = CliRunner()
+        with patch('sfputil.main.download_firmware_image', MagicMock(side_effect=download_firmware_image)), \
+                patch('sfputil.main.run_firmware', MagicMock(return_value=1)) as mock_run_firmware:
+            result = runner.invoke(sfputil.cli.commands['firmware'].commands['upgrade-all'], ["a.b", "-w", "2"])
+        assert result.exit_code == EXIT_FAIL
+        mock_run_firmware.assert_called_once_with("Ethernet0", 0)
+        assert "Ethernet8: skipped, not applicable for RJ45 port" in result.output
+        assert "Ethernet4  Failed: CDB: firmware download failed! - status 0" in result.output
+        assert "Ethernet0  OK" in result.output
+
+    @patch('sfputil.main.platform_chassis')
+    @patch('sfputil.main.platform_sfputil', MagicMock(logical=["Ethernet0", "Ethernet4"]))
+    @patch('sfputil.main.read_firmware_image', MagicMock(return_value=b"image"))
+    @patch('sfputil.main.download_firmware_image', MagicMock(return_value=1))
+    @patch('sfputil.main.logical_port_to_physical_port_index', MagicMock(side_effect=lambda port: int(port[8:])))
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=False))
+    @patch('sfputil.main.is_sfp_present', MagicMock(return_value=True))
+    @patch('sfputil.main.is_fw_switch_done', MagicMock(return_value=1))
+    @patch('sfputil.main.commit_firmware', MagicMock(return_value=1))
+    def test_firmware_upgrade_all_run_firmware_not_implemented(self, mock_chassis):
+        def get_sfp(physical_port):
+            mock_sfp = MagicMock()
+            if physical_port == 0:
+                mock_sfp.get_xcvr_api.side_effect = NotImplementedError
+            else:
+                mock_sfp.get_xcvr_api.return_value.cdb_run_firmware.return_value = 1
+            return mock_sfp
+
+        mock_chassis.get_sfp.side_effect = get_sfp
+        runner = CliRunner()
+        result = runner.invoke(sfputil.cli.commands['firmware'].commands['upgrade-all'], ["a.b"])
+        assert result.exit_code == EXIT_FAIL
+        assert "Ethernet0  Failed: This functionality is currently not implemented for this platform" in result.output
+        assert "Ethernet4  OK" in result.output
+
+    @patch('sfputil.main.platform_chassis')
+    @patch('sfputil.main.logical_port_to_physical_port_index', MagicMock(return_value=1))
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=False))
+    @patch('sfputil.main.is_sfp_present', MagicMock(return_value=True))
+    def test_firmware_run_not_implemented(self, mock_chassis):
+        mock_chassis.get_sfp.return_value.get_xcvr_api.side_effect = NotImplementedError
+        runner = CliRunner()
+        result = runner.invoke(sfputil.cli.commands['firmware'].commands['run'], ["--mode", "0", "Ethernet0"])
+        assert result.exit_code == ERROR_NOT_IMPLEMENTED
+        assert result.output == "This functionality is currently not implemented for this platform\n"
+
     @patch('sfputil.main.is_sfp_present', MagicMock(return_value=True))
     @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=True))
     def test_firmware_run_RJ45(self):
@@ -1,10 +1,13 @@
 import os
 import sys
+import lazy_object_proxy
 import pytest
 import show.main as show
+import utilities_common.cli as clicommon
 from click.testing import CliRunner
 from unittest import mock
 from unittest.mock import call, MagicMock, patch
+from utilities_common.cli import UserCache
 
 EXPECTED_BASE_COMMAND = 'sudo '
 
@@ -53,6 +56,53 @@ class TestShowRunAllCommands(object):
         os.environ["PATH"] = os.pathsep.join(os.environ["PATH"].split(os.pathsep)[:-1])
         os.environ["UTILITIES_UNIT_TESTING"] = "0"
 
+class TestRoutingStack(object):
+    def teardown_method(self):
+        UserCache('show').remove()
+
+    @patch('show.main.probe_routing_stack', MagicMock(return_value='frr'))
+    @patch('show.main.get_bgp_container_id', MagicMock(return_value='cafe|2023-01-01 00:00:00'))
+    def test_routing_stack_cached(self):
+        assert show.get_routing_stack() == 'frr'
+        assert show.get_routing_stack() == 'frr'
+        assert show.probe_routing_stack.call_count == 1
+
+    @patch('show.main.probe_routing_stack', MagicMock(return_value='frr'))
+    def test_routing_stack_container_restarted(self):
+        with patch('show.main.get_bgp_container_id', MagicMock(return_value='cafe|2023-01-01 00:00:00')):
+            assert show.get_routing_stack() == 'frr'
+        with patch('show.main.get_bgp_container_id', MagicMock(return_value='cafe|2023-01-02 00:00:00')):
+            assert show.get_routing_stack() == 'frr'
+        assert show.probe_routing_stack.call_count == 2
+
+    @patch('show.main.probe_routing_stack', MagicMock(return_value='frr'))
+    @patch('show.main.get_bgp_container_id', MagicMock(return_value=None))
+    def test_routing_stack_not_cached(self):
+        assert show.get_routing_stack() == 'frr'
+        assert show.get_routing_stack() == 'frr'
+        assert show.probe_routing_stack.call_count == 2
+
+    @patch('show.bgp_common.show_routes')
+    @patch('show.main.probe_routing_stack', MagicMock(return_value='quagga'))
+    @patch('show.main.get_bgp_container_id', MagicMock(return_value=None))
+    def test_routing_stack_not_probed(self, show_routes):
+        from show.bgp_frr_v4 import bgp
+        ip = clicommon.LazyAliasedGroup(name='ip')
+        ip.add_lazy_plugin(['bgp'], show.add_ip_bgp_commands)
+
+        with patch('show.main.routing_stack', lazy_object_proxy.Proxy(show.get_routing_stack)), \
+                patch('show.main.ip', ip):
+            result = CliRunner().invoke(show.cli, ['ip', 'route'])
+            assert result.exit_code == 0
+            show_routes.assert_called_once()
+
+            # A bgp command added explicitly is kept
+            ip.add_command(bgp)
+            assert ip.commands['bgp'] is bgp
+
+        show.probe_routing_stack.assert_not_called()
+
+
 @patch('show.main.run_command')
 @pytest.mark.parametrize(
         "cli_arguments,expected",
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import re
+import threading
 from unittest.mock import Mock, call, patch
 
 import pytest
@@ -338,21 +339,107 @@ def test_manager_package_reset(package_manager, sonic_fs):
 
 
 def test_manager_migration(package_manager, fake_db_for_migration):
-    package_manager.install = Mock()
+    package_manager._install_or_upgrade_from_source = Mock()
     package_manager.migrate_packages(fake_db_for_migration)
 
-    package_manager.install.assert_has_calls([
+    sources = [call_args.args[0] for call_args in
+               package_manager._install_or_upgrade_from_source.call_args_list]
+    assert sorted((source.repository, source.reference) for source in sources) == [
         # test-package-3 was installed but there is a newer version installed
         # in fake_db_for_migration, asserting for upgrade
-        call('test-package-3=1.6.0'),
+        ('Azure/docker-test-3', '1.6.0'),
         # test-package-4 was not present in DB at all, but it is present and installed in
         # fake_db_for_migration, thus asserting that it is going to be installed.
-        call('test-package-4=1.5.0'),
+        ('Azure/docker-test-4', '1.5.0'),
         # test-package-5 1.5.0 was installed in fake_db_for_migration but the default
         # in current db is 1.9.0, assert that migration will install the newer version.
-        call('test-package-5=1.9.0'),
+        ('Azure/docker-test-5', '1.9.0'),
         # test-package-6 2.0.0 was installed in fake_db_for_migration but the default
         # in current db is 1.5.0, assert that migration will install the newer version.
-        call('test-package-6=2.0.0')],
-        any_order=True
-    )
+        ('Azure/docker-test-6', '2.0.0'),
+    ]
+
+
+def test_manager_migration_dockerd(package_manager, mock_docker_api,
+                                   fake_db_for_migration, fake_metadata_resolver):
+    # test-package-3 and test-package-6 are newer in fake_db_for_migration, so they
+    # are streamed from the old docker library, while test-package-4 and test-package-5
+    # are installed from registry. test-package-3 depends on test-package-6 which
+    # depends on test-package-5.
+    manifest = fake_metadata_resolver.metadata_store['Azure/docker-test-3']['1.6.0']['manifest']
+    manifest['package']['depends'] = ['test-package-6>=2.0.0']
+    manifest = fake_metadata_resolver.metadata_store['Azure/docker-test-6']['2.0.0']['manifest']
+    manifest['package']['depends'] = ['test-package-5>=1.0.0']
+    # Image labels of the old docker library are resolved the same way as local images.
+    fake_metadata_resolver.from_labels = fake_metadata_resolver.from_local
+
+    events = []
+    transfers_started = threading.Semaphore(0)
+
+    def get_image(image_id):
+        transfers_started.release()
+        return Mock(save=Mock(return_value=image_id))
+
+    def load_stream(stream):
+        events.append(('transfer', stream))
+        return Mock(id=stream)
+
+    def install(source):
+        if not events:
+            # Images must be already transferring while the first package is installed.
+            for _ in range(2):
+                assert transfers_started.acquire(timeout=5)
+        events.append(('install', source.get_package().name))
+
+    docker_api = Mock()
+    docker_api.labels = Mock(side_effect=lambda image_id: image_id)
+    docker_api.get_image = Mock(side_effect=get_image)
+    docker_api.load_stream = Mock(side_effect=load_stream)
+    package_manager._install_or_upgrade_from_source = Mock(side_effect=install)
+    mock_docker_api.client = Mock()
+
+    with patch('sonic_package_manager.manager.docker.DockerClient'), \
+         patch('sonic_package_manager.manager.DockerApi', return_value=docker_api):
+        package_manager.migrate_packages(fake_db_for_migration, '/var/run/docker.sock')
+
+    installs = [name for event, name in events if event == 'install']
+    assert sorted(installs) == ['test-package-3', 'test-package-4',
+                                'test-package-5', 'test-package-6']
+    assert installs.index('test-package-5') < installs.index('test-package-6') < installs.index('test-package-3')
+    # Each streamed image is loaded once and before its package is installed.
+    assert events.index(('transfer', 'Azure/docker-test-6:2.0.0')) < events.index(('install', 'test-package-6'))
+    assert events.index(('transfer', 'Azure/docker-test-3:1.6.0')) < events.index(('install', 'test-package-3'))
+    assert docker_api.load_stream.call_count == 2
+
+
+def test_installation_order():
+    def package(name, depends):
+        dependencies = [Mock() for _ in depends]
+        for dependency, dependency_name in zip(dependencies, depends):
+            dependency.name = dependency_name
+        return Mock(manifest={'package': {'name': name, 'depends': dependencies}})
+
+    packages = {
+        'dhcp-relay': package('dhcp-relay', ['database', 'swss']),
+        'swss': package('swss', ['database']),
+        'database': package('database', []),
+        'snmp': package('snmp', ['syncd']),
+    }
+
+    order = sonic_package_manager.manager.get_installation_order(packages)
+
+    assert sorted(order) == sorted(packages)
+    assert order.index('database') < order.index('swss') < order.index('dhcp-relay')
+
+
+def test_installation_order_circular_dependency():
+    first, second = Mock(), Mock()
+    first.name, second.name = 'first', 'second'
+    packages = {
+        'second': Mock(manifest={'package': {'depends': [first]}}),
+        'first': Mock(manifest={'package': {'depends': [second]}}),
+    }
+
+    order = sonic_package_manager.manager.get_installation_order(packages)
+
+    assert order == ['second', 'first']
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
+import io
 import json
+import hashlib
 import contextlib
+import tarfile
 from unittest.mock import Mock, MagicMock
 
 import pytest
@@ -9,7 +12,7 @@ import pytest
 from sonic_package_manager.database import PackageEntry
 from sonic_package_manager.errors import MetadataError
 from sonic_package_manager.manifest import Manifest
-from sonic_package_manager.metadata import MetadataResolver
+from sonic_package_manager.metadata import MetadataCache, MetadataResolver
 from sonic_package_manager.version import Version
 
 
@@ -43,7 +46,8 @@ def test_metadata_resolver_local(mock_registry_resolver, mock_docker_api):
 def test_metadata_resolver_remote(mock_registry_resolver, mock_docker_api):
     metadata_resolver = MetadataResolver(mock_docker_api, mock_registry_resolver)
     mock_registry = MagicMock()
-    mock_registry.manifest = MagicMock(return_value={'config': {'digest': 'some-digest'}})
+    mock_registry.manifest_content = MagicMock(return_value=b'{"config": {"digest": "some-digest"}}')
+    mock_registry.blob_content = MagicMock(return_value=b'{"config": {"Labels": {}}}')
 
     def return_mock_registry(repository):
         return mock_registry
@@ -54,8 +58,8 @@ def test_metadata_resolver_remote(mock_registry_resolver, mock_docker_api):
     with contextlib.suppress(MetadataError):
         metadata_resolver.from_registry('test-repository', '1.2.0')
     mock_registry_resolver.get_registry_for.assert_called_once_with('test-repository')
-    mock_registry.manifest.assert_called_once_with('test-repository', '1.2.0')
-    mock_registry.blobs.assert_called_once_with('test-repository', 'some-digest')
+    mock_registry.manifest_content.assert_called_once_with('test-repository', '1.2.0')
+    mock_registry.blob_content.assert_called_once_with('test-repository', 'some-digest')
     mock_docker_api.labels.assert_not_called()
 
 
@@ -87,3 +91,127 @@ def test_metadata_construction(manifest_str):
     })
     assert metadata.yang_modules == ['TEST', 'TEST 2']
 
+
+def make_image_tarball(path, labels, layers=0):
+    config = json.dumps({'config': {'Labels': labels}}).encode()
+    config_name = hashlib.sha256(config).hexdigest() + '.json'
+    manifest = json.dumps([{'Config': config_name, 'Layers': []}]).encode()
+
+    with tarfile.open(path, 'w') as tar:
+        members = [(f'layer{i}/layer.tar', b'layer') for i in range(layers)]
+        members += [(config_name, config), ('manifest.json', manifest)]
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    return 'sha256:' + config_name[:-len('.json')]
+
+
+def test_metadata_cache(tmp_path):
+    cache = MetadataCache(str(tmp_path / 'cache'))
+    digest = 'sha256:' + '0' * 64
+
+    assert cache.get(digest) is None
+    cache.put(digest, {'label': 'value'})
+    assert cache.get(digest) == {'label': 'value'}
+    # Non-digest references are mutable and never cached.
+    cache.put('latest', {'label': 'value'})
+    assert cache.get('latest') is None
+
+
+def test_metadata_cache_put_failure(tmp_path):
+    cache = MetadataCache(str(tmp_path))
+    digest = 'sha256:' + '0' * 64
+
+    cache.put(digest, {'label': object()})
+
+    assert cache.get(digest) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_metadata_resolver_local_cached(tmp_path, mock_registry_resolver, mock_docker_api, manifest_str):
+    cache = MetadataCache(str(tmp_path))
+    metadata_resolver = MetadataResolver(mock_docker_api, mock_registry_resolver, cache)
+    image_id = 'sha256:' + '1' * 64
+    mock_docker_api.labels = Mock(return_value={'com.azure.sonic.manifest': manifest_str})
+
+    metadata_resolver.from_local(image_id)
+    metadata = metadata_resolver.from_local(image_id)
+
+    mock_docker_api.labels.assert_called_once_with(image_id)
+    assert metadata.manifest['package']['name'] == 'test'
+
+
+def test_metadata_resolver_local_by_name_cached(tmp_path, mock_registry_resolver, mock_docker_api, manifest_str):
+    cache = MetadataCache(str(tmp_path))
+    metadata_resolver = MetadataResolver(mock_docker_api, mock_registry_resolver, cache)
+    image_id = 'sha256:' + '1' * 64
+    labels = {'com.azure.sonic.manifest': manifest_str}
+    mock_docker_api.get_image = Mock(return_value=Mock(id=image_id, labels=labels))
+
+    metadata_resolver.from_local('docker-test:latest')
+    metadata = metadata_resolver.from_local('docker-test:latest')
+
+    mock_docker_api.get_image.assert_called_once_with('docker-test:latest')
+    mock_docker_api.labels.assert_not_called()
+    assert cache.get(image_id) == labels
+    assert metadata.manifest['package']['name'] == 'test'
+
+
+def mock_registry_image(mock_registry_resolver, labels, config_digest=None):
+    config = json.dumps({'config': {'Labels': labels}}).encode()
+    config_digest = config_digest or 'sha256:' + hashlib.sha256(config).hexdigest()
+    manifest = json.dumps({'config': {'digest': config_digest}}).encode()
+    mock_registry = MagicMock()
+    mock_registry.manifest_content = MagicMock(return_value=manifest)
+    mock_registry.blob_content = MagicMock(return_value=config)
+    mock_registry_resolver.get_registry_for = Mock(return_value=mock_registry)
+    return mock_registry, config_digest, 'sha256:' + hashlib.sha256(manifest).hexdigest()
+
+
+def test_metadata_resolver_remote_cached(tmp_path, mock_registry_resolver, mock_docker_api, manifest_str):
+    cache = MetadataCache(str(tmp_path))
+    metadata_resolver = MetadataResolver(mock_docker_api, mock_registry_resolver, cache)
+    labels = {'com.azure.sonic.manifest': manifest_str}
+    mock_registry, config_digest, manifest_digest = mock_registry_image(mock_registry_resolver, labels)
+
+    metadata_resolver.from_registry('test-repository', '1.2.0')
+    metadata_resolver.from_registry('test-repository', '1.2.0')
+
+    assert mock_registry.manifest_content.call_count == 2
+    mock_registry.blob_content.assert_called_once()
+    assert cache.get(config_digest) == labels
+
+    metadata_resolver.from_registry('test-repository', manifest_digest)
+    metadata_resolver.from_registry('test-repository', manifest_digest)
+
+    assert mock_registry.manifest_content.call_count == 3
+    assert cache.get(manifest_digest) == labels
+
+
+def test_metadata_resolver_remote_unverified(tmp_path, mock_registry_resolver, mock_docker_api, manifest_str):
+    cache = MetadataCache(str(tmp_path))
+    metadata_resolver = MetadataResolver(mock_docker_api, mock_registry_resolver, cache)
+    labels = {'com.azure.sonic.manifest': manifest_str}
+    config_digest = 'sha256:' + '2' * 64
+    mock_registry, _, _ = mock_registry_image(mock_registry_resolver, labels, config_digest)
+
+    metadata = metadata_resolver.from_registry('test-repository', '1.2.0')
+
+    # The config blob does not hash to the digest the manifest references it by
+    assert metadata.manifest['package']['name'] == 'test'
+    assert cache.get(config_digest) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_metadata_resolver_tarball(tmp_path, mock_registry_resolver, mock_docker_api, manifest_str):
+    cache = MetadataCache(str(tmp_path / 'cache'))
+    metadata_resolver = MetadataResolver(mock_docker_api, mock_registry_resolver, cache)
+    tarball = str(tmp_path / 'image.tar')
+    digest = make_image_tarball(tarball, {'com.azure.sonic.manifest': manifest_str}, layers=3)
+
+    metadata = metadata_resolver.from_tarball(tarball)
+
+    assert metadata.manifest['package']['name'] == 'test'
+    assert cache.get(digest) == {'com.azure.sonic.manifest': manifest_str}
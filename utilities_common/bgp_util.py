@@ -201,7 +201,7 @@ def run_bgp_show_command(vtysh_cmd, bgp_namespace=multi_asic.DEFAULT_NAMESPACE):
     # handle the the alias mode in the following code
     if output is not None:
         if clicommon.get_interface_naming_mode() == "alias" and re.search("show ip|ipv6 route", vtysh_cmd):
-            iface_alias_converter = clicommon.InterfaceAliasConverter()
+            iface_alias_converter = clicommon.get_interface_alias_converter()
             route_info =json.loads(output)
             for route, info in route_info.items():
                 for i in range(0, len(info)):
@@ -0,0 +1,189 @@
+# Bulk redis access helpers #
+#
+# Show commands usually need every hash of a table (all port counters, all
+# queue watermarks, ...). Reading them one key or one field at a time costs a
+# round trip per read, so these helpers batch the reads through a redis
+# pipeline.
+#
+# The DBConnector returned by swsscommon's get_redis_client() has no
+# pipeline(), so reads go through a redis-py client opened on the unix socket
+# of the same redis instance, and writes through buffered swsscommon Tables.
+
+from swsscommon import swsscommon
+
+DEFAULT_BATCH_SIZE = 1024
+DEFAULT_SCAN_COUNT = 1000
+
+# (unix socket path, db id) -> redis-py client, reused across reads
+_redis_clients = {}
+
+
+def get_pipeline(client):
+    """
+        Return a non-transactional pipeline for the redis client,
+        or None if the client does not support pipelining.
+    """
+    pipeline = getattr(client, 'pipeline', None)
+    if pipeline is None:
+        return None
+    return pipeline(transaction=False)
+
+
+def get_namespace(db):
+    namespace = getattr(db, 'namespace', None)
+    if namespace is None and hasattr(db, 'getNamespace'):
+        namespace = db.getNamespace()
+    return namespace or ''
+
+
+def get_pipeline_client(db, db_name):
+    """
+        Return a client of db_name of a SonicV2Connector which supports
+        pipeline(): the connector's own client if it does, else a redis-py
+        client on the unix socket of db_name, the one swsscommon uses, so
+        that namespace DBs are reached on their own redis instance. Returns
+        None if no such client can be opened.
+    """
+    client = db.get_redis_client(db_name)
+    if hasattr(client, 'pipeline'):
+        return client
+
+    try:
+        import redis
+        namespace = get_namespace(db)
+        address = (swsscommon.SonicDBConfig.getDbSock(db_name, namespace),
+                   swsscommon.SonicDBConfig.getDbId(db_name, namespace))
+    except Exception:
+        return None
+
+    if not address[0]:
+        return None
+
+    if address not in _redis_clients:
+        sock, db_id = address
+        _redis_clients[address] = redis.Redis(unix_socket_path=sock, db=db_id, decode_responses=True)
+    return _redis_clients[address]
+
+
+def hgetall_bulk_client(client, keys, batch_size=DEFAULT_BATCH_SIZE):
+    """
+        Read all the hashes in keys from a redis client.
+        Returns a dict of key -> {field: value}, missing keys map to {}.
+    """
+    keys = list(keys)
+    result = {}
+    pipe = get_pipeline(client)
+    if pipe is None:
+        for key in keys:
+            result[key] = dict(client.hgetall(key) or {})
+        return result
+
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start:start + batch_size]
+        for key in batch:
+            pipe.hgetall(key)
+        for key, fvs in zip(batch, pipe.execute()):
+            result[key] = dict(fvs or {})
+    return result
+
+
+def hgetall_bulk(db, db_name, keys, batch_size=DEFAULT_BATCH_SIZE):
+    """
+        Read all the hashes in keys from db_name of a SonicV2Connector,
+        batch_size keys per pipelined round trip. Falls back to one read
+        per key through the connector's client if redis can not be reached
+        through a pipeline.
+        Returns a dict of key -> {field: value}, missing keys map to {}.
+    """
+    keys = list(keys)
+    client = db.get_redis_client(db_name)
+    pipeline_client = get_pipeline_client(db, db_name)
+    if pipeline_client is not None and pipeline_client is not client:
+        # If the redis-py client fails, e.g. redis is not reachable at the
+        # address of the db config, read one key at a time through the
+        # connector
+        try:
+            return hgetall_bulk_client(pipeline_client, keys, batch_size)
+        except Exception:
+            pass
+    return hgetall_bulk_client(client, keys, batch_size)
+
+
+def scan_keys_client(client, pattern, count=DEFAULT_SCAN_COUNT):
+    """
+        Return the keys matching pattern from a redis client. Iterates with
+        SCAN so that redis is not blocked for the whole keyspace walk like
+        it is with KEYS, which is the fallback for clients without SCAN.
+    """
+    scan_iter = getattr(client, 'scan_iter', None)
+    if scan_iter is not None:
+        return list(scan_iter(match=pattern, count=count))
+
+    scan = getattr(client, 'scan', None)
+    if scan is None:
+        return list(client.keys(pattern) or [])
+
+    keys = []
+    cursor = 0
+    while True:
+        cursor, batch = scan(cursor, pattern, count)
+        keys.extend(batch)
+        if int(cursor) == 0:
+            return keys
+
+
+def scan_keys(db, db_name, pattern, count=DEFAULT_SCAN_COUNT):
+    """
+        Return the keys matching pattern from db_name of a SonicV2Connector.
+    """
+    return scan_keys_client(db.get_redis_client(db_name), pattern, count)
+
+
+class BulkHashWriter(object):
+    """
+        Queues HSETs to db_name of a SonicV2Connector and sends them every
+        batch_size writes: through a pipeline if the connector's client
+        supports one, else through buffered swsscommon Tables, one per
+        table of the written keys. Use as a context manager, or call
+        flush() once done.
+    """
+    def __init__(self, db, db_name, batch_size=DEFAULT_BATCH_SIZE):
+        self.client = db.get_redis_client(db_name)
+        self.separator = db.get_db_separator(db_name)
+        self.batch_size = batch_size
+        self.pipe = get_pipeline(self.client)
+        self.tables = {}
+        self.pending = 0
+
+    def get_table(self, table_name):
+        table = self.tables.get(table_name)
+        if table is None:
+            table = swsscommon.Table(self.client, table_name)
+            table.setBuffered(True)
+            self.tables[table_name] = table
+        return table
+
+    def hset(self, key, field, value):
+        if self.pipe is not None:
+            self.pipe.hset(key, field, value)
+        else:
+            table_name, _, table_key = key.partition(self.separator)
+            self.get_table(table_name).set(table_key, [(field, value)])
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            if self.pipe is not None:
+                self.pipe.execute()
+            for table in self.tables.values():
+                table.flush()
+        self.pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
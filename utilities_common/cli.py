@@ -1,17 +1,19 @@
 import configparser
 import datetime
+import importlib
 import os
 import re
 import subprocess
 import sys
 import shutil
 
+from collections.abc import MutableMapping
+
 import click
 import json
 import lazy_object_proxy
 import netaddr
 
-from natsort import natsorted
 from sonic_py_common import multi_asic
 from utilities_common.db import Db
 from utilities_common.general import load_db_config
@@ -117,6 +119,139 @@ class AliasedGroup(click.Group):
             return click.Group.get_command(self, ctx, matches[0])
         ctx.fail('Too many matches: %s' % ', '.join(sorted(matches)))
 
+
+class _LazyPlugin(object):
+    """Plugin registered in a LazyGroup, loaded at most once"""
+
+    def __init__(self, load):
+        self._load = load
+        self.loaded = False
+
+    def load(self):
+        if not self.loaded:
+            self.loaded = True
+            self._load()
+
+
+class LazyCommands(MutableMapping):
+    """Subcommands of a LazyGroup.
+
+       Commands of the lazy index are listed like the loaded ones but their
+       module is imported on first access only, together with the plugins
+       which provide or extend them.
+    """
+
+    def __init__(self, commands=None):
+        self._commands = dict(commands or {})
+        # command name -> 'module:attribute'
+        self._lazy = {}
+        # command name -> callable telling whether the command is available,
+        # called until the command is loaded
+        self._conditions = {}
+        # command name -> plugins providing or extending the command
+        self._plugins = {}
+
+    def add_lazy_commands(self, index, conditions=None):
+        self._lazy.update(index)
+        self._conditions.update(conditions or {})
+
+    def add_lazy_plugin(self, names, load):
+        plugin = _LazyPlugin(load)
+        # A plugin extending a command which is already loaded can not wait
+        if any(name in self._commands for name in names):
+            plugin.load()
+            return
+        for name in names:
+            self._plugins.setdefault(name, []).append(plugin)
+
+    def is_loaded(self, name):
+        """Whether the command name is loaded, i.e. usable without importing
+           its module or loading a plugin.
+        """
+        return name in self._commands
+
+    def _is_available(self, name):
+        condition = self._conditions.get(name)
+        return name in self._lazy and (condition is None or condition())
+
+    def _is_pending(self, name):
+        if self._is_available(name):
+            return True
+        return any(not plugin.loaded for plugin in self._plugins.get(name, []))
+
+    def _load(self, name):
+        if self._is_available(name):
+            module_name, attr = self._lazy.pop(name).split(':')
+            self._conditions.pop(name, None)
+            self._commands[name] = getattr(importlib.import_module(module_name), attr)
+        for plugin in self._plugins.pop(name, []):
+            plugin.load()
+
+    def __getitem__(self, name):
+        self._load(name)
+        return self._commands[name]
+
+    def __setitem__(self, name, command):
+        self._lazy.pop(name, None)
+        self._conditions.pop(name, None)
+        self._commands[name] = command
+
+    def __delitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+        self._lazy.pop(name, None)
+        self._conditions.pop(name, None)
+        self._plugins.pop(name, None)
+        self._commands.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._commands or self._is_pending(name)
+
+    def __iter__(self):
+        names = list(self._commands)
+        for name in list(self._lazy) + list(self._plugins):
+            if name not in names and self._is_pending(name):
+                names.append(name)
+        return iter(names)
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+
+class LazyGroup(click.Group):
+    """This subclass of click.Group registers subcommands from a static
+       index of 'module:attribute' and imports their module only when they
+       are used, so that the startup of the CLI does not pay for all of them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(LazyGroup, self).__init__(*args, **kwargs)
+        self.commands = LazyCommands(self.commands)
+
+    def add_lazy_commands(self, index, conditions=None):
+        """Register the commands of index, a dict of command name ->
+           'module:attribute'. A command of conditions, a dict of command
+           name -> callable, is only available if its callable returns True.
+        """
+        self.commands.add_lazy_commands(index, conditions)
+
+    def add_lazy_plugin(self, names, load):
+        """Register a plugin providing or extending the commands names,
+           load is called to register it when one of them is first used.
+        """
+        self.commands.add_lazy_plugin(names, load)
+
+
+class LazyAliasedGroup(LazyGroup, AliasedGroup):
+    """AliasedGroup with lazily loaded subcommands"""
+    pass
+
+
+class LazyAbbreviationGroup(LazyGroup, AbbreviationGroup):
+    """AbbreviationGroup with lazily loaded subcommands"""
+    pass
+
+
 class InterfaceAliasConverter(object):
     """Class which handles conversion between interface name and alias"""
 
@@ -144,6 +279,13 @@ class InterfaceAliasConverter(object):
             except KeyError:
                 break
 
+        # Hash indexes for name <-> alias lookups, the first port wins on duplicate aliases
+        self.alias_to_name_map = {}
+        for port_name, port_info in self.port_dict.items():
+            if 'alias' in port_info:
+                self.alias_to_name_map.setdefault(port_info['alias'], port_name)
+        self.port_name_regex = None
+
     def name_to_alias(self, interface_name):
         """Return vendor interface alias if SONiC
            interface name is given as argument
@@ -157,10 +299,9 @@ class InterfaceAliasConverter(object):
                 # interface_name holds the parent port name
                 interface_name = interface_name[:sub_intf_sep_idx]
 
-            for port_name in self.port_dict:
-                if interface_name == port_name:
-                    return self.port_dict[port_name]['alias'] if sub_intf_sep_idx == -1 \
-                            else self.port_dict[port_name]['alias'] + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+            if interface_name in self.port_dict:
+                alias = self.port_dict[interface_name]['alias']
+                return alias if sub_intf_sep_idx == -1 else alias + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
 
         # interface_name not in port_dict. Just return interface_name
         return interface_name if sub_intf_sep_idx == -1 else interface_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
@@ -178,13 +319,40 @@ class InterfaceAliasConverter(object):
                 # interface_alias holds the parent port alias
                 interface_alias = interface_alias[:sub_intf_sep_idx]
 
-            for port_name in self.port_dict:
-                if interface_alias == self.port_dict[port_name]['alias']:
-                    return port_name if sub_intf_sep_idx == -1 else port_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+            port_name = self.alias_to_name_map.get(interface_alias)
+            if port_name is not None:
+                return port_name if sub_intf_sep_idx == -1 else port_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
 
         # interface_alias not in port_dict. Just return interface_alias
         return interface_alias if sub_intf_sep_idx == -1 else interface_alias + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
 
+    def replace_names_with_aliases(self, text):
+        """Replace every SONiC interface name in text which is either at the
+           start of a line or preceded by whitespace, and followed by the end
+           of a line, whitespace or a comma followed by whitespace
+        """
+        if not self.port_dict:
+            return text
+        if self.port_name_regex is None:
+            # Longest names first so that Ethernet1 never shadows Ethernet10
+            names = sorted(self.port_dict, key=len, reverse=True)
+            self.port_name_regex = re.compile(r"(^|\s)({})(?=$|,?\s)".format(
+                "|".join(re.escape(name) for name in names)), re.MULTILINE)
+        return self.port_name_regex.sub(
+            lambda m: m.group(1) + self.port_dict[m.group(2)].get('alias', m.group(2)), text)
+
+# Process wide InterfaceAliasConverter instances, keyed by the namespaces they were built for
+_iface_alias_converters = {}
+
+def get_interface_alias_converter():
+    """Return the cached InterfaceAliasConverter of the current topology"""
+    namespaces = tuple(multi_asic.get_namespace_list())
+    converter = _iface_alias_converters.get(namespaces)
+    if converter is None:
+        converter = InterfaceAliasConverter()
+        _iface_alias_converters[namespaces] = converter
+    return converter
+
 # Lazy global class instance for SONiC interface name to alias conversion
 iface_alias_converter = lazy_object_proxy.Proxy(lambda: InterfaceAliasConverter())
 
@@ -356,9 +524,9 @@ def interface_has_mirror_config(mirror_table, interface_name):
 
     return False
 
-def print_output_in_alias_mode(output, index):
-    """Convert and print all instances of SONiC interface
-       name to vendor-sepecific interface aliases.
+def convert_output_in_alias_mode(output, index):
+    """Convert the SONiC interface name found at word position
+       index of the output line to the vendor-specific alias.
     """
 
     alias_name = ""
@@ -380,16 +548,106 @@ def print_output_in_alias_mode(output, index):
     if word:
         interface_name = word[index]
         interface_name = interface_name.replace(':', '')
-    for port_name in natsorted(list(iface_alias_converter.port_dict.keys())):
-            if interface_name == port_name:
-                alias_name = iface_alias_converter.port_dict[port_name]['alias']
+    if interface_name in iface_alias_converter.port_dict:
+        alias_name = iface_alias_converter.port_dict[interface_name]['alias']
     if alias_name:
         if len(alias_name) < iface_alias_converter.alias_max_length:
             alias_name = alias_name.rjust(
                                 iface_alias_converter.alias_max_length)
         output = output.replace(interface_name, alias_name, 1)
 
-    click.echo(output.rstrip('\n'))
+    return output.rstrip('\n')
+
+def print_output_in_alias_mode(output, index):
+    """Convert and print all instances of SONiC interface
+       name to vendor-sepecific interface aliases.
+    """
+    click.echo(convert_output_in_alias_mode(output, index))
+
+def _rjust_header(output, header):
+    """Right-justify the column header to the alias width"""
+    if output.startswith(header):
+        output = output.replace(header, header.rjust(
+                    iface_alias_converter.alias_max_length))
+    return output
+
+def get_alias_mode_converter(command):
+    """Return a function converting one output line of command
+       to alias mode. The command specific handling is resolved
+       once here instead of on every line.
+    """
+
+    def column_converter(index, headers=()):
+        def convert(raw_output):
+            output = raw_output.lstrip()
+            for header in headers:
+                output = _rjust_header(output, header)
+            return convert_output_in_alias_mode(output, index)
+        return convert
+
+    if command.startswith("portstat"):
+        """Show interface counters"""
+        return column_converter(0, ("IFACE",))
+
+    elif command.startswith("intfstat"):
+        """Show RIF counters"""
+        return column_converter(0, ("IFACE",))
+
+    elif command == "pfcstat":
+        """Show pfc counters"""
+        return column_converter(0, ("Port Tx", "Port Rx"))
+
+    elif (command.startswith("sudo sfputil show eeprom")):
+        """Show interface transceiver eeprom"""
+        return lambda raw_output: convert_output_in_alias_mode(raw_output, 0)
+
+    elif (command.startswith("sudo sfputil show")):
+        """Show interface transceiver lpmode,
+           presence
+        """
+        return column_converter(0, ("Port",))
+
+    elif command == "sudo lldpshow":
+        """Show lldp table"""
+        return column_converter(0, ("LocalPort",))
+
+    elif command.startswith("queuestat"):
+        """Show queue counters"""
+        return column_converter(0, ("Port",))
+
+    elif command == "fdbshow":
+        """Show mac"""
+        def convert_fdbshow(raw_output):
+            output = raw_output.lstrip()
+            if output.startswith("No."):
+                output = "  " + output
+                output = re.sub(
+                            'Type', '      Type', output)
+            elif output[0].isdigit():
+                output = "    " + output
+            return convert_output_in_alias_mode(output, 3)
+        return convert_fdbshow
+
+    elif command.startswith("nbrshow"):
+        """Show arp"""
+        def convert_nbrshow(raw_output):
+            output = raw_output.lstrip()
+            if "Vlan" in output:
+                output = output.replace('Vlan', '  Vlan')
+            return convert_output_in_alias_mode(output, 2)
+        return convert_nbrshow
+
+    elif command.startswith("sudo ipintutil"):
+        """Show ip(v6) int"""
+        return column_converter(0, ("Interface",))
+
+    """
+    Default command conversion
+    Search for port names either at the start of a line or preceded immediately by
+    whitespace and followed immediately by either the end of a line or whitespace
+    or a comma followed by whitespace
+    """
+    return lambda raw_output: iface_alias_converter.replace_names_with_aliases(raw_output).rstrip('\n')
 
 def run_command_in_alias_mode(command):
     """Run command and replace all instances of SONiC interface names
@@ -397,116 +655,14 @@ def run_command_in_alias_mode(command):
     """
 
     process = subprocess.Popen(command, shell=True, text=True, stdout=subprocess.PIPE)
+    convert = get_alias_mode_converter(command)
 
-    while True:
-        output = process.stdout.readline()
-        if output == '' and process.poll() is not None:
-            break
-
-        if output:
-            index = 1
-            raw_output = output
-            output = output.lstrip()
-
-            if command.startswith("portstat"):
-                """Show interface counters"""
-                index = 0
-                if output.startswith("IFACE"):
-                    output = output.replace("IFACE", "IFACE".rjust(
-                               iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
-
-            elif command.startswith("intfstat"):
-                """Show RIF counters"""
-                index = 0
-                if output.startswith("IFACE"):
-                    output = output.replace("IFACE", "IFACE".rjust(
-                               iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
-
-            elif command == "pfcstat":
-                """Show pfc counters"""
-                index = 0
-                if output.startswith("Port Tx"):
-                    output = output.replace("Port Tx", "Port Tx".rjust(
-                                iface_alias_converter.alias_max_length))
-
-                elif output.startswith("Port Rx"):
-                    output = output.replace("Port Rx", "Port Rx".rjust(
-                                iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
-
-            elif (command.startswith("sudo sfputil show eeprom")):
-                """Show interface transceiver eeprom"""
-                index = 0
-                print_output_in_alias_mode(raw_output, index)
-
-            elif (command.startswith("sudo sfputil show")):
-                """Show interface transceiver lpmode,
-                   presence
-                """
-                index = 0
-                if output.startswith("Port"):
-                    output = output.replace("Port", "Port".rjust(
-                               iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
-
-            elif command == "sudo lldpshow":
-                """Show lldp table"""
-                index = 0
-                if output.startswith("LocalPort"):
-                    output = output.replace("LocalPort", "LocalPort".rjust(
-                               iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
-
-            elif command.startswith("queuestat"):
-                """Show queue counters"""
-                index = 0
-                if output.startswith("Port"):
-                    output = output.replace("Port", "Port".rjust(
-                               iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
-
-            elif command == "fdbshow":
-                """Show mac"""
-                index = 3
-                if output.startswith("No."):
-                    output = "  " + output
-                    output = re.sub(
-                                'Type', '      Type', output)
-                elif output[0].isdigit():
-                    output = "    " + output
-                print_output_in_alias_mode(output, index)
-
-            elif command.startswith("nbrshow"):
-                """Show arp"""
-                index = 2
-                if "Vlan" in output:
-                    output = output.replace('Vlan', '  Vlan')
-                print_output_in_alias_mode(output, index)
-            elif command.startswith("sudo ipintutil"):
-                """Show ip(v6) int"""
-                index = 0
-                if output.startswith("Interface"):
-                   output = output.replace("Interface", "Interface".rjust(
-                               iface_alias_converter.alias_max_length))
-                print_output_in_alias_mode(output, index)
+    # Echo each line as it is read, so that followed output such as
+    # 'show logging -f' is not held back
+    for output in process.stdout:
+        click.echo(convert(output))
 
-            else:
-                """
-                Default command conversion
-                Search for port names either at the start of a line or preceded immediately by
-                whitespace and followed immediately by either the end of a line or whitespace
-                or a comma followed by whitespace
-                """
-                converted_output = raw_output
-                for port_name in iface_alias_converter.port_dict:
-                    converted_output = re.sub(r"(^|\s){}($|,{{0,1}}\s)".format(port_name),
-                            r"\1{}\2".format(iface_alias_converter.name_to_alias(port_name)),
-                            converted_output)
-                click.echo(converted_output.rstrip('\n'))
-
-    rc = process.poll()
+    rc = process.wait()
     if rc != 0:
         sys.exit(rc)
 
@@ -0,0 +1,221 @@
+"""
+Static command index of a lazily loaded CLI, see utilities_common.cli.LazyGroup.
+
+The index of a CLI package, e.g. 'show', is the module <package>.commands_index.
+Its MODULES list names the submodules whose top-level commands, or the
+'submodule:attribute' commands, are added to the root command. COMMANDS and
+PLUGINS are generated from them and from the plugins of <package>.plugins:
+
+    python -m utilities_common.cli_index show config
+
+The startup cost of the CLI and the import cost of each of its subcommands
+are measured with:
+
+    python -m utilities_common.cli_index --benchmark show
+"""
+
+import argparse
+import ast
+import importlib
+import inspect
+import pkgutil
+import statistics
+import subprocess
+import sys
+
+import click
+from tabulate import tabulate
+
+from utilities_common.cli import LazyGroup
+
+INDEX_MODULE = 'commands_index'
+
+INDEX_TEMPLATE = '''\
+"""
+Static index of the lazily loaded '{package}' subcommands.
+
+Generated by 'python -m utilities_common.cli_index {package}' from MODULES:
+edit MODULES and regenerate rather than editing COMMANDS and PLUGINS.
+"""
+
+ROOT = {root!r}
+
+# Submodules whose top-level commands, or 'submodule:attribute' commands,
+# are added to ROOT
+MODULES = [
+{modules}
+]
+
+# Command name -> 'module:attribute'
+COMMANDS = {{
+{commands}
+}}
+
+# Plugin module -> names of the top-level commands it provides or extends
+PLUGINS = {{
+{plugins}
+}}
+'''
+
+BENCHMARK_SCRIPT = '''\
+import importlib, sys, time
+start = time.perf_counter()
+root = getattr(importlib.import_module({module!r}), {attr!r})
+loaded = time.perf_counter()
+if len(sys.argv) > 1:
+    root.commands.get(sys.argv[1])
+print(loaded - start, time.perf_counter() - loaded)
+'''
+
+
+def get_index(package):
+    return importlib.import_module('{}.{}'.format(package, INDEX_MODULE))
+
+
+def get_root_commands(module):
+    """ Return a list of (attribute, command) of the commands defined in
+        module which are not a subcommand of another group. """
+
+    commands = [(attr, obj) for attr, obj in vars(module).items()
+                if isinstance(obj, click.Command) and
+                getattr(obj.callback, '__module__', None) == module.__name__]
+    subcommands = set()
+    groups = [obj for obj in vars(module).values()
+              if isinstance(obj, click.Group) and not isinstance(obj, LazyGroup)]
+    while groups:
+        group = groups.pop()
+        for command in group.commands.values():
+            if id(command) not in subcommands:
+                subcommands.add(id(command))
+                if isinstance(command, click.Group):
+                    groups.append(command)
+
+    root_commands = []
+    seen = set()
+    for attr, command in commands:
+        if id(command) in subcommands or id(command) in seen:
+            continue
+        seen.add(id(command))
+        root_commands.append((attr, command))
+    return root_commands
+
+
+def get_plugin_commands(module):
+    """ Return the names of the top-level commands the register() function
+        of plugin module adds to or looks up in the root command. """
+
+    tree = ast.parse(inspect.getsource(module))
+    register = next(node for node in tree.body
+                    if isinstance(node, ast.FunctionDef) and node.name == 'register')
+    root = register.args.args[0].arg
+
+    names = []
+    for node in ast.walk(register):
+        name = None
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and
+                node.func.attr == 'add_command' and
+                isinstance(node.func.value, ast.Name) and node.func.value.id == root):
+            name = getattr(module, node.args[0].id).name
+        elif (isinstance(node, ast.Subscript) and isinstance(node.value, ast.Attribute) and
+                node.value.attr == 'commands' and
+                isinstance(node.value.value, ast.Name) and node.value.value.id == root):
+            key = node.slice
+            # Before Python 3.9 the subscript is wrapped in an ast.Index
+            if not isinstance(key, ast.Constant):
+                key = key.value
+            name = key.value
+        if name is not None and name not in names:
+            names.append(name)
+    return names
+
+
+def build_index(package, modules):
+    """ Return the COMMANDS and PLUGINS of the index of package from
+        modules, a list of submodule names, to add their top-level commands,
+        or of 'submodule:attribute', to add one command. """
+
+    commands = {}
+    for entry in modules:
+        module_name, _, attr = entry.partition(':')
+        module = importlib.import_module('{}.{}'.format(package, module_name))
+        if attr:
+            root_commands = [(attr, getattr(module, attr))]
+        else:
+            root_commands = get_root_commands(module)
+        for attr, command in root_commands:
+            commands[command.name] = '{}:{}'.format(module.__name__, attr)
+
+    plugins = {}
+    plugins_package = importlib.import_module('{}.plugins'.format(package))
+    for _, module_name, ispkg in pkgutil.iter_modules(plugins_package.__path__,
+                                                      plugins_package.__name__ + '.'):
+        # Subpackages hold the plugins installed at runtime
+        if ispkg:
+            continue
+        module = importlib.import_module(module_name)
+        plugins[module_name] = get_plugin_commands(module)
+
+    return commands, plugins
+
+
+def render_index(package, root, modules, commands, plugins):
+    return INDEX_TEMPLATE.format(
+        package=package,
+        root=root,
+        modules='\n'.join('    {!r},'.format(module) for module in modules),
+        commands='\n'.join('    {!r}: {!r},'.format(name, commands[name]) for name in sorted(commands)),
+        plugins='\n'.join('    {!r}: {!r},'.format(name, plugins[name]) for name in sorted(plugins)),
+    )
+
+
+def generate(package):
+    index = get_index(package)
+    commands, plugins = build_index(package, index.MODULES)
+    with open(index.__file__, 'w') as f:
+        f.write(render_index(package, index.ROOT, index.MODULES, commands, plugins))
+
+
+def measure(root, command=None):
+    """ Return the time to import the root command and the time to load
+        command, in a fresh interpreter. """
+
+    module, attr = root.split(':')
+    args = [sys.executable, '-c', BENCHMARK_SCRIPT.format(module=module, attr=attr)]
+    if command is not None:
+        args.append(command)
+    output = subprocess.check_output(args, universal_newlines=True)
+    startup, load = output.split()[-2:]
+    return float(startup), float(load)
+
+
+def benchmark(package, repeat):
+    index = get_index(package)
+    names = sorted(set(index.COMMANDS) | set(name for names in index.PLUGINS.values() for name in names))
+
+    body = []
+    for name in [None] + names:
+        samples = [measure(index.ROOT, name) for _ in range(repeat)]
+        body.append([name or '(startup)',
+                     '{:.1f}'.format(statistics.median(sample[0] for sample in samples) * 1000),
+                     '{:.1f}'.format(statistics.median(sample[1] for sample in samples) * 1000)])
+    print(tabulate(body, ['Command', 'Import root (ms)', 'Load command (ms)']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the command index of lazily loaded CLIs')
+    parser.add_argument('packages', nargs='+', help='CLI packages, e.g. show')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='measure the import cost of each subcommand instead')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs of each benchmark measurement')
+    args = parser.parse_args()
+
+    for package in args.packages:
+        if args.benchmark:
+            benchmark(package, args.repeat)
+        else:
+            generate(package)
+
+
+if __name__ == '__main__':
+    main()
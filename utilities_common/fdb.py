@@ -0,0 +1,120 @@
+# ASIC_DB FDB snapshot #
+#
+# fdbshow, nbrshow and fast-reboot-dump all correlate the FDB entries of
+# ASIC_DB with their VLAN and bridge port. FdbSnapshot reads the tables they
+# need once, in batches, and filters FDB entries on their key before reading
+# their attributes.
+
+import json
+
+from utilities_common.bulk_db import hgetall_bulk, scan_keys
+
+FDB_TABLE_PREFIX = 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:'
+VLAN_TABLE_PREFIX = 'ASIC_STATE:SAI_OBJECT_TYPE_VLAN:'
+BRIDGE_PORT_TABLE_PREFIX = 'ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:'
+
+
+class FdbSnapshot(object):
+    """
+        Reads FDB entries and the VLAN and bridge port objects they refer
+        to from ASIC_DB of a SonicV2Connector, which has to be connected to
+        it. The VLAN and bridge port maps are read once and cached.
+    """
+    def __init__(self, db):
+        self.db = db
+        self._bvid_2_vlan_id = None
+        self._bridge_port_attrs = None
+
+    def get_bvid_2_vlan_id(self):
+        """
+            Return a dict of VLAN object oid -> VLAN id string. The VLAN id
+            is None for VLAN objects without one, e.g. the default VLAN.
+        """
+        if self._bvid_2_vlan_id is None:
+            keys = scan_keys(self.db, self.db.ASIC_DB, VLAN_TABLE_PREFIX + 'oid:*')
+            self._bvid_2_vlan_id = {}
+            for key, value in hgetall_bulk(self.db, self.db.ASIC_DB, keys).items():
+                if value:
+                    self._bvid_2_vlan_id[key[len(VLAN_TABLE_PREFIX):]] = value.get('SAI_VLAN_ATTR_VLAN_ID')
+        return self._bvid_2_vlan_id
+
+    def get_vlan_id_2_bvid(self):
+        """
+            Return a dict of VLAN id -> VLAN object oid.
+        """
+        vlan_id_2_bvid = {}
+        for bvid, vlan_id in sorted(self.get_bvid_2_vlan_id().items()):
+            if vlan_id is not None:
+                vlan_id_2_bvid.setdefault(int(vlan_id), bvid)
+        return vlan_id_2_bvid
+
+    def get_vlan_id(self, fdb):
+        """
+            Return the VLAN id string of a decoded FDB entry key, None if
+            the entry has no VLAN id, e.g. it is learned on the default VLAN.
+            Raises KeyError if the entry refers to an unknown VLAN object.
+        """
+        if 'vlan' in fdb:
+            return fdb['vlan']
+        if 'bvid' not in fdb:
+            return None
+        return self.get_bvid_2_vlan_id()[fdb['bvid']]
+
+    def get_bridge_port_map(self, port_type=None):
+        """
+            Return a dict of bridge port oid -> port oid, for the bridge
+            ports of port_type if given.
+        """
+        if self._bridge_port_attrs is None:
+            keys = scan_keys(self.db, self.db.ASIC_DB, BRIDGE_PORT_TABLE_PREFIX + '*')
+            self._bridge_port_attrs = {key[len(BRIDGE_PORT_TABLE_PREFIX):]: value
+                                       for key, value in hgetall_bulk(self.db, self.db.ASIC_DB, keys).items()}
+
+        bridge_port_map = {}
+        for bridge_port_id, value in self._bridge_port_attrs.items():
+            if 'SAI_BRIDGE_PORT_ATTR_PORT_ID' not in value:
+                continue
+            if port_type is not None and value.get('SAI_BRIDGE_PORT_ATTR_TYPE') != port_type:
+                continue
+            bridge_port_map[bridge_port_id] = value['SAI_BRIDGE_PORT_ATTR_PORT_ID']
+        return bridge_port_map
+
+    def get_fdb_keys(self, vlan_ids=None, mac=None):
+        """
+            Return a list of (key, decoded key) of the FDB entries, optionally
+            only the ones learned on one of vlan_ids or for mac (upper case,
+            as stored in ASIC_DB). Filtering needs the entry key only, so it
+            is done before any attribute read.
+        """
+        if vlan_ids is not None:
+            vlan_ids = set(int(vlan_id) for vlan_id in vlan_ids)
+            bvids = set(bvid for bvid, vlan_id in self.get_bvid_2_vlan_id().items()
+                        if vlan_id is not None and int(vlan_id) in vlan_ids)
+        if mac is not None:
+            mac = mac.upper()
+
+        fdb_keys = []
+        for key in scan_keys(self.db, self.db.ASIC_DB, FDB_TABLE_PREFIX + '*'):
+            fdb = json.loads(key[len(FDB_TABLE_PREFIX):])
+            if not fdb:
+                continue
+            if mac is not None and fdb.get('mac') != mac:
+                continue
+            if vlan_ids is not None:
+                if 'vlan' in fdb:
+                    if int(fdb['vlan']) not in vlan_ids:
+                        continue
+                elif fdb.get('bvid') not in bvids:
+                    continue
+            fdb_keys.append((key, fdb))
+        return fdb_keys
+
+    def get_fdb_entries(self, vlan_ids=None, mac=None):
+        """
+            Return a list of (key, decoded key, attributes) of the FDB entries,
+            filtered as in get_fdb_keys(). The attributes are read in batches,
+            entries without attributes are skipped.
+        """
+        fdb_keys = self.get_fdb_keys(vlan_ids, mac)
+        values = hgetall_bulk(self.db, self.db.ASIC_DB, [key for key, _ in fdb_keys])
+        return [(key, fdb, values[key]) for key, fdb in fdb_keys if values[key]]
@@ -1,3 +1,4 @@
+import functools
 import os
 import pkgutil
 import importlib
@@ -16,25 +17,43 @@ class UtilHelper(object):
     def __init__(self):
         pass
 
-    def load_plugins(self, plugins_namespace):
-        """ Discover and load CLI plugins. Yield a plugin module. """
+    def iter_plugins(self, plugins_namespace):
+        """ Discover CLI plugins without importing them. Yield a plugin module name. """
 
         def iter_namespace(ns_pkg):
             return pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + ".")
 
         for _, module_name, ispkg in iter_namespace(plugins_namespace):
             if ispkg:
-                yield from self.load_plugins(importlib.import_module(module_name))
-                continue
-            log.log_debug('importing plugin: {}'.format(module_name))
-            try:
-                module = importlib.import_module(module_name)
-            except Exception as err:
-                log.log_error('failed to import plugin {}: {}'.format(module_name, err),
-                              also_print_to_console=True)
+                yield from self.iter_plugins(importlib.import_module(module_name))
                 continue
+            yield module_name
 
-            yield module
+    def load_plugin(self, module_name):
+        """ Load CLI plugin module_name. Return the plugin module or None on failure. """
+
+        log.log_debug('importing plugin: {}'.format(module_name))
+        try:
+            return importlib.import_module(module_name)
+        except Exception as err:
+            log.log_error('failed to import plugin {}: {}'.format(module_name, err),
+                          also_print_to_console=True)
+            return None
+
+    def load_plugins(self, plugins_namespace):
+        """ Discover and load CLI plugins. Yield a plugin module. """
+
+        for module_name in self.iter_plugins(plugins_namespace):
+            module = self.load_plugin(module_name)
+            if module is not None:
+                yield module
+
+    def load_and_register_plugin(self, module_name, root_command):
+        """ Load CLI plugin module_name and register it in top-level command root_command. """
+
+        module = self.load_plugin(module_name)
+        if module is not None:
+            self.register_plugin(module, root_command)
 
     def register_plugin(self, plugin, root_command):
         """ Register plugin in top-level command root_command. """
@@ -88,4 +107,20 @@ class UtilHelper(object):
         """ Load plugins and register them """
 
         for plugin in self.load_plugins(plugins):
-            self.register_plugin(plugin, cli)
\ No newline at end of file
+            self.register_plugin(plugin, cli)
+
+    def load_and_register_plugins_lazily(self, plugins, cli, index):
+        """ Register plugins in cli, a utilities_common.cli.LazyGroup.
+
+        Plugins of index, a dict of plugin module name -> names of the
+        top-level commands it provides or extends, are loaded when one of
+        those commands is used. The others, e.g. plugins installed with
+        packages, are loaded and registered right away.
+        """
+
+        for module_name in self.iter_plugins(plugins):
+            if module_name in index:
+                cli.add_lazy_plugin(index[module_name],
+                                    functools.partial(self.load_and_register_plugin, module_name, cli))
+            else:
+                self.load_and_register_plugin(module_name, cli)
\ No newline at end of file